@@ -0,0 +1,101 @@
+"""Benchmark the TDMS to summary pipeline on synthetic recordings.
+
+Run from the workspace root with ``python -m benchmarks 1000000 10000000``; the results are
+written to ``benchmarks/results/<commit>.json`` unless ``--output`` is given, and compared with
+an earlier run with ``--compare``. The import time of every CLI entry point is measured as well,
+since short invocations are dominated by it.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import BLogger
+from pytools.logging.trait import LogLevel
+from pytools.result import Err, Ok
+from taad_smc.trace.api import StageTracer
+
+from ._argparse import parser_cmdline_args
+from ._imports import log_import_times, measure_import_times
+from ._pipeline import create_specimen, run_pipeline
+from ._report import compare_results, create_report, log_stages, write_report
+from ._types import BenchmarkOptions
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pytools.logging.trait import ILogger
+    from taad_smc.trace.api import Span
+
+    from ._argparse import ParsedArguments
+
+
+def parser_optional_args(args: ParsedArguments) -> BenchmarkOptions:
+    return BenchmarkOptions(
+        rate=args.rate,
+        strain=args.strain,
+        hold=args.hold,
+        noise=args.noise,
+        seed=args.seed,
+        window=args.smoothing_window,
+        repeat=args.smoothing_repeat,
+        refine=args.refine,
+        filter_window=args.filter_window,
+        dtype=args.dtype,
+        summary=not args.no_summary,
+        log=LogLevel[args.log],
+    )
+
+
+def main(
+    home: Path, samples: int, opts: BenchmarkOptions, *, log: ILogger
+) -> Ok[Sequence[Span]] | Err:
+    log.brief(f"Benchmarking a recording of about {samples} samples in {home}")
+    tracer = StageTracer(log=log)
+    match create_specimen(home, samples, opts=opts, log=log):
+        case Ok(file):
+            pass
+        case Err(e):
+            return Err(e)
+    match run_pipeline(file, opts=opts, tracer=tracer, log=log):
+        case Ok(n):
+            log_stages(tracer.spans, log=log)
+            log.brief(f"Processed {n} samples in {sum(s.wall for s in tracer.spans):.3f} s")
+            return Ok(tracer.spans)
+        case Err(e):
+            return Err(e)
+
+
+if __name__ == "__main__":
+    args = parser_cmdline_args()
+    opts = parser_optional_args(args)
+    logger = BLogger(args.log)
+    runs: dict[int, Sequence[Span]] = {}
+    for samples in args.samples:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(args.workdir or tmp) / f"specimen_{samples}"
+            match main(root, samples, opts, log=logger):
+                case Ok(stages):
+                    runs[samples] = stages
+                case Err(e):
+                    logger.error(f"Benchmark of {samples} samples failed: {e}")
+                    sys.exit(1)
+    imports: Mapping[str, float] = {}
+    if args.import_repeat > 0:
+        match measure_import_times(repeat=args.import_repeat):
+            case Ok(imports):
+                log_import_times(imports, log=logger)
+            case Err(e):
+                logger.error(f"Import time measurement failed: {e}")
+                sys.exit(1)
+    report = create_report(runs, imports, opts=opts)
+    fout = write_report(report, Path(args.output) if args.output else None)
+    logger.brief(f"Results written to {fout}")
+    if args.compare:
+        match compare_results(report, Path(args.compare), tolerance=args.tolerance, log=logger):
+            case Ok():
+                logger.brief("No regressions found.")
+            case Err(e):
+                logger.error(str(e))
+                sys.exit(1)
@@ -0,0 +1,94 @@
+import argparse
+import dataclasses as dc
+from typing import get_args
+
+from pytools.logging.trait import LOG_LEVEL
+from taad_smc.io.types import FLOAT_DTYPES
+from taad_smc.segment.trait import REFINEMENT_METHODS
+
+__all__ = ["parser_cmdline_args"]
+
+_parser = argparse.ArgumentParser(
+    description="Time every stage of the TDMS to summary pipeline on synthetic recordings.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_parser.add_argument(
+    "samples", type=int, nargs="*", help="Approximate number of samples of each recording."
+)
+_parser.add_argument("--rate", type=float, help="DAQ rate of the synthetic recordings.")
+_parser.add_argument("--strain", type=float, help="Maximum strain of the protocol.")
+_parser.add_argument("--hold", type=float, help="Seconds spent in every hold.")
+_parser.add_argument("--noise", type=float, help="Noise relative to the range of each channel.")
+_parser.add_argument("--seed", type=int, help="Seed of the noise generator.")
+_parser.add_argument("--smoothing-window", type=float, help="Width of the Gaussian filter.")
+_parser.add_argument("--smoothing-repeat", type=int, help="Number of smoothing passes.")
+_parser.add_argument(
+    "--refine", type=str.lower, choices=get_args(REFINEMENT_METHODS), help="Refinement method."
+)
+_parser.add_argument("--filter-window", type=float, help="Window of the final filter.")
+_parser.add_argument(
+    "--dtype", type=str.lower, choices=get_args(FLOAT_DTYPES), help="Working dtype."
+)
+_parser.add_argument("--no-summary", action="store_true", help="Skip the summary figure.")
+_parser.add_argument(
+    "--import-repeat",
+    type=int,
+    help="Imports of each CLI entry point timed with -X importtime, the best is kept; 0 skips.",
+)
+_parser.add_argument("--workdir", type=str, help="Keep the generated files in this folder.")
+_parser.add_argument("--output", type=str, help="JSON file the results are written to.")
+_parser.add_argument("--compare", type=str, help="Earlier JSON results to compare against.")
+_parser.add_argument("--tolerance", type=float, help="Relative slowdown reported as a regression.")
+_parser.add_argument(
+    "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set log level."
+)
+
+
+@dc.dataclass(slots=True)
+class ParsedArguments:
+    samples: list[int]
+    rate: float
+    strain: float
+    hold: float
+    noise: float
+    seed: int
+    smoothing_window: float
+    smoothing_repeat: int
+    refine: REFINEMENT_METHODS
+    filter_window: float
+    dtype: FLOAT_DTYPES
+    no_summary: bool
+    import_repeat: int
+    workdir: str | None
+    output: str | None
+    compare: str | None
+    tolerance: float
+    log: LOG_LEVEL
+
+
+def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
+    parsed = _parser.parse_args(
+        args,
+        namespace=ParsedArguments(
+            [],
+            rate=5000,
+            strain=0.3,
+            hold=2.0,
+            noise=0.01,
+            seed=0,
+            smoothing_window=50,
+            smoothing_repeat=3,
+            refine="sweep",
+            filter_window=101,
+            dtype="float64",
+            no_summary=False,
+            import_repeat=5,
+            workdir=None,
+            output=None,
+            compare=None,
+            tolerance=0.2,
+            log="INFO",
+        ),
+    )
+    parsed.samples = parsed.samples or [1_000_000]
+    return parsed
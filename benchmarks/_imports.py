@@ -0,0 +1,68 @@
+# Copyright (c) 2025 Will Zhang
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pytools.logging.trait import ILogger
+
+__all__ = ["ENTRY_POINTS", "log_import_times", "measure_import_times"]
+
+ENTRY_POINTS: Sequence[str] = (
+    "taad_smc.tdms.__main__",
+    "taad_smc.prep.__main__",
+    "taad_smc.pwlsplit.__main__",
+    "taad_smc.segment.__main__",
+    "taad_smc.stream.__main__",
+    "taad_smc.filter.__main__",
+    "taad_smc.plot.__main__",
+    "taad_smc.summary.__main__",
+    "taad_smc.pipeline.__main__",
+)
+
+
+def _cumulative_import_time(module: str) -> Ok[float] | Err:
+    """Return the seconds ``import module`` takes in a fresh interpreter."""
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    lines = res.stderr.splitlines()
+    if res.returncode != 0:
+        error = "\n".join(line for line in lines if not line.startswith("import time:"))
+        return Err(ImportError(f"Failed to import {module}:\n{error}"))
+    # Lines read ``import time: <self us> | <cumulative us> | <indented module name>``.
+    for line in reversed(lines):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return Ok(int(fields[1]) * 1e-6)
+    return Err(LookupError(f"No import time reported for {module}"))
+
+
+def measure_import_times(
+    modules: Sequence[str] = ENTRY_POINTS, *, repeat: int = 5
+) -> Ok[Mapping[str, float]] | Err:
+    """Return the best of `repeat` cumulative import times of each module, in seconds."""
+    times: dict[str, float] = {}
+    for module in modules:
+        best = float("inf")
+        for _ in range(repeat):
+            match _cumulative_import_time(module):
+                case Ok(t):
+                    best = min(best, t)
+                case Err(e):
+                    return Err(e)
+        times[module] = best
+    return Ok(times)
+
+
+def log_import_times(times: Mapping[str, float], *, log: ILogger) -> None:
+    log.brief(f"{'entry point':<28}{'import [ms]':>12}")
+    for module, t in times.items():
+        log.brief(f"{module.removesuffix('.__main__'):<28}{t * 1e3:>12.1f}")
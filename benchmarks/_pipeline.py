@@ -0,0 +1,159 @@
+# Copyright (c) 2025 Will Zhang
+import json
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+from taad_smc.filter._filtering import filter_curves
+from taad_smc.filter._tools import find_split_points
+from taad_smc.io.api import FLOAT_TYPES, cycle_tensor
+from taad_smc.prep.api import PROTOCOL_GENERATORS
+from taad_smc.pwlsplit._io import import_data
+from taad_smc.pwlsplit._loops import segmentation_loop
+from taad_smc.pwlsplit._names import create_names
+from taad_smc.pwlsplit._tools import (
+    compile_taadsmc_curves,
+    compile_taadsmc_table,
+    construct_segmented_recording,
+    filter_derivative,
+)
+from taad_smc.segment.api import dp_index
+from taad_smc.summary.__main__ import main as summarize
+from taad_smc.tdms.api import export_tdms
+
+from pwlsplit.curve.peaks import construct_initial_segmentation
+from pwlsplit.segment.refine import opt_index
+
+from .fixtures._tree import folder_name, write_protocol_folder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.types import PROTOCOL_NAMES, SpecimenInfo
+    from taad_smc.trace.api import StageTracer
+
+    from ._types import BenchmarkOptions
+
+__all__ = ["create_specimen", "run_pipeline"]
+
+# The summary reads every one of these folders; they all receive the processed recording.
+_SUMMARY_FOLDERS: tuple[PROTOCOL_NAMES, ...] = (
+    "activated",
+    "activation",
+    "deactivated",
+    "deactivation",
+)
+# Every recording of the cycling protocol is checked to resample into a cycle tensor.
+_CYCLED_PROTOCOL = "Preconditioning"
+
+
+def _specimen_info(opts: BenchmarkOptions) -> SpecimenInfo:
+    return {
+        "date": "2025-01-01",
+        "species": "Pig",
+        "axis": "Circ",
+        "strain": opts.strain,
+        "input_length_mm": 10.0,
+        "actual_length_mm": 10.0,
+        "details": "Synthetic benchmark recording.",
+    }
+
+
+def create_specimen(
+    home: Path, samples: int, *, opts: BenchmarkOptions, log: ILogger = NLOGGER
+) -> Ok[Path] | Err:
+    """Write a synthetic ``initial_1`` recording of about `samples` points under `home`."""
+    info = _specimen_info(opts)
+    home.mkdir(parents=True, exist_ok=True)
+    with (home / "key.json").open("w") as f:
+        json.dump(info, f, indent=4)
+    match write_protocol_folder(
+        home / folder_name("initial"),
+        PROTOCOL_GENERATORS["initial"](opts.strain),
+        info=info,
+        samples=samples,
+        rate=opts.rate,
+        hold=opts.hold,
+        noise=opts.noise,
+        seed=opts.seed,
+    ):
+        case Ok(file):
+            log.info(f"Created {file}")
+            return Ok(file)
+        case Err(e):
+            return Err(e)
+
+
+def run_pipeline(
+    file: Path, *, opts: BenchmarkOptions, tracer: StageTracer, log: ILogger = NLOGGER
+) -> Ok[int] | Err:
+    """Run every stage on `file` and return the number of samples processed."""
+    names = create_names(file).unwrap()
+    with tracer.stage("tdms_read") as span:
+        match import_data(names, dtype=FLOAT_TYPES[opts.dtype], log=log):
+            case Ok((data, protocol, info)):
+                span.samples = n = len(data.time)
+            case Err(e):
+                return Err(e)
+    with tracer.stage("tdms_export", n):
+        export_tdms(data, prefix=file)
+    with tracer.stage("filter_derivative", n):
+        prepped = filter_derivative(data.disp, window=opts.window, repeat=opts.repeat)
+    with tracer.stage("segmentation", n):
+        protocol_map, curves = compile_taadsmc_curves(protocol).unwrap()
+        compiled = compile_taadsmc_table(protocol_map, sample_rate=round(data.meta.daq_rate))
+        match construct_initial_segmentation(curves):
+            case Ok(segmentation):
+                pass
+            case Err(e):
+                return Err(e)
+        match segmentation_loop(compiled, segmentation, prepped, log=log):
+            case Ok(segmentation):
+                pass
+            case Err(e):
+                return Err(e)
+    with tracer.stage("refine", n):
+        match opts.refine:
+            case "sweep":
+                segmentation.idx = opt_index(
+                    prepped.x, segmentation.idx, window=int(opts.window), max_iter=100, log=log
+                )
+            case "dp":
+                segmentation.idx = dp_index(
+                    prepped.x, segmentation.idx, windows=int(opts.window), log=log
+                )
+    with tracer.stage("postprocess", n):
+        recording = construct_segmented_recording(data, info, compiled, segmentation)
+        df = recording.to_df()
+    with tracer.stage("cycle_tensor", n):
+        match cycle_tensor({file.stem: recording}, _CYCLED_PROTOCOL):
+            case Ok(_):
+                pass
+            case Err(e):
+                return Err(e)
+    with tracer.stage("filter_curves", n):
+        split_points = find_split_points(df, ["protocol", "cycle", "mode"])
+        match filter_curves(
+            df,
+            cols=["force", "disp"],
+            index=split_points,
+            method="gaussian",
+            window=opts.filter_window,
+            dtype=FLOAT_TYPES[opts.dtype],
+        ):
+            case Ok(filtered):
+                pass
+            case Err(e):
+                return Err(e)
+    if not opts.summary:
+        return Ok(n)
+    home = names.parent.parent
+    filtered.to_csv(names.parent / "filtered.tsv", sep="\t", index=False)
+    for p in _SUMMARY_FOLDERS:
+        (folder := home / f"{p}_1").mkdir(exist_ok=True)
+        (folder / "filtered.tsv").unlink(missing_ok=True)
+        (folder / "filtered.tsv").hardlink_to(names.parent / "filtered.tsv")
+    with tracer.stage("summary", n * (len(_SUMMARY_FOLDERS) + 1)):
+        summarize(home, log=log)
+    return Ok(n)
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+import datetime
+import json
+import platform
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pytools.logging.trait import ILogger
+    from taad_smc.trace.api import Span
+
+    from ._types import BenchmarkOptions
+
+__all__ = ["compare_results", "create_report", "log_stages", "write_report"]
+
+
+def _git_commit() -> str:
+    try:
+        res = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except OSError, subprocess.CalledProcessError:
+        return "unknown"
+    return res.stdout.strip()
+
+
+def _stage_dict(stage: Span) -> dict[str, Any]:
+    return {**dc.asdict(stage), "throughput": stage.throughput}
+
+
+def create_report(
+    runs: Mapping[int, Sequence[Span]],
+    imports: Mapping[str, float],
+    *,
+    opts: BenchmarkOptions,
+) -> dict[str, Any]:
+    """Return the JSON document of a benchmark session.
+
+    Runs are keyed by the requested size, import times in seconds by entry point.
+    """
+    return {
+        "commit": _git_commit(),
+        "date": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "options": {k: v for k, v in dc.asdict(opts).items() if k != "log"},
+        "runs": {str(k): [_stage_dict(s) for s in stages] for k, stages in runs.items()},
+        "imports": dict(imports),
+    }
+
+
+def write_report(report: Mapping[str, Any], fout: Path | None) -> Path:
+    if fout is None:
+        fout = Path(__file__).parent / "results" / f"{report['commit']}.json"
+    fout.parent.mkdir(parents=True, exist_ok=True)
+    with fout.open("w") as f:
+        json.dump(report, f, indent=4)
+    return fout
+
+
+def log_stages(stages: Sequence[Span], *, log: ILogger) -> None:
+    log.brief(f"{'stage':<18}{'wall [s]':>10}{'cpu [s]':>10}{'MS/s':>10}{'peak RSS [MiB]':>16}")
+    for s in stages:
+        log.brief(
+            f"{s.name:<18}{s.wall:>10.3f}{s.cpu:>10.3f}"
+            f"{s.throughput / 1e6:>10.2f}{s.peak_rss / 2**20:>16.0f}"
+        )
+
+
+def compare_results(
+    report: Mapping[str, Any], baseline: Path, *, tolerance: float, log: ILogger
+) -> Ok[None] | Err:
+    """Compare the wall time of every stage with `baseline` and fail on regressions.
+
+    Only runs of the same requested size are compared. Import times of the entry points are
+    compared the same way.
+    """
+    if not baseline.exists():
+        return Err(FileNotFoundError(f"Baseline {baseline} does not exist."))
+    with baseline.open("r") as f:
+        reference: dict[str, Any] = json.load(f)
+    log.brief(f"Comparing with commit {reference.get('commit')} from {baseline}")
+    regressions: list[str] = []
+    for size, stages in report["runs"].items():
+        old = {s["name"]: s for s in reference.get("runs", {}).get(size, [])}
+        for s in stages:
+            if (o := old.get(s["name"])) is None or o["wall"] <= 0:
+                continue
+            ratio = s["wall"] / o["wall"]
+            log.info(f"{size:>10} {s['name']:<18} {o['wall']:>9.3f} -> {s['wall']:>9.3f} s")
+            if ratio > 1 + tolerance:
+                regressions.append(f"{s['name']} at {size} samples is {ratio:.2f}x slower")
+    old_imports: dict[str, float] = reference.get("imports", {})
+    for module, t in report.get("imports", {}).items():
+        if (o := old_imports.get(module)) is None or o <= 0:
+            continue
+        log.info(f"{'import':>10} {module:<28} {o * 1e3:>9.1f} -> {t * 1e3:>9.1f} ms")
+        if (ratio := t / o) > 1 + tolerance:
+            regressions.append(f"importing {module} is {ratio:.2f}x slower")
+    if regressions:
+        return Err(RuntimeError("Regressions found:\n  " + "\n  ".join(regressions)))
+    return Ok(None)
@@ -0,0 +1,194 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false, reportMissingTypeStubs=false
+from math import ceil
+from typing import TYPE_CHECKING
+
+import numpy as np
+from nptdms import ChannelObject, GroupObject, RootObject, TdmsWriter
+from pytools.result import Err, Ok
+from taad_smc.experiment._cyclicloading_protocol import cyclic_loading_protocol
+from taad_smc.experiment._relaxation_protocol import relaxation_protocol
+from taad_smc.io.api import construct_protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+    from taad_smc.io.types import SpecimenInfo, TestProtocol
+
+    from pwlsplit.trait import SegmentDict
+
+__all__ = [
+    "scale_protocol",
+    "synthesize_force",
+    "synthesize_recording",
+    "synthesize_strain",
+    "write_tdms",
+]
+
+
+def _segment_strain(segments: Sequence[SegmentDict], *, rate: float, hold: float) -> A1[np.float64]:
+    """Return the strain of a piecewise linear curve, without its first sample."""
+    duration = [s.get("time", hold if s["curve"] == "HOLD" else 0.0) for s in segments]
+    time = np.concatenate(([0.0], np.cumsum(duration)))
+    strain = np.concatenate(([0.0], np.cumsum([s.get("delta", 0.0) for s in segments])))
+    return np.interp(np.arange(1, ceil(time[-1] * rate) + 1) / rate, time, strain)
+
+
+def _test_strain(test: TestProtocol, *, rate: float, hold: float) -> Ok[A1[np.float64]] | Err:
+    dt = 1.0 / rate
+    match test["type"]:
+        case "Hold":
+            return Ok(np.zeros(ceil(hold * rate), dtype=np.float64))
+        case "Sawtooth":
+            curve = cyclic_loading_protocol(
+                test.get("max_strain", 0.0),
+                2 * test.get("duration", 0.0),
+                test.get("repeat", 1),
+                dt,
+            )
+            return Ok(curve.strain[1:])
+        case "Trapazoid":
+            curve = relaxation_protocol(
+                test.get("max_strain", 0.0),
+                2 * test.get("loading", 0.0),
+                hold,
+                dt,
+                unloading_period=2 * test.get("unloading", 0.0),
+            )
+            # Every cycle returns to zero strain, so the repeats follow each other directly.
+            return Ok(np.tile(curve.strain[1:], test.get("repeat", 1)))
+        case _:
+            pass
+    match construct_protocol(test):
+        case Ok(cycles):
+            hold = test.get("duration", hold)
+            return Ok(
+                np.concatenate([_segment_strain(c, rate=rate, hold=hold) for c in cycles.values()])
+            )
+        case Err(e):
+            return Err(e)
+
+
+def scale_protocol(
+    protocol: Mapping[str, TestProtocol], samples: int, *, rate: float, hold: float
+) -> Ok[Mapping[str, TestProtocol]] | Err:
+    """Multiply the repeats of every sawtooth so the recording has about `samples` points.
+
+    The protocol is never shortened, so it is returned unchanged when one pass of it is already
+    longer than `samples` or when it has no sawtooth.
+    """
+    fixed, cycles = 0, 0.0
+    for test in protocol.values():
+        if test["type"] == "Sawtooth":
+            cycles += 2 * test.get("duration", 0.0) * test.get("repeat", 1) * rate
+            continue
+        match _test_strain(test, rate=rate, hold=hold):
+            case Ok(strain):
+                fixed += len(strain)
+            case Err(e):
+                return Err(e)
+    factor = max(1, round((samples - fixed) / cycles)) if cycles else 1
+    return Ok(
+        {
+            k: {**test, "repeat": factor * test.get("repeat", 1)}
+            if test["type"] == "Sawtooth"
+            else test
+            for k, test in protocol.items()
+        }
+    )
+
+
+def synthesize_strain(
+    protocol: Mapping[str, TestProtocol], *, rate: float, hold: float
+) -> Ok[A1[np.float64]] | Err:
+    """Return the strain applied by `protocol`, sampled at `rate`.
+
+    Sawtooth and trapezoid tests are generated with the experiment protocols, the other tests
+    from their segments. Holds, including the plateau of a trapezoid, last `hold` seconds.
+    """
+    parts: list[A1[np.float64]] = [np.zeros(1, dtype=np.float64)]
+    for name, test in protocol.items():
+        match _test_strain(test, rate=rate, hold=hold):
+            case Ok(strain):
+                parts.append(strain)
+            case Err(e):
+                return Err(ValueError(f"Failed to synthesize test {name}: {e}"))
+    return Ok(np.concatenate(parts))
+
+
+def synthesize_force(
+    strain: A1[np.float64],
+    *,
+    rate: float,
+    stiffness: float = 5.0,
+    exponent: float = 8.0,
+    viscosity: float = 0.2,
+) -> A1[np.float64]:
+    """Return a viscoelastic force response with an exponential elastic part."""
+    elastic = stiffness * np.expm1(exponent * np.clip(strain, 0.0, None))
+    return elastic + viscosity * np.gradient(strain) * rate
+
+
+def synthesize_recording(
+    strain: A1[np.float64],
+    *,
+    rate: float,
+    info: SpecimenInfo,
+    noise: float = 0.01,
+    drift: float = 0.0,
+    seed: int | None = None,
+) -> tuple[A1[np.float64], A1[np.float64]]:
+    """Return the position and force channels of a recording of `strain`.
+
+    Gaussian noise with standard deviation `noise`, relative to the range of each channel, is
+    added to both. The force baseline drifts linearly by `drift` times its range over the
+    recording. The position is offset the way `construct_postprocessed_df` expects.
+    """
+    rng = np.random.default_rng(seed)
+    force = synthesize_force(strain, rate=rate)
+    force_range = np.ptp(force)
+    disp = strain * info["actual_length_mm"] / info["input_length_mm"] - 0.5 * info["strain"]
+    disp += rng.normal(0.0, noise * np.ptp(disp), len(disp))
+    force += rng.normal(0.0, noise * force_range, len(force))
+    force += np.linspace(0.0, drift * force_range, len(force))
+    return disp, force
+
+
+def write_tdms(
+    file: Path,
+    disp: A1[np.float64],
+    force: A1[np.float64],
+    *,
+    rate: float,
+    info: SpecimenInfo,
+) -> None:
+    """Write a recording with the channels and properties read by `import_tdms_data`."""
+    root = RootObject(
+        properties={
+            "name": file.stem,
+            "File Version": 1,
+            "Data Channels": 2,
+            "Fiber Length": float(info["input_length_mm"]),
+            "Force": float(force[0]),
+            "Command": 0.0,
+            "Position": float(disp[0]),
+            "Comments": info["details"],
+            "DAQ Rate": float(rate),
+            "Analog Output Rate": float(rate),
+            "Terminal Config": 10106,
+            "Force Voltage Range": 10.0,
+            "Position Voltage Range": 10.0,
+        }
+    )
+    group = GroupObject("Data")
+    with TdmsWriter(str(file), index_file=True) as writer:
+        writer.write_segment(
+            [
+                root,
+                group,
+                ChannelObject("Data", "Force", force),
+                ChannelObject("Data", "Position", disp),
+            ]
+        )
@@ -0,0 +1,23 @@
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pytools.logging.trait import LogLevel
+    from taad_smc.io.types import FLOAT_DTYPES
+    from taad_smc.segment.trait import REFINEMENT_METHODS
+
+
+@dc.dataclass(slots=True)
+class BenchmarkOptions:
+    rate: float
+    strain: float
+    hold: float
+    noise: float
+    seed: int
+    window: float
+    repeat: int
+    refine: REFINEMENT_METHODS
+    filter_window: float
+    dtype: FLOAT_DTYPES
+    summary: bool
+    log: LogLevel
@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import BLogger
+from pytools.logging.trait import LogLevel
+from pytools.result import Err, Ok
+
+from ._argparse import parser_cmdline_args
+from ._tree import write_specimen_tree
+from ._types import FixtureOptions
+
+if TYPE_CHECKING:
+    from taad_smc.io.types import SpecimenInfo
+
+    from ._argparse import ParsedArguments
+
+
+def parser_optional_args(args: ParsedArguments) -> FixtureOptions:
+    info: SpecimenInfo = {
+        "date": "2025-01-01",
+        "species": "Pig",
+        "axis": "Circ",
+        "strain": args.strain,
+        "input_length_mm": args.length,
+        "actual_length_mm": args.length,
+        "details": "Synthetic recording.",
+    }
+    return FixtureOptions(
+        folders=dict.fromkeys(args.protocols, args.iterations),
+        info=info,
+        duration=args.duration,
+        rate=args.rate,
+        hold=args.hold,
+        noise=args.noise,
+        drift=args.drift,
+        seed=args.seed,
+        overwrite=args.overwrite,
+        log=LogLevel[args.log],
+    )
+
+
+if __name__ == "__main__":
+    args = parser_cmdline_args()
+    opts = parser_optional_args(args)
+    logger = BLogger(args.log)
+    match write_specimen_tree(Path(args.home), opts, log=logger):
+        case Ok(files):
+            logger.brief(f"Wrote {len(files)} recordings to {args.home}")
+        case Err(e):
+            logger.error(f"Failed to write the fixtures: {e}")
+            sys.exit(1)
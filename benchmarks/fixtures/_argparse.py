@@ -0,0 +1,74 @@
+import argparse
+import dataclasses as dc
+from typing import get_args
+
+from pytools.logging.trait import LOG_LEVEL
+from taad_smc.io.types import PROTOCOL_NAMES
+
+__all__ = ["parser_cmdline_args"]
+
+_parser = argparse.ArgumentParser(
+    description="Write a specimen folder of synthetic TDMS recordings.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_parser.add_argument("home", type=str, help="Specimen folder to create.")
+_parser.add_argument(
+    "--protocols",
+    type=str.lower,
+    nargs="+",
+    choices=get_args(PROTOCOL_NAMES),
+    help="Protocol folders to create; all of them by default.",
+)
+_parser.add_argument("--iterations", type=int, help="Number of folders of each numbered protocol.")
+_parser.add_argument("--duration", type=float, help="Approximate length of every recording [s].")
+_parser.add_argument("--rate", type=float, help="DAQ rate of the recordings.")
+_parser.add_argument("--strain", type=float, help="Maximum strain of the protocols.")
+_parser.add_argument("--hold", type=float, help="Seconds spent in every hold.")
+_parser.add_argument("--noise", type=float, help="Noise relative to the range of each channel.")
+_parser.add_argument(
+    "--drift", type=float, help="Force drift over a recording, relative to its range."
+)
+_parser.add_argument("--seed", type=int, help="Seed of the noise generator.")
+_parser.add_argument("--length", type=float, help="Specimen length [mm].")
+_parser.add_argument("--overwrite", action="store_true", help="Overwrite existing recordings.")
+_parser.add_argument(
+    "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set log level."
+)
+
+
+@dc.dataclass(slots=True)
+class ParsedArguments:
+    home: str
+    protocols: list[PROTOCOL_NAMES]
+    iterations: int
+    duration: float
+    rate: float
+    strain: float
+    hold: float
+    noise: float
+    drift: float
+    seed: int
+    length: float
+    overwrite: bool
+    log: LOG_LEVEL
+
+
+def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
+    return _parser.parse_args(
+        args,
+        namespace=ParsedArguments(
+            "",
+            protocols=list(get_args(PROTOCOL_NAMES)),
+            iterations=1,
+            duration=300.0,
+            rate=5000,
+            strain=0.3,
+            hold=2.0,
+            noise=0.01,
+            drift=0.0,
+            seed=0,
+            length=10.0,
+            overwrite=False,
+            log="INFO",
+        ),
+    )
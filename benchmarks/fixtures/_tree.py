@@ -0,0 +1,110 @@
+# Copyright (c) 2025 Will Zhang
+import json
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+from taad_smc.io.types import PROTOCOLS
+from taad_smc.prep.api import PROTOCOL_GENERATORS
+
+from .._synthetic import scale_protocol, synthesize_recording, synthesize_strain, write_tdms
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.types import PROTOCOL_NAMES, SpecimenInfo, TestProtocol
+
+    from ._types import FixtureOptions
+
+__all__ = ["folder_name", "write_protocol_folder", "write_specimen_tree"]
+
+
+def _is_numbered(name: PROTOCOL_NAMES) -> bool:
+    return "(?P<it>" in PROTOCOLS[name].pattern
+
+
+def folder_name(name: PROTOCOL_NAMES, it: int = 1) -> str:
+    """Return the folder `find_data_subdirectories` recognises as iteration `it` of `name`."""
+    return f"{name}_{it}" if _is_numbered(name) else name
+
+
+def write_protocol_folder(
+    folder: Path,
+    protocol: Mapping[str, TestProtocol],
+    *,
+    info: SpecimenInfo,
+    samples: int,
+    rate: float,
+    hold: float,
+    noise: float = 0.01,
+    drift: float = 0.0,
+    seed: int | None = None,
+) -> Ok[Path] | Err:
+    """Write ``<folder>/<folder>.tdms`` with its ``protocol.json`` and ``key.json``.
+
+    Sawtooth repeats are multiplied until the recording has about `samples` points; a protocol
+    made only of holds spreads them over `samples` instead.
+    """
+    if all(test["type"] == "Hold" for test in protocol.values()):
+        hold = max(hold, samples / rate / len(protocol))
+    match scale_protocol(protocol, samples, rate=rate, hold=hold):
+        case Ok(protocol):
+            pass
+        case Err(e):
+            return Err(e)
+    match synthesize_strain(protocol, rate=rate, hold=hold):
+        case Ok(strain):
+            pass
+        case Err(e):
+            return Err(e)
+    disp, force = synthesize_recording(
+        strain, rate=rate, info=info, noise=noise, drift=drift, seed=seed
+    )
+    folder.mkdir(parents=True, exist_ok=True)
+    with (folder / "key.json").open("w") as f:
+        json.dump(info, f, indent=4)
+    with (folder / "protocol.json").open("w") as f:
+        json.dump(protocol, f, indent=4)
+    file = folder / f"{folder.name}.tdms"
+    write_tdms(file, disp, force, rate=rate, info=info)
+    return Ok(file)
+
+
+def write_specimen_tree(
+    home: Path, opts: FixtureOptions, *, log: ILogger = NLOGGER
+) -> Ok[Sequence[Path]] | Err:
+    """Write a specimen folder with a synthetic recording for every requested protocol."""
+    home.mkdir(parents=True, exist_ok=True)
+    with (home / "key.json").open("w") as f:
+        json.dump(opts.info, f, indent=4)
+    files: list[Path] = []
+    folders = [
+        (name, it)
+        for name, n in opts.folders.items()
+        for it in range(1, (n if _is_numbered(name) else 1) + 1)
+    ]
+    for k, (name, it) in enumerate(folders):
+        protocol = PROTOCOL_GENERATORS[name](opts.info["strain"])
+        folder = home / folder_name(name, it)
+        if (folder / f"{folder.name}.tdms").exists() and not opts.overwrite:
+            log.info(f"{folder} already exists, skipping...")
+            continue
+        match write_protocol_folder(
+            folder,
+            protocol,
+            info=opts.info,
+            samples=round(opts.duration * opts.rate),
+            rate=opts.rate,
+            hold=opts.hold,
+            noise=opts.noise,
+            drift=opts.drift,
+            seed=opts.seed + k,
+        ):
+            case Ok(file):
+                log.info(f"Created {file}")
+                files.append(file)
+            case Err(e):
+                return Err(e)
+    return Ok(files)
@@ -0,0 +1,22 @@
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytools.logging.trait import LogLevel
+    from taad_smc.io.types import PROTOCOL_NAMES, SpecimenInfo
+
+
+@dc.dataclass(slots=True)
+class FixtureOptions:
+    folders: Mapping[PROTOCOL_NAMES, int]
+    info: SpecimenInfo
+    duration: float
+    rate: float
+    hold: float
+    noise: float
+    drift: float
+    seed: int
+    overwrite: bool
+    log: LogLevel
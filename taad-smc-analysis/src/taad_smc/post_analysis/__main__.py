@@ -0,0 +1,125 @@
+"""Fit material models to the processed recordings of a cohort.
+
+All curves of a cohort are stacked into one batched least-squares problem, so a cohort costs
+a handful of vectorized iterations rather than one optimizer run per curve. The specimens come
+from the cohort catalog, see ``python -m taad_smc.catalog``.
+"""
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from pytools.logging.api import BLogger
+from pytools.result import Err, Ok
+
+from ._argparse import parser_cmdline_args
+from ._types import HyperelasticOptions, RelaxationOptions
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytools.logging.trait import ILogger
+
+    from ._argparse import ParsedArguments
+    from ._types import HYPERELASTIC_MODELS, RELAXATION_MODELS, ModelFit
+
+
+def relaxation_options(args: ParsedArguments) -> RelaxationOptions:
+    return RelaxationOptions(
+        model=cast("RELAXATION_MODELS", args.model),
+        terms=max(1, args.terms),
+        points=max(8, args.points),
+        starts=max(1, args.starts),
+        max_iter=max(1, args.max_iter),
+        workers=max(1, args.workers),
+    )
+
+
+def hyperelastic_options(args: ParsedArguments) -> HyperelasticOptions:
+    return HyperelasticOptions(
+        model=cast("HYPERELASTIC_MODELS", args.model),
+        points=max(8, args.points),
+        starts=max(1, args.starts),
+        max_iter=max(1, args.max_iter),
+        workers=max(1, args.workers),
+    )
+
+
+def _specimens(cohort: Path, *, log: ILogger) -> Ok[Sequence[Path]] | Err:
+    from taad_smc.catalog.api import open_catalog
+
+    match open_catalog(cohort, log=log):
+        case Ok(catalog):
+            return Ok(catalog.specimen_paths())
+        case Err(e):
+            return Err(e)
+
+
+def relaxation(
+    cohort: Path, opts: RelaxationOptions, fout: str, *, log: ILogger
+) -> Ok[ModelFit] | Err:
+    # scipy, pandas and nptdms are only loaded once a cohort is fitted.
+    from ._io import export_fit
+    from ._relaxation import collect_relaxation_holds, fit_relaxation
+
+    match _specimens(cohort, log=log):
+        case Ok(specimens):
+            pass
+        case Err(e):
+            return Err(e)
+    match collect_relaxation_holds(specimens, points=opts.points, log=log):
+        case Ok(data):
+            log.info(f"Fitting {len(data)} relaxation holds of {len(specimens)} specimens")
+        case Err(e):
+            return Err(e)
+    fit = fit_relaxation(data, opts)
+    log.brief(f"{fit.converged.sum()} of {len(data)} fits converged")
+    log.brief(f"Parameters written to {export_fit(fit, cohort / fout)}")
+    return Ok(fit)
+
+
+def hyperelastic(
+    cohort: Path, opts: HyperelasticOptions, fout: str, *, log: ILogger
+) -> Ok[ModelFit] | Err:
+    # pandas and nptdms are only loaded once a cohort is fitted.
+    from ._hyperelastic import collect_loading_branches, fit_hyperelastic
+    from ._io import export_fit
+
+    match _specimens(cohort, log=log):
+        case Ok(specimens):
+            pass
+        case Err(e):
+            return Err(e)
+    match collect_loading_branches(specimens, points=opts.points, log=log):
+        case Ok(data):
+            log.info(f"Fitting {len(data)} loading branches of {len(specimens)} specimens")
+        case Err(e):
+            return Err(e)
+    fit = fit_hyperelastic(data, opts)
+    log.brief(f"{fit.converged.sum()} of {len(data)} fits converged")
+    log.brief(f"Parameters written to {export_fit(fit, cohort / fout)}")
+    return Ok(fit)
+
+
+if __name__ == "__main__":
+    args = parser_cmdline_args()
+    logger = BLogger(args.log)
+    failed = False
+    for cohort in args.cohorts:
+        match args.command:
+            case "relaxation":
+                result = relaxation(Path(cohort), relaxation_options(args), args.output, log=logger)
+            case "hyperelastic":
+                result = hyperelastic(
+                    Path(cohort), hyperelastic_options(args), args.output, log=logger
+                )
+            case _:
+                result = Err(ValueError(f"Unknown command {args.command}"))
+        match result:
+            case Ok():
+                pass
+            case Err(e):
+                logger.error(f"Failed to fit {cohort}: {e}")
+                failed = True
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,103 @@
+import argparse
+import dataclasses as dc
+import os
+from typing import get_args
+
+from pytools.logging.trait import LOG_LEVEL
+
+from ._types import HYPERELASTIC_MODELS, RELAXATION_MODELS
+
+__all__ = ["parser_cmdline_args"]
+
+_parser = argparse.ArgumentParser(
+    description="Fit material models to every specimen of a cohort at once.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_parser.add_argument(
+    "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set  log level."
+)
+_commands = _parser.add_subparsers(dest="command", required=True)
+
+
+def _add_fit_arguments(parser: argparse.ArgumentParser, *, points: int, output: str) -> None:
+    # Subcommands write every argument back to the namespace, so their defaults go here.
+    parser.add_argument("cohorts", type=str, nargs="+", help="Cohort folders to fit.")
+    parser.add_argument("--points", type=int, default=points, help="Samples kept from every curve.")
+    parser.add_argument("--starts", type=int, default=4, help="Initial guesses for every curve.")
+    parser.add_argument("--max-iter", type=int, default=200, help="Iterations of every fit.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Processes running the initial guesses.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=output,
+        help="File name of the fitted parameters, written in the cohort.",
+    )
+
+
+_relaxation = _commands.add_parser(
+    "relaxation",
+    help="Fit a Prony series or Fung's QLV to the relaxation holds.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_add_fit_arguments(_relaxation, points=200, output="relaxation_fit.csv")
+_relaxation.add_argument(
+    "--model",
+    type=str.lower,
+    default="prony",
+    choices=get_args(RELAXATION_MODELS),
+    help="Relaxation model.",
+)
+_relaxation.add_argument(
+    "--terms", type=int, default=3, help="Number of exponentials of the Prony series."
+)
+
+_hyperelastic = _commands.add_parser(
+    "hyperelastic",
+    help="Fit an exponential or Fung model to the loading branches of the Saw tests.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_add_fit_arguments(_hyperelastic, points=100, output="hyperelastic_fit.csv")
+_hyperelastic.add_argument(
+    "--model",
+    type=str.lower,
+    default="exponential",
+    choices=get_args(HYPERELASTIC_MODELS),
+    help="Hyperelastic model.",
+)
+
+
+@dc.dataclass(slots=True)
+class ParsedArguments:
+    command: str
+    cohorts: list[str]
+    model: str
+    terms: int
+    points: int
+    starts: int
+    max_iter: int
+    workers: int
+    output: str
+    log: LOG_LEVEL
+
+
+def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
+    return _parser.parse_args(
+        args,
+        namespace=ParsedArguments(
+            "relaxation",
+            [],
+            model="prony",
+            terms=3,
+            points=200,
+            starts=4,
+            max_iter=200,
+            workers=1,
+            output="relaxation_fit.csv",
+            log="INFO",
+        ),
+    )
@@ -0,0 +1,172 @@
+# Copyright (c) 2025 Will Zhang
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+
+from ._io import iter_filtered_recordings
+from ._lsq import multistart_least_squares
+from ._types import HyperelasticData, ModelFit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.types import PROTOCOL_NAMES
+
+    from ._lsq import BatchedModel
+    from ._types import A2, A3, HYPERELASTIC_MODELS, HyperelasticOptions
+
+__all__ = [
+    "HYPERELASTIC_FOLDERS",
+    "collect_loading_branches",
+    "exponential_model",
+    "fit_hyperelastic",
+    "fung_model",
+    "linear_fung_model",
+]
+
+HYPERELASTIC_FOLDERS: Sequence[PROTOCOL_NAMES] = ("initial", "activated", "deactivated")
+
+
+def exponential_model(
+    params: A2[np.float64], strain: A2[np.float64]
+) -> tuple[A2[np.float64], A3[np.float64]]:
+    """``F_0 + a (exp(b e) - 1)`` and its Jacobian, `params` ``F_0``, ``log(a)``, ``log(b)``."""
+    a, b = np.exp(params[:, 1:2]), np.exp(params[:, 2:3])
+    grow = np.exp(b * strain)
+    f = a * (grow - 1)
+    jac = np.stack((np.ones_like(strain), f, a * b * strain * grow), axis=2)
+    return params[:, :1] + f, jac
+
+
+def fung_model(
+    params: A2[np.float64], strain: A2[np.float64]
+) -> tuple[A2[np.float64], A3[np.float64]]:
+    """1D Fung ``F_0 + c e exp(b e^2)`` and its Jacobian.
+
+    `params` are ``F_0``, ``log(c)`` and ``log(b)``.
+    """
+    c, b = np.exp(params[:, 1:2]), np.exp(params[:, 2:3])
+    f = c * strain * np.exp(b * strain**2)
+    jac = np.stack((np.ones_like(strain), f, f * b * strain**2), axis=2)
+    return params[:, :1] + f, jac
+
+
+def linear_fung_model(
+    params: A2[np.float64], strain: A2[np.float64]
+) -> tuple[A2[np.float64], A3[np.float64]]:
+    """Linear elastin and Fung collagen ``F_0 + mu e + c e exp(b e^2)`` and its Jacobian.
+
+    `params` are ``F_0``, ``log(mu)``, ``log(c)`` and ``log(b)``.
+    """
+    mu, c, b = np.exp(params[:, 1:2]), np.exp(params[:, 2:3]), np.exp(params[:, 3:4])
+    linear = mu * strain
+    f = c * strain * np.exp(b * strain**2)
+    jac = np.stack((np.ones_like(strain), linear, f, f * b * strain**2), axis=2)
+    return params[:, :1] + linear + f, jac
+
+
+_MODELS: Mapping[HYPERELASTIC_MODELS, BatchedModel] = {
+    "exponential": exponential_model,
+    "fung": fung_model,
+    "linear_fung": linear_fung_model,
+}
+
+_NAMES: Mapping[HYPERELASTIC_MODELS, Sequence[str]] = {
+    "exponential": ("F_0", "a", "b"),
+    "fung": ("F_0", "c", "b"),
+    "linear_fung": ("F_0", "mu", "c", "b"),
+}
+
+
+def _resample_branch(
+    disp: A1[np.float64], force: A1[np.float64], points: int
+) -> tuple[A1[np.float64], A1[np.float64]]:
+    # Noise makes the branch slightly non-monotonic, which np.interp does not accept.
+    strain = np.maximum.accumulate(disp - disp[0])
+    grid = np.linspace(0.0, strain[-1], points)
+    return grid, np.interp(grid, strain, force)
+
+
+def collect_loading_branches(
+    specimens: Sequence[Path], *, points: int = 100, log: ILogger = NLOGGER
+) -> Ok[HyperelasticData] | Err:
+    """Gather the loading branches of the ``Saw_*`` tests on `points` evenly spaced strains.
+
+    The branch of the last cycle of each test, as in `reduce_cycling_terms`, is taken from
+    the last iteration of the ``filtered.tsv`` of every folder in `HYPERELASTIC_FOLDERS`.
+    """
+    strains: list[A1[np.float64]] = []
+    forces: list[A1[np.float64]] = []
+    labels: list[tuple[str, str, str]] = []
+    for home, state, recording in iter_filtered_recordings(
+        specimens, HYPERELASTIC_FOLDERS, log=log
+    ):
+        for test in (t for t in recording.protocols_matching("Saw") if t.startswith("Saw_")):
+            match recording.last_cycle(test):
+                case Ok(cycle):
+                    branches = cycle.segments(mode="STRETCH")
+                case Err(e):
+                    log.warn(f"Skipping {test} of {home.name}/{state}: {e}")
+                    continue
+            if not branches or len(branches[0]) < 2 or np.ptp(branches[0].disp) <= 0:
+                log.warn(f"{test} of {home.name}/{state} has no loading branch")
+                continue
+            e, f = _resample_branch(branches[0].disp, branches[0].force, points)
+            strains.append(e)
+            forces.append(f)
+            labels.append((home.name, state, test))
+    if not labels:
+        return Err(LookupError("No loading branches found"))
+    return Ok(HyperelasticData(strain=np.stack(strains), force=np.stack(forces), labels=labels))
+
+
+def _initial_guesses(
+    data: HyperelasticData, model: HYPERELASTIC_MODELS, *, starts: int
+) -> Sequence[A2[np.float64]]:
+    """Start from curves through both ends of each branch with stiffening spread over starts."""
+    e_max = data.strain[:, -1:]
+    f_0 = data.force[:, :1]
+    rise = np.maximum(data.force[:, -1:] - f_0, 1e-6)
+    guesses: list[A2[np.float64]] = []
+    # The exponent at the peak strain, from nearly linear to strongly stiffening.
+    for k in np.geomspace(0.5, 8.0, starts) if starts > 1 else np.array([2.0]):
+        match model:
+            case "exponential":
+                b = k / e_max
+                guesses.append(np.hstack((f_0, np.log(rise / np.expm1(k)), np.log(b))))
+            case "fung":
+                b = k / e_max**2
+                guesses.append(np.hstack((f_0, np.log(rise / (e_max * np.exp(k))), np.log(b))))
+            case "linear_fung":
+                b = k / e_max**2
+                mu, c = 0.5 * rise / e_max, 0.5 * rise / (e_max * np.exp(k))
+                guesses.append(np.hstack((f_0, np.log(mu), np.log(c), np.log(b))))
+    return guesses
+
+
+def fit_hyperelastic(data: HyperelasticData, opts: HyperelasticOptions) -> ModelFit:
+    """Fit the hyperelastic model of `opts` to every branch of `data` in one batched problem."""
+    fit = multistart_least_squares(
+        _MODELS[opts.model],
+        _initial_guesses(data, opts.model, starts=opts.starts),
+        data.strain,
+        data.force,
+        max_iter=opts.max_iter,
+        workers=opts.workers,
+    )
+    params = fit.params.copy()
+    with np.errstate(over="ignore"):
+        params[:, 1:] = np.exp(params[:, 1:])
+    return ModelFit(
+        model=opts.model,
+        names=_NAMES[opts.model],
+        params=params,
+        rms=fit.rms,
+        converged=fit.converged,
+        labels=data.labels,
+    )
@@ -0,0 +1,55 @@
+# Copyright (c) 2025 Will Zhang
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from pytools.result import Err, Ok
+from taad_smc.io.api import find_data_subdirectories, import_recording
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator, Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.api import SegmentedRecording
+    from taad_smc.io.types import PROTOCOL_NAMES
+
+    from ._types import ModelFit
+
+__all__ = ["export_fit", "fit_table", "iter_filtered_recordings"]
+
+
+def iter_filtered_recordings(
+    specimens: Sequence[Path], folders: Collection[PROTOCOL_NAMES], *, log: ILogger
+) -> Iterator[tuple[Path, PROTOCOL_NAMES, SegmentedRecording]]:
+    """Yield the ``filtered.tsv`` of the last iteration of every protocol folder in `folders`.
+
+    Specimens and files that cannot be read are logged and skipped.
+    """
+    for home in specimens:
+        match find_data_subdirectories(home):
+            case Ok(found):
+                pass
+            case Err(e):
+                log.warn(f"Skipping {home}: {e}")
+                continue
+        for state in (s for s in found if s in folders):
+            file = found[state][max(found[state])] / "filtered.tsv"
+            match import_recording(file):
+                case Ok(recording):
+                    yield home, state, recording
+                case Err(e):
+                    log.warn(f"Skipping {file}: {e}")
+
+
+def fit_table(fit: ModelFit) -> pd.DataFrame:
+    """One row per fitted curve with its labels, parameters, rms residual and convergence."""
+    df = pd.DataFrame(fit.labels, columns=["specimen", "folder", "test"])
+    df[list(fit.names)] = fit.params
+    df["rms"] = fit.rms
+    df["converged"] = fit.converged
+    return df
+
+
+def export_fit(fit: ModelFit, fout: Path) -> Path:
+    fit_table(fit).to_csv(fout, index=False)
+    return fout
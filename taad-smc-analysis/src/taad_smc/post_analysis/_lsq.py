@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Will Zhang
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+from ._types import BatchedFit
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ._types import A2, A3
+
+__all__ = ["BatchedModel", "batched_least_squares", "multistart_least_squares"]
+
+
+class BatchedModel(Protocol):
+    def __call__(
+        self, params: A2[np.float64], x: A2[np.float64]
+    ) -> tuple[A2[np.float64], A3[np.float64]]:
+        """Return the model of every curve and its Jacobian with respect to `params`.
+
+        `params` is (curves, parameters) and `x` (curves, points); the values are
+        (curves, points) and the Jacobian (curves, points, parameters).
+        """
+        ...
+
+
+def batched_least_squares(
+    model: BatchedModel,
+    p0: A2[np.float64],
+    x: A2[np.float64],
+    y: A2[np.float64],
+    *,
+    max_iter: int = 200,
+    rtol: float = 1e-10,
+) -> BatchedFit:
+    """Fit `model` to every row of `y` at once with Levenberg-Marquardt.
+
+    The curves are independent, so the normal equations are one small system per curve and
+    are solved as a stack. Each curve keeps its own damping and stops on its own once an
+    accepted step lowers its cost by less than `rtol`; only the curves still running are
+    evaluated.
+    """
+    params = np.array(p0, dtype=np.float64)
+    # Trial steps may overflow the model; they are rejected below by their non-finite cost.
+    with np.errstate(all="ignore"):
+        f, jac = model(params, x)
+        res = f - y
+        cost = 0.5 * np.einsum("hm,hm->h", res, res)
+        damping = np.full(len(params), 1e-3)
+        iterations = np.zeros(len(params), dtype=np.intp)
+        active = np.isfinite(cost)
+        eye = np.eye(params.shape[1])
+        for _ in range(max_iter):
+            rows = np.flatnonzero(active)
+            if not len(rows):
+                break
+            j, r = jac[rows], res[rows]
+            jtj = np.einsum("hmp,hmq->hpq", j, j)
+            grad = np.einsum("hmp,hm->hp", j, r)
+            # Parameters the curve does not depend on still get some damping, so the
+            # systems stay solvable.
+            diag = np.diagonal(jtj, axis1=1, axis2=2)
+            scale = np.maximum(diag, 1e-9 * diag.max(axis=1, keepdims=True)) + 1e-12
+            lhs = jtj + damping[rows, None, None] * scale[:, :, None] * eye
+            step = -np.linalg.solve(lhs, grad[:, :, None])[:, :, 0]
+            trial = params[rows] + step
+            f_t, jac_t = model(trial, x[rows])
+            res_t = f_t - y[rows]
+            cost_t = 0.5 * np.einsum("hm,hm->h", res_t, res_t)
+            better = np.isfinite(cost_t) & (cost_t < cost[rows]) & np.isfinite(jac_t).all((1, 2))
+            done = better & (cost[rows] - cost_t <= rtol * cost[rows])
+            accepted = rows[better]
+            params[accepted], cost[accepted] = trial[better], cost_t[better]
+            res[accepted], jac[accepted] = res_t[better], jac_t[better]
+            damping[rows] = np.where(
+                better, np.maximum(damping[rows] / 10, 1e-9), damping[rows] * 10
+            )
+            iterations[rows] += 1
+            # A damping this large means no step lowers the cost any more: a local minimum.
+            done |= damping[rows] > 1e12
+            active[rows[done]] = False
+    return BatchedFit(
+        params=params,
+        rms=np.sqrt(2 * cost / y.shape[1]),
+        iterations=iterations,
+        converged=~active & np.isfinite(cost),
+    )
+
+
+def _fit_start(
+    args: tuple[BatchedModel, A2[np.float64], A2[np.float64], A2[np.float64], int],
+) -> BatchedFit:
+    model, p0, x, y, max_iter = args
+    return batched_least_squares(model, p0, x, y, max_iter=max_iter)
+
+
+def multistart_least_squares(
+    model: BatchedModel,
+    starts: Sequence[A2[np.float64]],
+    x: A2[np.float64],
+    y: A2[np.float64],
+    *,
+    max_iter: int = 200,
+    workers: int = 1,
+) -> BatchedFit:
+    """Fit every curve from each initial guess of `starts` and keep its best fit.
+
+    Each start is one batched fit of all curves; with more than one worker they run on a
+    process pool. `model` must be picklable, e.g. a module-level function or a partial of one.
+    """
+    jobs = [(model, p0, x, y, max_iter) for p0 in starts]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            fits = list(pool.map(_fit_start, jobs))
+    else:
+        fits = [_fit_start(job) for job in jobs]
+    rms = np.stack([np.where(np.isfinite(f.rms), f.rms, np.inf) for f in fits])
+    best = np.argmin(rms, axis=0)
+    curves = np.arange(len(best))
+    return BatchedFit(
+        params=np.stack([f.params for f in fits])[best, curves],
+        rms=rms[best, curves],
+        iterations=np.stack([f.iterations for f in fits])[best, curves],
+        converged=np.stack([f.converged for f in fits])[best, curves],
+    )
@@ -0,0 +1,187 @@
+# Copyright (c) 2025 Will Zhang
+from functools import partial
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+from scipy.special import exp1
+from taad_smc.decimate.api import resample_logspace
+
+from ._io import iter_filtered_recordings
+from ._lsq import multistart_least_squares
+from ._types import ModelFit, RelaxationData
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.types import PROTOCOL_NAMES
+
+    from ._lsq import BatchedModel
+    from ._types import A2, A3, RELAXATION_MODELS, RelaxationOptions
+
+__all__ = [
+    "RELAXATION_TESTS",
+    "collect_relaxation_holds",
+    "fit_relaxation",
+    "prony_model",
+    "qlv_model",
+]
+
+# The activation folders only hold the Relax_Mid test of interest.
+RELAXATION_TESTS: Mapping[PROTOCOL_NAMES, tuple[str, ...]] = {
+    "initial": ("Relax_Fast", "Relax_Mid", "Relax_Slow"),
+    "activated": ("Relax_Fast", "Relax_Mid", "Relax_Slow"),
+    "deactivated": ("Relax_Fast", "Relax_Mid", "Relax_Slow"),
+    "activation": ("Relax_Mid",),
+    "deactivation": ("Relax_Mid",),
+}
+
+
+def prony_model(
+    params: A2[np.float64], t: A2[np.float64], *, terms: int
+) -> tuple[A2[np.float64], A3[np.float64]]:
+    """Prony series ``F_inf + sum(a_k exp(-t / tau_k))`` and its Jacobian.
+
+    `params` are ``F_inf``, the amplitudes ``a_k`` and the ``log(tau_k)``.
+    """
+    f_inf, amp, log_tau = params[:, :1], params[:, 1 : 1 + terms], params[:, 1 + terms :]
+    scaled = t[:, :, None] * np.exp(-log_tau)[:, None, :]
+    decay = np.exp(-scaled)
+    f = f_inf + np.einsum("hk,hmk->hm", amp, decay)
+    jac = np.concatenate(
+        (np.ones_like(t)[:, :, None], decay, amp[:, None, :] * decay * scaled), axis=2
+    )
+    return f, jac
+
+
+def qlv_model(params: A2[np.float64], t: A2[np.float64]) -> tuple[A2[np.float64], A3[np.float64]]:
+    """Fung's reduced relaxation function scaled by the peak force, and its Jacobian.
+
+    ``G(t) = (1 + C (E1(t / tau_2) - E1(t / tau_1))) / (1 + C log(tau_2 / tau_1))``, with
+    `params` ``F_0``, ``log(C)``, ``log(tau_1)`` and ``log(tau_2)``. The loading ramp is taken
+    as a step, which holds for holds much longer than their ramp.
+    """
+    f0, c = params[:, :1], np.exp(params[:, 1:2])
+    s1, s2 = params[:, 2:3], params[:, 3:4]
+    x1, x2 = t * np.exp(-s1), t * np.exp(-s2)
+    num = 1 + c * (exp1(x2) - exp1(x1))
+    den = 1 + c * (s2 - s1)
+    g = num / den
+    # d E1(t / tau) / d log(tau) = exp(-t / tau)
+    d_num = (c * (exp1(x2) - exp1(x1)), -c * np.exp(-x1), c * np.exp(-x2))
+    d_den = (c * (s2 - s1), -c, c)
+    jac = np.stack(
+        [g] + [f0 * (dn * den - num * dd) / den**2 for dn, dd in zip(d_num, d_den, strict=True)],
+        axis=2,
+    )
+    return f0 * g, jac
+
+
+def _resample_hold(
+    time: A1[np.float64], force: A1[np.float64], points: int
+) -> tuple[A1[np.float64], A1[np.float64]]:
+    t, f = resample_logspace(time - time[0], force, points)
+    grid = np.geomspace(t[0], t[-1], points)
+    return grid, np.interp(np.log(grid), np.log(t), f)
+
+
+def collect_relaxation_holds(
+    specimens: Sequence[Path], *, points: int = 200, log: ILogger = NLOGGER
+) -> Ok[RelaxationData] | Err:
+    """Gather the relaxation holds of every specimen on a log-spaced grid of `points` times.
+
+    The hold of the last cycle of each relaxation test is taken from the last iteration of
+    the ``filtered.tsv`` of every protocol folder in `RELAXATION_TESTS`. Holds are averaged
+    in log-spaced buckets first, so the fits see every decade equally.
+    """
+    times: list[A1[np.float64]] = []
+    forces: list[A1[np.float64]] = []
+    labels: list[tuple[str, str, str]] = []
+    for home, state, recording in iter_filtered_recordings(specimens, RELAXATION_TESTS, log=log):
+        for test in (t for t in RELAXATION_TESTS[state] if t in recording.protocols):
+            match recording.last_cycle(test):
+                case Ok(cycle):
+                    holds = cycle.segments(mode="HOLD")
+                case Err(e):
+                    log.warn(f"Skipping {test} of {home.name}/{state}: {e}")
+                    continue
+            if not holds or len(holds[0]) <= points:
+                log.warn(f"{test} of {home.name}/{state} has no hold of over {points} samples")
+                continue
+            t, f = _resample_hold(holds[0].time, holds[0].force, points)
+            times.append(t)
+            forces.append(f)
+            labels.append((home.name, state, test))
+    if not labels:
+        return Err(LookupError("No relaxation holds found"))
+    return Ok(RelaxationData(time=np.stack(times), force=np.stack(forces), labels=labels))
+
+
+def _initial_guesses(
+    data: RelaxationData, model: RELAXATION_MODELS, *, terms: int, starts: int
+) -> Sequence[A2[np.float64]]:
+    """Spread the time constants over the span of each hold, shifted for every start."""
+    t_min, t_max = np.log(data.time[:, :1]), np.log(data.time[:, -1:])
+    f_first, f_last = data.force[:, :1], data.force[:, -1:]
+    shifts = np.linspace(-1.0, 1.0, starts) if starts > 1 else np.zeros(1)
+    guesses: list[A2[np.float64]] = []
+    for shift in shifts:
+        match model:
+            case "prony":
+                fractions = (np.arange(terms) + 0.5) / terms
+                log_tau = t_min + (t_max - t_min) * fractions + shift
+                amp = np.repeat((f_first - f_last) / terms, terms, axis=1)
+                guesses.append(np.hstack((f_last, amp, log_tau)))
+            case "qlv":
+                s1, s2 = t_min + shift, t_max + shift
+                ratio = np.clip(f_first / np.where(f_last > 0, f_last, np.nan), 1.01, None)
+                log_c = np.log(np.nan_to_num((ratio - 1) / (s2 - s1), nan=0.1))
+                guesses.append(np.hstack((f_first, log_c, s1, s2)))
+    return guesses
+
+
+def _parameter_names(model: RELAXATION_MODELS, terms: int) -> Sequence[str]:
+    match model:
+        case "prony":
+            return [
+                "F_inf",
+                *(f"a_{k + 1}" for k in range(terms)),
+                *(f"tau_{k + 1}" for k in range(terms)),
+            ]
+        case "qlv":
+            return ["F_0", "C", "tau_1", "tau_2"]
+
+
+def fit_relaxation(data: RelaxationData, opts: RelaxationOptions) -> ModelFit:
+    """Fit the relaxation model of `opts` to every hold of `data` in one batched problem."""
+    match opts.model:
+        case "prony":
+            model: BatchedModel = partial(prony_model, terms=opts.terms)
+            logs = slice(1 + opts.terms, None)
+        case "qlv":
+            model = qlv_model
+            logs = slice(1, None)
+    fit = multistart_least_squares(
+        model,
+        _initial_guesses(data, opts.model, terms=opts.terms, starts=opts.starts),
+        data.time,
+        data.force,
+        max_iter=opts.max_iter,
+        workers=opts.workers,
+    )
+    params = fit.params.copy()
+    # A Prony term the hold does not resolve may drift to an infinite time constant.
+    with np.errstate(over="ignore"):
+        params[:, logs] = np.exp(params[:, logs])
+    return ModelFit(
+        model=opts.model,
+        names=_parameter_names(opts.model, opts.terms),
+        params=params,
+        rms=fit.rms,
+        converged=fit.converged,
+        labels=data.labels,
+    )
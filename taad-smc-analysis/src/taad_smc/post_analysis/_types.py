@@ -0,0 +1,105 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytools.arrays import A1
+
+__all__ = [
+    "A2",
+    "A3",
+    "HYPERELASTIC_MODELS",
+    "RELAXATION_MODELS",
+    "BatchedFit",
+    "HyperelasticData",
+    "HyperelasticOptions",
+    "ModelFit",
+    "RelaxationData",
+    "RelaxationOptions",
+]
+
+type A2[T: np.generic] = np.ndarray[tuple[int, int], np.dtype[T]]
+type A3[T: np.generic] = np.ndarray[tuple[int, int, int], np.dtype[T]]
+
+RELAXATION_MODELS = Literal["prony", "qlv"]
+HYPERELASTIC_MODELS = Literal["exponential", "fung", "linear_fung"]
+
+
+@dc.dataclass(slots=True, frozen=True)
+class BatchedFit:
+    """Parameters of every curve of a batched fit, one row each."""
+
+    params: A2[np.float64]
+    rms: A1[np.float64]
+    iterations: A1[np.intp]
+    converged: A1[np.bool_]
+
+
+@dc.dataclass(slots=True, frozen=True)
+class RelaxationData:
+    """Relaxation holds resampled on log-spaced times, one row each.
+
+    `time` starts at the first sample after the start of the hold. `labels` hold the
+    specimen, protocol folder and protocol of every row.
+    """
+
+    time: A2[np.float64]
+    force: A2[np.float64]
+    labels: Sequence[tuple[str, str, str]]
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class HyperelasticData:
+    """Loading branches resampled on evenly spaced strains, one row each.
+
+    `strain` starts at 0 at the start of every branch and ends at its peak. `labels` hold the
+    specimen, protocol folder and protocol of every row.
+    """
+
+    strain: A2[np.float64]
+    force: A2[np.float64]
+    labels: Sequence[tuple[str, str, str]]
+
+    def __len__(self) -> int:
+        return len(self.strain)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class ModelFit:
+    """Model fitted to every curve of a `RelaxationData` or `HyperelasticData`.
+
+    `params` are in the units of `names`: forces in mN and times in s.
+    """
+
+    model: RELAXATION_MODELS | HYPERELASTIC_MODELS
+    names: Sequence[str]
+    params: A2[np.float64]
+    rms: A1[np.float64]
+    converged: A1[np.bool_]
+    labels: Sequence[tuple[str, str, str]]
+
+
+@dc.dataclass(slots=True)
+class RelaxationOptions:
+    model: RELAXATION_MODELS
+    terms: int
+    points: int
+    starts: int
+    max_iter: int
+    workers: int
+
+
+@dc.dataclass(slots=True)
+class HyperelasticOptions:
+    model: HYPERELASTIC_MODELS
+    points: int
+    starts: int
+    max_iter: int
+    workers: int
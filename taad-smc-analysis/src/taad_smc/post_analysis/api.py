@@ -0,0 +1,55 @@
+from ._hyperelastic import (
+    HYPERELASTIC_FOLDERS,
+    collect_loading_branches,
+    exponential_model,
+    fit_hyperelastic,
+    fung_model,
+    linear_fung_model,
+)
+from ._io import export_fit, fit_table, iter_filtered_recordings
+from ._lsq import BatchedModel, batched_least_squares, multistart_least_squares
+from ._relaxation import (
+    RELAXATION_TESTS,
+    collect_relaxation_holds,
+    fit_relaxation,
+    prony_model,
+    qlv_model,
+)
+from ._types import (
+    HYPERELASTIC_MODELS,
+    RELAXATION_MODELS,
+    BatchedFit,
+    HyperelasticData,
+    HyperelasticOptions,
+    ModelFit,
+    RelaxationData,
+    RelaxationOptions,
+)
+
+__all__ = [
+    "HYPERELASTIC_FOLDERS",
+    "HYPERELASTIC_MODELS",
+    "RELAXATION_MODELS",
+    "RELAXATION_TESTS",
+    "BatchedFit",
+    "BatchedModel",
+    "HyperelasticData",
+    "HyperelasticOptions",
+    "ModelFit",
+    "RelaxationData",
+    "RelaxationOptions",
+    "batched_least_squares",
+    "collect_loading_branches",
+    "collect_relaxation_holds",
+    "exponential_model",
+    "export_fit",
+    "fit_hyperelastic",
+    "fit_relaxation",
+    "fit_table",
+    "fung_model",
+    "iter_filtered_recordings",
+    "linear_fung_model",
+    "multistart_least_squares",
+    "prony_model",
+    "qlv_model",
+]
@@ -0,0 +1,68 @@
+"""Catalog the protocol folders of a cohort and list the ones matching the filters.
+
+The catalog is written to ``.taad_catalog.json`` in the cohort folder the first time, or with
+``--rescan``, and read back afterwards, so selecting work does not walk the tree again.
+"""
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import BLogger
+from pytools.result import Err, Ok
+
+from ._argparse import parser_cmdline_args
+from ._io import log_catalog, open_catalog
+from ._types import CatalogOptions
+
+if TYPE_CHECKING:
+    from pytools.logging.trait import ILogger
+
+    from ._argparse import ParsedArguments
+    from ._types import Catalog
+
+
+def parser_optional_args(args: ParsedArguments) -> CatalogOptions:
+    return CatalogOptions(
+        workers=max(1, args.workers),
+        rescan=args.rescan,
+        species=args.species,
+        axis=args.axis,
+        protocol=args.protocol,
+        status=args.status,
+        before=args.before,
+    )
+
+
+def main(cohort: Path, opts: CatalogOptions, *, log: ILogger) -> Ok[Catalog] | Err:
+    match open_catalog(cohort, rescan=opts.rescan, workers=opts.workers, log=log):
+        case Ok(catalog):
+            pass
+        case Err(e):
+            return Err(e)
+    selection = catalog.select(
+        species=opts.species,
+        axis=opts.axis,
+        protocol=opts.protocol,
+        status=opts.status,
+        before=opts.before,
+    )
+    log_catalog(selection, log=log)
+    log.brief(f"{len(selection)} of {len(catalog)} protocol folders selected.")
+    return Ok(selection)
+
+
+if __name__ == "__main__":
+    args = parser_cmdline_args()
+    opts = parser_optional_args(args)
+    logger = BLogger(args.log)
+    failed = False
+    for cohort in args.cohorts:
+        match main(Path(cohort), opts, log=logger):
+            case Ok():
+                pass
+            case Err(e):
+                logger.error(f"Failed to catalog {cohort}: {e}")
+                failed = True
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,78 @@
+import argparse
+import dataclasses as dc
+import os
+from typing import get_args
+
+from pytools.logging.trait import LOG_LEVEL
+from taad_smc.io.types import PROTOCOL_NAMES
+
+from ._types import CATALOG_STATUS
+
+__all__ = ["parser_cmdline_args"]
+
+_parser = argparse.ArgumentParser(
+    description="List the protocol folders of a cohort with their recording and status.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_parser.add_argument(
+    "cohorts", type=str, nargs="+", help="Specimen folders, or folders of specimen folders."
+)
+_parser.add_argument("--workers", type=int, help="Number of threads scanning the folders.")
+_parser.add_argument(
+    "--rescan", action="store_true", help="Scan the cohort even if it already has a catalog."
+)
+_parser.add_argument("--species", type=str, nargs="+", help="Only list these species.")
+_parser.add_argument("--axis", type=str, nargs="+", help="Only list these axes.")
+_parser.add_argument(
+    "--protocol",
+    type=str.lower,
+    nargs="+",
+    choices=get_args(PROTOCOL_NAMES),
+    help="Only list these protocols.",
+)
+_parser.add_argument(
+    "--status",
+    type=str.lower,
+    nargs="+",
+    choices=get_args(CATALOG_STATUS),
+    help="Only list folders with these statuses.",
+)
+_parser.add_argument(
+    "--before",
+    type=str.lower,
+    choices=get_args(CATALOG_STATUS),
+    help="Only list folders that did not reach this status yet.",
+)
+_parser.add_argument(
+    "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set  log level."
+)
+
+
+@dc.dataclass(slots=True)
+class ParsedArguments:
+    cohorts: list[str]
+    workers: int
+    rescan: bool
+    species: list[str] | None
+    axis: list[str] | None
+    protocol: list[PROTOCOL_NAMES] | None
+    status: list[CATALOG_STATUS] | None
+    before: CATALOG_STATUS | None
+    log: LOG_LEVEL
+
+
+def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
+    return _parser.parse_args(
+        args,
+        namespace=ParsedArguments(
+            [],
+            workers=min(32, (os.cpu_count() or 1) + 4),
+            rescan=False,
+            species=None,
+            axis=None,
+            protocol=None,
+            status=None,
+            before=None,
+            log="INFO",
+        ),
+    )
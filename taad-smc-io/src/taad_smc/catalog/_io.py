@@ -0,0 +1,85 @@
+# Copyright (c) 2025 Will Zhang
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+
+from ._types import CATALOG_DTYPE, CATALOG_PROTOCOLS, CATALOG_STATUSES, Catalog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+
+__all__ = ["CATALOG_FILE", "load_catalog", "log_catalog", "open_catalog", "save_catalog"]
+
+CATALOG_FILE = ".taad_catalog.json"
+
+
+def save_catalog(catalog: Catalog) -> Path:
+    """Write `catalog` to `CATALOG_FILE` in its root folder and return the file."""
+    fout = catalog.root / CATALOG_FILE
+    with fout.open("w") as f:
+        json.dump(
+            {
+                "specimens": list(catalog.specimens),
+                "folders": list(catalog.folders),
+                "table": {k: catalog.table[k].tolist() for k in CATALOG_DTYPE.names or ()},
+            },
+            f,
+            indent=1,
+        )
+    return fout
+
+
+def load_catalog(root: Path) -> Ok[Catalog] | Err:
+    """Read the catalog saved in `root` by `save_catalog`."""
+    file = root / CATALOG_FILE
+    if not file.exists():
+        return Err(FileNotFoundError(f"No catalog found in {root}"))
+    with file.open("r") as f:
+        raw: dict[str, Any] = json.load(f)
+    folders: list[str] = raw["folders"]
+    table = np.empty(len(folders), dtype=CATALOG_DTYPE)
+    for k in CATALOG_DTYPE.names or ():
+        if (column := raw["table"].get(k)) is None or len(column) != len(folders):
+            return Err(ValueError(f"Catalog {file} has no valid column {k}"))
+        table[k] = column
+    return Ok(Catalog(root=root, table=table, specimens=raw["specimens"], folders=folders))
+
+
+def open_catalog(
+    root: Path, *, rescan: bool = False, workers: int = 8, log: ILogger = NLOGGER
+) -> Ok[Catalog] | Err:
+    """Read the catalog saved in `root`, or scan `root` and save it if there is none."""
+    if not rescan:
+        match load_catalog(root):
+            case Ok(catalog):
+                log.info(f"Read the catalog of {root}")
+                return Ok(catalog)
+            case Err(e):
+                log.info(f"{e}, scanning it...")
+    # nptdms is only loaded when the cohort is scanned.
+    from ._scan import scan_cohort
+
+    match scan_cohort(root, workers=workers, log=log):
+        case Ok(catalog):
+            log.info(f"Catalog written to {save_catalog(catalog)}")
+            return Ok(catalog)
+        case Err(e):
+            return Err(e)
+
+
+def log_catalog(catalog: Catalog, *, log: ILogger) -> None:
+    log.brief(
+        f"{'folder':<40}{'protocol':<28}{'species':>8}{'axis':>6}"
+        f"{'DAQ rate':>10}{'samples':>12}{'status':>12}"
+    )
+    for folder, row in zip(catalog.folders, catalog.table, strict=True):
+        log.brief(
+            f"{folder:<40}{CATALOG_PROTOCOLS[row['protocol']]:<28}{row['species']:>8}"
+            f"{row['axis']:>6}{row['daq_rate']:>10.0f}{row['samples']:>12}"
+            f"{CATALOG_STATUSES[row['status']]:>12}"
+        )
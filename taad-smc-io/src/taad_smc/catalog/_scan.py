@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false, reportMissingTypeStubs=false
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+from nptdms import TdmsFile
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+from taad_smc.io.api import is_all_test_protocols, is_specimen_info
+from taad_smc.io.types import PROTOCOLS
+
+from ._types import CATALOG_DTYPE, CATALOG_PROTOCOLS, CATALOG_STATUSES, Catalog
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.types import PROTOCOL_NAMES
+
+    from ._types import CATALOG_STATUS
+
+__all__ = ["scan_cohort"]
+
+type _Specimen = tuple[Path, str, str, Sequence[tuple[PROTOCOL_NAMES, int, Path]]]
+
+
+def _read_json(file: Path) -> object:
+    try:
+        with file.open("r") as f:
+            return json.load(f)
+    except OSError, ValueError:
+        return None
+
+
+def _subdirectories(folder: Path) -> Sequence[str]:
+    with os.scandir(folder) as it:
+        return [e.name for e in it if e.is_dir()]
+
+
+def _find_specimen(home: Path) -> _Specimen | None:
+    """Return the protocol folders of `home`, or None if it is not a specimen folder."""
+    folders = [
+        (p, int(m.groupdict().get("it") or 1), home / name)
+        for name in _subdirectories(home)
+        for p, pattern in PROTOCOLS.items()
+        if (m := pattern.match(name))
+    ]
+    if not folders:
+        return None
+    info = _read_json(home / "key.json")
+    if is_specimen_info(info):
+        return home, info["species"], info["axis"], folders
+    return home, "", "", folders
+
+
+def _read_recording(folder: Path, files: Collection[str]) -> tuple[float, int]:
+    """Return the DAQ rate and number of samples without reading any channel data.
+
+    ``.raw`` recordings only have their rate in the ``.json`` next to them; counting their
+    samples would mean reading the whole file, so it is reported as -1.
+    """
+    tdms = f"{folder.name}.tdms"
+    if tdms in files:
+        try:
+            with TdmsFile.open(folder / tdms) as f:
+                return float(f.properties["DAQ Rate"]), len(f["Data"]["Force"])
+        except OSError, KeyError, ValueError:
+            return np.nan, -1
+    meta = _read_json(folder / f"{folder.name}.json")
+    if isinstance(meta, dict) and isinstance(rate := meta.get("daq_rate"), (int, float)):
+        return float(rate), -1
+    return np.nan, -1
+
+
+def _folder_status(folder: Path, files: Collection[str]) -> CATALOG_STATUS:
+    name = folder.name
+    if f"{name}.tdms" not in files and f"{name}.raw" not in files:
+        return "missing"
+    if not (
+        is_all_test_protocols(_read_json(folder / "protocol.json"))
+        and is_specimen_info(_read_json(folder / "key.json"))
+    ):
+        return "unprepared"
+    if "filtered.tsv" in files:
+        return "filtered"
+    if f"{name}.csv" in files:
+        return "segmented"
+    if f"{name}.raw" in files:
+        return "exported"
+    return "recorded"
+
+
+def _scan_folder(folder: Path) -> tuple[float, int, CATALOG_STATUS]:
+    with os.scandir(folder) as it:
+        files = {e.name for e in it if e.is_file()}
+    rate, samples = _read_recording(folder, files)
+    return rate, samples, _folder_status(folder, files)
+
+
+def scan_cohort(root: Path, *, workers: int = 8, log: ILogger = NLOGGER) -> Ok[Catalog] | Err:
+    """Catalog every protocol folder of `root`, a specimen folder or a folder of them.
+
+    Folders are listed with `os.scandir` and only the properties of the TDMS files are read,
+    so the cost does not depend on the length of the recordings. Specimens and then protocol
+    folders are scanned by `workers` threads.
+    """
+    if not root.is_dir():
+        return Err(NotADirectoryError(f"{root} is not a directory"))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        if (own := _find_specimen(root)) is not None:
+            specimens = [own]
+        else:
+            homes = sorted(root / d for d in _subdirectories(root))
+            specimens = [s for s in pool.map(_find_specimen, homes) if s is not None]
+        if not specimens:
+            return Err(FileNotFoundError(f"No specimen folders found in {root}"))
+        order = {p: i for i, p in enumerate(CATALOG_PROTOCOLS)}
+        rows = [
+            (s, p, it, folder)
+            for s, (_, _, _, folders) in enumerate(specimens)
+            for p, it, folder in sorted(folders, key=lambda f: (order[f[0]], f[1]))
+        ]
+        scanned = list(pool.map(_scan_folder, [folder for *_, folder in rows]))
+    table = np.empty(len(rows), dtype=CATALOG_DTYPE)
+    table["specimen"] = [s for s, *_ in rows]
+    table["protocol"] = [order[p] for _, p, _, _ in rows]
+    table["iteration"] = [it for _, _, it, _ in rows]
+    table["species"] = [specimens[s][1] for s, *_ in rows]
+    table["axis"] = [specimens[s][2] for s, *_ in rows]
+    table["daq_rate"] = [rate for rate, _, _ in scanned]
+    table["samples"] = [n for _, n, _ in scanned]
+    table["status"] = [CATALOG_STATUSES.index(status) for _, _, status in scanned]
+    log.info(f"Found {len(rows)} protocol folders in {len(specimens)} specimens under {root}")
+    return Ok(
+        Catalog(
+            root=root,
+            table=table,
+            specimens=[home.relative_to(root).as_posix() for home, *_ in specimens],
+            folders=[folder.relative_to(root).as_posix() for *_, folder in rows],
+        )
+    )
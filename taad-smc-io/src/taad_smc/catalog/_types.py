@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal, get_args
+
+import numpy as np
+from taad_smc.io.types import PROTOCOLS
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+    from taad_smc.io.types import PROTOCOL_NAMES
+
+__all__ = [
+    "CATALOG_DTYPE",
+    "CATALOG_PROTOCOLS",
+    "CATALOG_STATUS",
+    "CATALOG_STATUSES",
+    "Catalog",
+    "CatalogOptions",
+]
+
+CATALOG_STATUS = Literal["missing", "unprepared", "recorded", "exported", "segmented", "filtered"]
+"""Furthest processing step of a protocol folder, in the order the pipeline runs them.
+
+``missing`` folders have no recording, ``unprepared`` ones lack a valid ``protocol.json`` or
+``key.json``, ``exported`` ones have the ``.raw`` copy of their TDMS file, ``segmented`` ones
+the postprocessed ``.csv`` and ``filtered`` ones ``filtered.tsv``.
+"""
+CATALOG_STATUSES: tuple[CATALOG_STATUS, ...] = get_args(CATALOG_STATUS)
+CATALOG_PROTOCOLS: tuple[PROTOCOL_NAMES, ...] = tuple(PROTOCOLS)
+
+CATALOG_DTYPE = np.dtype(
+    [
+        ("specimen", np.int32),
+        ("protocol", np.int32),
+        ("iteration", np.int32),
+        ("species", "U8"),
+        ("axis", "U8"),
+        ("daq_rate", np.float64),
+        ("samples", np.int64),
+        ("status", np.int8),
+    ],
+)
+"""One row per protocol folder.
+
+`specimen` is a position in `Catalog.specimens`, `protocol` one in `CATALOG_PROTOCOLS` and
+`status` one in `CATALOG_STATUSES`. `daq_rate` is NaN and `samples` -1 when the
+recording could not be read.
+"""
+
+
+def _values(wanted: str | Collection[str]) -> list[str]:
+    return [wanted] if isinstance(wanted, str) else list(wanted)
+
+
+def _positions(names: Sequence[str], wanted: str | Collection[str]) -> A1[np.intp]:
+    values = set(_values(wanted))
+    return np.array([i for i, n in enumerate(names) if n in values], dtype=np.intp)
+
+
+@dc.dataclass(slots=True)
+class CatalogOptions:
+    workers: int
+    rescan: bool
+    species: Sequence[str] | None
+    axis: Sequence[str] | None
+    protocol: Sequence[PROTOCOL_NAMES] | None
+    status: Sequence[CATALOG_STATUS] | None
+    before: CATALOG_STATUS | None
+
+
+@dc.dataclass(slots=True, frozen=True)
+class Catalog:
+    """Protocol folders found under `root`, one `CATALOG_DTYPE` row each.
+
+    `specimens` and `folders` are relative to `root`; there is one folder per row.
+    """
+
+    root: Path
+    table: np.ndarray[tuple[int], np.dtype[np.void]]
+    specimens: Sequence[str]
+    folders: Sequence[str]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def select(
+        self,
+        *,
+        specimen: str | Collection[str] | None = None,
+        protocol: PROTOCOL_NAMES | Collection[PROTOCOL_NAMES] | None = None,
+        species: str | Collection[str] | None = None,
+        axis: str | Collection[str] | None = None,
+        status: CATALOG_STATUS | Collection[CATALOG_STATUS] | None = None,
+        before: CATALOG_STATUS | None = None,
+    ) -> Catalog:
+        """Return the rows matching every given filter, None matches anything.
+
+        Each filter is a value or a collection of values. `before` keeps the folders that did
+        not reach that status yet, e.g. ``before="filtered"`` lists the remaining work.
+        """
+        mask = np.ones(len(self.table), dtype=np.bool_)
+        if specimen is not None:
+            mask &= np.isin(self.table["specimen"], _positions(self.specimens, specimen))
+        if protocol is not None:
+            mask &= np.isin(self.table["protocol"], _positions(CATALOG_PROTOCOLS, protocol))
+        if species is not None:
+            mask &= np.isin(self.table["species"], _values(species))
+        if axis is not None:
+            mask &= np.isin(self.table["axis"], _values(axis))
+        if status is not None:
+            mask &= np.isin(self.table["status"], _positions(CATALOG_STATUSES, status))
+        if before is not None:
+            mask &= self.table["status"] < CATALOG_STATUSES.index(before)
+        rows = np.flatnonzero(mask)
+        return Catalog(
+            root=self.root,
+            table=self.table[rows],
+            specimens=self.specimens,
+            folders=[self.folders[i] for i in rows],
+        )
+
+    def paths(self) -> Sequence[Path]:
+        """Return the protocol folder of every row."""
+        return [self.root / f for f in self.folders]
+
+    def specimen_paths(self) -> Sequence[Path]:
+        """Return the folder of every specimen with at least one row, in catalog order."""
+        present = dict.fromkeys(self.table["specimen"].tolist())
+        return [self.root / self.specimens[s] for s in present]
+
+    def status(self, row: int) -> CATALOG_STATUS:
+        return CATALOG_STATUSES[self.table["status"][row]]
@@ -0,0 +1,21 @@
+from ._io import CATALOG_FILE, load_catalog, log_catalog, open_catalog, save_catalog
+from ._types import (
+    CATALOG_DTYPE,
+    CATALOG_PROTOCOLS,
+    CATALOG_STATUS,
+    CATALOG_STATUSES,
+    Catalog,
+)
+
+__all__ = [
+    "CATALOG_DTYPE",
+    "CATALOG_FILE",
+    "CATALOG_PROTOCOLS",
+    "CATALOG_STATUS",
+    "CATALOG_STATUSES",
+    "Catalog",
+    "load_catalog",
+    "log_catalog",
+    "open_catalog",
+    "save_catalog",
+]
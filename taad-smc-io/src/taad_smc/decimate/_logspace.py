@@ -0,0 +1,61 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._minmax import axis_pixel_width
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from pytools.arrays import A1
+
+__all__ = ["decimate_for_logx_axis", "resample_logspace"]
+
+DEFAULT_LOG_POINTS = 1000
+
+
+def resample_logspace[F: np.number, G: np.number](
+    x: A1[F], y: A1[G], n_points: int = DEFAULT_LOG_POINTS
+) -> tuple[A1[F], A1[G]]:
+    """Return the series bucket-averaged on a geometric grid of `x`.
+
+    Uniformly sampled data crowds into the last decade of a log axis. Averaging over
+    log-spaced buckets keeps every sample of the early decades, where the buckets are
+    narrower than the sampling interval, and collapses the later decades to a fixed density.
+
+    Parameters
+    ----------
+    x : A1[F]
+        Non-decreasing abscissa, e.g. time since the start of a hold.
+    y : A1[G]
+        Ordinate to average in each bucket.
+    n_points : int, optional
+        Number of geometric buckets spanning the positive range of `x`.
+
+    Returns
+    -------
+    tuple[A1[F], A1[G]]
+        Bucket means of x and y. Non-positive x values are dropped since they cannot be
+        shown on a log axis. Inputs shorter than the target are returned unchanged.
+
+    """
+    if len(x) <= n_points:
+        return x, y
+    first = int(np.searchsorted(x, 0.0, side="right"))
+    xs, ys = x[first:], y[first:]
+    if len(xs) <= n_points:
+        return xs, ys
+    edges = np.geomspace(xs[0], xs[-1], n_points + 1)
+    bounds = np.unique(np.searchsorted(xs, edges[:-1], side="left"))
+    counts = np.diff(bounds, append=len(xs))
+    x_mean = np.add.reduceat(xs, bounds) / counts
+    y_mean = np.add.reduceat(ys, bounds) / counts
+    return x_mean.astype(x.dtype, copy=False), y_mean.astype(y.dtype, copy=False)
+
+
+def decimate_for_logx_axis[F: np.number, G: np.number](
+    ax: Axes, x: A1[F], y: A1[G]
+) -> tuple[A1[F], A1[G]]:
+    """Return the series resampled to about the pixel width of a semilog-x `ax`."""
+    return resample_logspace(x, y, axis_pixel_width(ax))
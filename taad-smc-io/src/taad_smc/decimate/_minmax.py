@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false
+from math import ceil
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from pytools.arrays import A1
+
+__all__ = [
+    "DEFAULT_PIXEL_WIDTH",
+    "axis_pixel_width",
+    "decimate_for_axis",
+    "decimate_minmax",
+    "minmax_indices",
+    "minmax_union_indices",
+]
+
+DEFAULT_PIXEL_WIDTH = 2000
+
+
+def minmax_indices[F: np.number](y: A1[F], n_buckets: int) -> A1[np.intp]:
+    """Return the indices that preserve the min/max envelope of `y`.
+
+    Parameters
+    ----------
+    y : A1[F]
+        Series to decimate.
+    n_buckets : int
+        Number of consecutive buckets to split the series into.
+
+    Returns
+    -------
+    A1[np.intp]
+        Sorted indices containing the first and last sample plus the location of the minimum
+        and maximum of every bucket. At most ``2 * n_buckets + 2`` indices are returned.
+
+    """
+    n = len(y)
+    if n <= 2 * n_buckets + 2 or n_buckets < 1:
+        return np.arange(n, dtype=np.intp)
+    size = ceil(n / n_buckets)
+    n_buckets = ceil(n / size)
+    buckets = np.pad(y, (0, n_buckets * size - n), mode="edge").reshape(n_buckets, size)
+    offset = np.arange(n_buckets, dtype=np.intp) * size
+    idx = np.concatenate(
+        (
+            [0, n - 1],
+            offset + buckets.argmin(axis=1),
+            offset + buckets.argmax(axis=1),
+        ),
+    )
+    return np.unique(np.minimum(idx, n - 1))
+
+
+def minmax_union_indices[F: np.number](
+    *ys: A1[F], n_buckets: int = DEFAULT_PIXEL_WIDTH
+) -> A1[np.intp]:
+    """Return the union of the min/max envelope indices of several equally long series.
+
+    Used when the series share an abscissa and are sliced together, e.g. a signal and its
+    filtered derivatives.
+    """
+    return np.unique(np.concatenate([minmax_indices(y, n_buckets) for y in ys]))
+
+
+def decimate_minmax[F: np.number, G: np.number](
+    x: A1[F], y: A1[G], n_buckets: int
+) -> tuple[A1[F], A1[G]]:
+    """Return the min/max envelope of a series with at most ~2 points per bucket.
+
+    Parameters
+    ----------
+    x : A1[F]
+        Abscissa of the series, e.g. time or strain. Does not need to be monotonic.
+    y : A1[G]
+        Ordinate of the series, whose peaks and valleys are preserved.
+    n_buckets : int
+        Number of consecutive buckets, usually the pixel width of the target axis.
+
+    Returns
+    -------
+    tuple[A1[F], A1[G]]
+        Decimated x and y. Inputs shorter than the target are returned unchanged.
+
+    """
+    idx = minmax_indices(y, n_buckets)
+    if len(idx) == len(y):
+        return x, y
+    return x[idx], y[idx]
+
+
+def axis_pixel_width(ax: Axes) -> int:
+    """Return the width of a matplotlib axis in display pixels."""
+    width = ax.bbox.width
+    if not np.isfinite(width) or width < 1:
+        return DEFAULT_PIXEL_WIDTH
+    return ceil(width)
+
+
+def decimate_for_axis[F: np.number, G: np.number](
+    ax: Axes, x: A1[F], y: A1[G]
+) -> tuple[A1[F], A1[G]]:
+    """Return the series reduced to about twice the pixel width of `ax`."""
+    return decimate_minmax(x, y, axis_pixel_width(ax))
@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pytools.arrays import A1
+
+__all__ = ["Envelope", "MinMaxPyramid"]
+
+
+class Envelope(NamedTuple):
+    """Min, mean and max of consecutive sample ranges ``start:stop`` of a series."""
+
+    start: A1[np.intp]
+    stop: A1[np.intp]
+    min: A1[np.float64]
+    mean: A1[np.float64]
+    max: A1[np.float64]
+
+
+@dc.dataclass(slots=True, frozen=True)
+class MinMaxPyramid:
+    """Min, max and mean of every aligned block of ``2**k`` samples of a series.
+
+    Level 0 is the series itself and every level pairs up the blocks of the one below, the
+    last block of a level holding what is left. A sample range is the union of at most two
+    blocks per level, so its exact min and max take O(log N) lookups. Build one with
+    `build`, NaN samples are ignored by min and max.
+    """
+
+    size: int
+    mins: Sequence[A1[np.float64]]
+    maxs: Sequence[A1[np.float64]]
+    means: Sequence[A1[np.float64]]
+
+    @classmethod
+    def build(cls, y: A1[np.floating]) -> MinMaxPyramid:
+        series = np.ascontiguousarray(y, dtype=np.float64)
+        mins, maxs, means = [series], [series], [series]
+        counts = np.ones(len(series))
+        while len(mins[-1]) > 1:
+            lo, hi, mean = mins[-1], maxs[-1], means[-1]
+            if len(lo) % 2:
+                # Pair the last block with itself, weighted 0 in the mean.
+                lo, hi = np.append(lo, lo[-1]), np.append(hi, hi[-1])
+                mean, counts = np.append(mean, 0.0), np.append(counts, 0.0)
+            total = counts[0::2] + counts[1::2]
+            mins.append(np.fmin(lo[0::2], lo[1::2]))
+            maxs.append(np.fmax(hi[0::2], hi[1::2]))
+            means.append((mean[0::2] * counts[0::2] + mean[1::2] * counts[1::2]) / total)
+            counts = total
+        return cls(size=len(series), mins=mins, maxs=maxs, means=means)
+
+    @property
+    def series(self) -> A1[np.float64]:
+        return self.mins[0]
+
+    def _counts(self, level: int, blocks: A1[np.intp]) -> A1[np.float64]:
+        width = 1 << level
+        return np.minimum(width, self.size - blocks * width).astype(np.float64)
+
+    def reduce(self, start: A1[np.integer], stop: A1[np.integer]) -> Envelope:
+        """Return the exact min, mean and max of every sample range ``start:stop``.
+
+        Ranges are clipped to the series and empty ones are NaN.
+        """
+        lo = np.clip(np.asarray(start, dtype=np.intp), 0, self.size)
+        hi = np.maximum(np.clip(np.asarray(stop, dtype=np.intp), 0, self.size), lo)
+        first, last = lo.copy(), hi.copy()
+        y_min, y_max = np.full(lo.shape, np.inf), np.full(lo.shape, -np.inf)
+        total, count = np.zeros(lo.shape), np.zeros(lo.shape)
+        for level, (mins, maxs, means) in enumerate(zip(self.mins, self.maxs, self.means)):
+            active = lo < hi
+            if not active.any():
+                break
+            # An odd bound is a block whose parent straddles the range, take it on its own.
+            for take, blocks in (
+                (active & (lo % 2 == 1), lo),
+                (active & (hi % 2 == 1), hi - 1),
+            ):
+                b = blocks[take]
+                y_min[take] = np.fmin(y_min[take], mins[b])
+                y_max[take] = np.fmax(y_max[take], maxs[b])
+                c = self._counts(level, b)
+                total[take] += means[b] * c
+                count[take] += c
+            lo = np.where(active & (lo % 2 == 1), lo + 1, lo) >> 1
+            hi = np.where(active & (hi % 2 == 1), hi - 1, hi) >> 1
+        empty = last <= first
+        y_min[empty | np.isinf(y_min)] = np.nan
+        y_max[empty | np.isinf(y_max)] = np.nan
+        mean = np.divide(total, count, out=np.full(lo.shape, np.nan), where=count > 0)
+        return Envelope(first, last, y_min, mean, y_max)
+
+    def minmax(self, start: int = 0, stop: int | None = None) -> tuple[float, float]:
+        """Return the exact min and max of samples ``start:stop``."""
+        env = self.reduce(np.array([start]), np.array([self.size if stop is None else stop]))
+        return float(env.min[0]), float(env.max[0])
+
+    def envelope(self, points: int, start: int = 0, stop: int | None = None) -> Envelope:
+        """Split samples ``start:stop`` into `points` ranges and return their exact envelope.
+
+        Fewer ranges are returned when there are fewer samples than `points`.
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        edges = np.unique(np.linspace(start, stop, points + 1).astype(np.intp))
+        return self.reduce(edges[:-1], edges[1:])
+
+    def to_arrays(self, name: str) -> Mapping[str, A1[np.float64]]:
+        """Return the levels as arrays named after `name`, to be saved with ``np.savez``."""
+        arrays = {name: self.series}
+        for k in range(1, len(self.mins)):
+            arrays |= {
+                f"{name}_min_{k}": self.mins[k],
+                f"{name}_max_{k}": self.maxs[k],
+                f"{name}_mean_{k}": self.means[k],
+            }
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, A1[np.float64]], name: str) -> MinMaxPyramid:
+        """Rebuild the pyramid saved by `to_arrays` under `name`."""
+        series = arrays[name]
+        mins, maxs, means = [series], [series], [series]
+        k = 1
+        while f"{name}_min_{k}" in arrays:
+            mins.append(arrays[f"{name}_min_{k}"])
+            maxs.append(arrays[f"{name}_max_{k}"])
+            means.append(arrays[f"{name}_mean_{k}"])
+            k += 1
+        return cls(size=len(series), mins=mins, maxs=maxs, means=means)
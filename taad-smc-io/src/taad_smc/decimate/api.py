@@ -0,0 +1,23 @@
+from ._logspace import decimate_for_logx_axis, resample_logspace
+from ._minmax import (
+    DEFAULT_PIXEL_WIDTH,
+    axis_pixel_width,
+    decimate_for_axis,
+    decimate_minmax,
+    minmax_indices,
+    minmax_union_indices,
+)
+from ._pyramid import Envelope, MinMaxPyramid
+
+__all__ = [
+    "DEFAULT_PIXEL_WIDTH",
+    "Envelope",
+    "MinMaxPyramid",
+    "axis_pixel_width",
+    "decimate_for_axis",
+    "decimate_for_logx_axis",
+    "decimate_minmax",
+    "minmax_indices",
+    "minmax_union_indices",
+    "resample_logspace",
+]
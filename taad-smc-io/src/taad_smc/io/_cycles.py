@@ -0,0 +1,149 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pytools.arrays import A1
+
+    from ._recording import SegmentedRecording
+
+__all__ = ["CYCLE_DTYPE", "CycleTensor", "cycle_tensor"]
+
+type _A2[T: np.generic] = np.ndarray[tuple[int, int], np.dtype[T]]
+type _A3[T: np.generic] = np.ndarray[tuple[int, int, int], np.dtype[T]]
+
+CYCLE_DTYPE = np.dtype(
+    [
+        ("cycle", np.int32),
+        ("stretch_start", np.intp),
+        ("stretch_stop", np.intp),
+        ("recover_start", np.intp),
+        ("recover_stop", np.intp),
+        ("valid", np.bool_),
+    ],
+)
+"""One row per resampled cycle: its number and the samples of its STRETCH and RECOVER runs.
+
+Rows past the last cycle of a specimen are padding with `valid` False.
+"""
+
+
+@dc.dataclass(slots=True, frozen=True)
+class CycleTensor:
+    """Every STRETCH/RECOVER pair of a protocol resampled on the same phase points.
+
+    The series are (specimen, cycle, phase) arrays, NaN where `cycles` is not valid. The
+    first half of `phase`, 0 to 0.5, spans the STRETCH run and the second half the RECOVER
+    run, evenly in samples. `time` is measured from the start of each cycle.
+    """
+
+    protocol: str
+    specimens: Sequence[str]
+    phase: A1[np.float64]
+    time: _A3[np.float64]
+    disp: _A3[np.float64]
+    force: _A3[np.float64]
+    cycles: np.ndarray[tuple[int, int], np.dtype[np.void]]
+
+    @property
+    def valid(self) -> _A2[np.bool_]:
+        return self.cycles["valid"]
+
+    def hysteresis(self) -> _A2[np.float64]:
+        """Return the energy dissipated by every cycle, the area of its force-disp loop."""
+        return np.trapezoid(self.force, self.disp, axis=2)
+
+    def last(self) -> tuple[_A2[np.float64], _A2[np.float64]]:
+        """Return the disp and force of the last valid cycle of every specimen."""
+        last = np.maximum(self.valid.sum(axis=1) - 1, 0)
+        rows = np.arange(len(last))
+        return self.disp[rows, last], self.force[rows, last]
+
+
+def _cycle_pairs(
+    recording: SegmentedRecording, protocol: str
+) -> np.ndarray[tuple[int], np.dtype[np.void]]:
+    """Find the first STRETCH and last RECOVER run of every cycle of `protocol` with both."""
+    index = recording.index
+    if (
+        protocol not in recording.protocols
+        or "STRETCH" not in recording.modes
+        or "RECOVER" not in recording.modes
+    ):
+        return np.zeros(0, dtype=CYCLE_DTYPE)
+    runs = index[index["protocol"] == recording.protocols.index(protocol)]
+    stretch = runs[runs["mode"] == recording.modes.index("STRETCH")]
+    recover = runs[runs["mode"] == recording.modes.index("RECOVER")][::-1]
+    s_cycles, first = np.unique(stretch["cycle"], return_index=True)
+    r_cycles, last = np.unique(recover["cycle"], return_index=True)
+    _, s, r = np.intersect1d(s_cycles, r_cycles, assume_unique=True, return_indices=True)
+    stretch, recover = stretch[first[s]], recover[last[r]]
+    order = np.argsort(stretch["start"])
+    pairs = np.zeros(len(order), dtype=CYCLE_DTYPE)
+    # pwlsplit names the cycles ``cycle_<n>``, keep the number.
+    pairs["cycle"] = [int(recording.cycles[c].rpartition("_")[2]) for c in stretch["cycle"][order]]
+    pairs["stretch_start"], pairs["stretch_stop"] = stretch["start"][order], stretch["stop"][order]
+    pairs["recover_start"], pairs["recover_stop"] = recover["start"][order], recover["stop"][order]
+    pairs["valid"] = True
+    return pairs
+
+
+def _resample_runs(
+    series: A1[np.float64], start: A1[np.intp], stop: A1[np.intp], points: int
+) -> _A2[np.float64]:
+    """Interpolate every run ``start:stop`` of `series` on `points` evenly spaced samples."""
+    pos = start[:, None] + np.linspace(0.0, 1.0, points) * (stop - start - 1)[:, None]
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, stop[:, None] - 1)
+    w = pos - lo
+    return series[lo] * (1 - w) + series[hi] * w
+
+
+def cycle_tensor(
+    recordings: Mapping[str, SegmentedRecording], protocol: str, *, phases: int = 100
+) -> Ok[CycleTensor] | Err:
+    """Resample the cycles of `protocol` of every recording on `phases` phase points.
+
+    The STRETCH and RECOVER runs are the ones labelled by `construct_postprocessed_df`, and
+    specimens with fewer cycles are padded with NaN. A cohort's ensemble average is then
+    ``np.nanmean(tensor.force, axis=1)`` and its cross-specimen mean one more reduction.
+    """
+    pairs = [_cycle_pairs(r, protocol) for r in recordings.values()]
+    n_cycles = max((len(p) for p in pairs), default=0)
+    if n_cycles == 0:
+        return Err(LookupError(f"No STRETCH/RECOVER cycles of {protocol} found"))
+    n_stretch = phases // 2
+    n_recover = phases - n_stretch
+    shape = (len(pairs), n_cycles, phases)
+    time, disp, force = np.full(shape, np.nan), np.full(shape, np.nan), np.full(shape, np.nan)
+    cycles = np.zeros(shape[:2], dtype=CYCLE_DTYPE)
+    for i, (recording, p) in enumerate(zip(recordings.values(), pairs, strict=True)):
+        cycles[i, : len(p)] = p
+        series = ((time, recording.time), (disp, recording.disp), (force, recording.force))
+        for out, x in series:
+            out[i, : len(p), :n_stretch] = _resample_runs(
+                x, p["stretch_start"], p["stretch_stop"], n_stretch
+            )
+            out[i, : len(p), n_stretch:] = _resample_runs(
+                x, p["recover_start"], p["recover_stop"], n_recover
+            )
+        time[i, : len(p)] -= time[i, : len(p), :1]
+    phase = np.concatenate(
+        (np.linspace(0.0, 0.5, n_stretch), np.linspace(0.5, 1.0, n_recover)),
+    )
+    return Ok(
+        CycleTensor(
+            protocol=protocol,
+            specimens=list(recordings),
+            phase=phase,
+            time=time,
+            disp=disp,
+            force=force,
+            cycles=cycles,
+        ),
+    )
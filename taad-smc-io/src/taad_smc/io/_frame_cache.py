@@ -0,0 +1,83 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false
+import json
+import shutil
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["FRAME_CACHE", "frame_cache_dir", "load_frame_cache", "save_frame_cache"]
+
+FRAME_CACHE = ".taad_cache"
+_META = "meta.json"
+
+
+def frame_cache_dir(file: Path) -> Path:
+    """Return the directory the columns of `file` are cached in, next to it."""
+    return file.parent / FRAME_CACHE / file.name
+
+
+def _source(file: Path) -> dict[str, int]:
+    stat = file.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def save_frame_cache(df: pd.DataFrame, file: Path, cache: Path) -> bool:
+    """Save the columns of `df`, read from `file`, as ``.npy`` files in `cache`.
+
+    Numeric columns are saved as they are and text columns as int32 codes into their
+    categories. False is returned when `df` has other columns or `cache` is not writable.
+    """
+    columns: list[dict[str, object]] = []
+    arrays: list[np.ndarray] = []
+    for name, col in df.items():
+        if col.dtype.kind in "biuf":
+            columns.append({"name": str(name), "categories": None})
+            arrays.append(col.to_numpy())
+            continue
+        codes, uniques = pd.factorize(col, sort=False)
+        if not all(isinstance(u, str) for u in uniques):
+            return False
+        columns.append({"name": str(name), "categories": list(uniques)})
+        arrays.append(codes.astype(np.int32))
+    if len(set(df.columns)) != len(columns):
+        return False
+    shutil.rmtree(cache, ignore_errors=True)
+    try:
+        cache.mkdir(parents=True)
+        for i, arr in enumerate(arrays):
+            np.save(cache / f"{i}.npy", np.ascontiguousarray(arr), allow_pickle=False)
+        # Written last, so a cache interrupted while saving is never read.
+        meta = {"source": _source(file), "columns": columns}
+        (cache / _META).write_text(json.dumps(meta))
+    except OSError:
+        return False
+    return True
+
+
+def load_frame_cache(file: Path, cache: Path) -> pd.DataFrame | None:
+    """Return the DataFrame cached by `save_frame_cache`, None if `file` changed since.
+
+    Numeric columns are memory-mapped copy-on-write, so they are writable without touching
+    the cache, and text columns come back as object columns like ``pd.read_csv`` gives.
+    """
+    try:
+        meta = json.loads((cache / _META).read_text())
+        if meta["source"] != _source(file):
+            return None
+        data: dict[str, object] = {}
+        for i, col in enumerate(meta["columns"]):
+            arr = np.load(cache / f"{i}.npy", mmap_mode="c", allow_pickle=False).view(np.ndarray)
+            if col["categories"] is None:
+                data[col["name"]] = arr
+                continue
+            # The extra last entry is what code -1, a missing value, looks up.
+            names = np.array([*col["categories"], np.nan], dtype=object)
+            data[col["name"]] = names[arr]
+    except OSError, ValueError, KeyError, TypeError:
+        return None
+    return pd.DataFrame(data, copy=False)
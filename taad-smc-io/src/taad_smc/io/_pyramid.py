@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from pytools.result import Err, Ok
+from taad_smc.decimate.api import MinMaxPyramid
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from pathlib import Path
+
+    from ._recording import SegmentedRecording
+
+__all__ = [
+    "PYRAMID_SUFFIX",
+    "RecordingPyramid",
+    "export_pyramid",
+    "import_pyramid",
+    "pyramid_file",
+]
+
+PYRAMID_SUFFIX = ".pyramid.npz"
+
+
+@dc.dataclass(slots=True, frozen=True)
+class RecordingPyramid:
+    """The `MinMaxPyramid` of the disp and force of a recording with the index of its runs.
+
+    Stored next to the recording, it answers range and envelope queries without reading it.
+    """
+
+    disp: MinMaxPyramid
+    force: MinMaxPyramid
+    index: np.ndarray[tuple[int], np.dtype[np.void]]
+    protocols: Sequence[str]
+
+    @classmethod
+    def build(cls, recording: SegmentedRecording) -> RecordingPyramid:
+        return cls(
+            disp=MinMaxPyramid.build(recording.disp),
+            force=MinMaxPyramid.build(recording.force),
+            index=recording.index,
+            protocols=recording.protocols,
+        )
+
+    def limits(
+        self, series: Literal["disp", "force"], *, exclude: Collection[str] = ()
+    ) -> tuple[float, float]:
+        """Return the min and max of `series` over the runs of every protocol but `exclude`.
+
+        A protocol is excluded when its name contains any of the terms, ignoring case.
+        """
+        terms = [t.lower() for t in exclude]
+        # The extra last entry is what label -1 looks up.
+        keep = np.array(
+            [not any(t in p.lower() for t in terms) for p in self.protocols] + [True],
+            dtype=np.bool_,
+        )
+        runs = self.index[keep[self.index["protocol"]]]
+        env = getattr(self, series).reduce(runs["start"], runs["stop"])
+        if not len(runs) or np.isnan(env.min).all():
+            return np.nan, np.nan
+        return float(np.nanmin(env.min)), float(np.nanmax(env.max))
+
+
+def pyramid_file(file: Path) -> Path:
+    """Return the file the pyramid of the recording `file` is stored in."""
+    return file.with_name(f"{file.stem}{PYRAMID_SUFFIX}")
+
+
+def export_pyramid(recording: SegmentedRecording, file: Path) -> Path:
+    """Build the pyramid of `recording`, saved to `file`, and store it next to it."""
+    pyramid = RecordingPyramid.build(recording)
+    fout = pyramid_file(file)
+    np.savez(
+        fout,
+        index=pyramid.index,
+        protocols=np.array(pyramid.protocols, dtype=str),
+        **pyramid.disp.to_arrays("disp"),
+        **pyramid.force.to_arrays("force"),
+    )
+    return fout
+
+
+def import_pyramid(file: Path) -> Ok[RecordingPyramid] | Err:
+    """Read the pyramid stored next to the recording `file`, if it is not older than it."""
+    fin = pyramid_file(file)
+    if not fin.exists():
+        return Err(FileExistsError(f"{fin} not found"))
+    if file.exists() and fin.stat().st_mtime < file.stat().st_mtime:
+        return Err(ValueError(f"{fin} is older than {file}"))
+    try:
+        with np.load(fin, allow_pickle=False) as f:
+            arrays = {k: f[k] for k in f.files}
+        pyramid = RecordingPyramid(
+            disp=MinMaxPyramid.from_arrays(arrays, "disp"),
+            force=MinMaxPyramid.from_arrays(arrays, "force"),
+            index=arrays["index"],
+            protocols=arrays["protocols"].tolist(),
+        )
+    except (OSError, ValueError, KeyError) as e:
+        return Err(e)
+    return Ok(pyramid)
@@ -0,0 +1,228 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+
+__all__ = ["SEGMENT_INDEX_DTYPE", "SegmentedRecording", "import_recording"]
+
+SEGMENT_INDEX_DTYPE = np.dtype(
+    [
+        ("protocol", np.int32),
+        ("cycle", np.int32),
+        ("mode", np.int32),
+        ("start", np.intp),
+        ("stop", np.intp),
+    ],
+)
+"""One row per run of samples sharing the same protocol, cycle and mode.
+
+The labels are positions in `SegmentedRecording.protocols`, `cycles` and `modes`, or -1 for
+samples outside of the protocol. Samples ``start:stop`` of the recording belong to the run.
+"""
+
+_LABELS = ("protocol", "cycle", "mode")
+_SERIES = ("time", "disp", "force")
+
+
+def _match(names: Sequence[str], wanted: str | Collection[str] | None) -> A1[np.bool_]:
+    if wanted is None:
+        return np.ones(len(names) + 1, dtype=np.bool_)
+    wanted = {wanted} if isinstance(wanted, str) else set(wanted)
+    # The extra last entry is what label -1 looks up.
+    return np.array([n in wanted for n in names] + [False], dtype=np.bool_)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class SegmentedRecording:
+    """The time, displacement and force of a segmented recording with an index of its runs.
+
+    The series are contiguous float64 arrays and every selection returns a recording whose
+    series are views into them, so nothing is copied. Build one with `from_codes`,
+    `from_df` or `import_recording`.
+    """
+
+    time: A1[np.float64]
+    disp: A1[np.float64]
+    force: A1[np.float64]
+    index: np.ndarray[tuple[int], np.dtype[np.void]]
+    protocols: Sequence[str]
+    cycles: Sequence[str]
+    modes: Sequence[str]
+
+    @classmethod
+    def from_codes(
+        cls,
+        time: A1[np.floating],
+        disp: A1[np.floating],
+        force: A1[np.floating],
+        *,
+        labels: tuple[A1[np.integer], A1[np.integer], A1[np.integer]],
+        names: tuple[Sequence[str], Sequence[str], Sequence[str]],
+    ) -> SegmentedRecording:
+        """Build a recording from the protocol, cycle and mode code of every sample.
+
+        `labels` hold positions in the matching `names`, -1 marks unlabelled samples.
+        """
+        protocol, cycle, mode = (np.asarray(c, dtype=np.int32) for c in labels)
+        n = len(time)
+        changed = np.flatnonzero(
+            (protocol[1:] != protocol[:-1]) | (cycle[1:] != cycle[:-1]) | (mode[1:] != mode[:-1])
+        )
+        starts = np.concatenate(([0], changed + 1)) if n else np.zeros(0, dtype=np.intp)
+        index = np.empty(len(starts), dtype=SEGMENT_INDEX_DTYPE)
+        index["protocol"] = protocol[starts]
+        index["cycle"] = cycle[starts]
+        index["mode"] = mode[starts]
+        index["start"] = starts
+        index["stop"] = np.append(starts[1:], n)
+        return cls(
+            time=np.ascontiguousarray(time, dtype=np.float64),
+            disp=np.ascontiguousarray(disp, dtype=np.float64),
+            force=np.ascontiguousarray(force, dtype=np.float64),
+            index=index,
+            protocols=list(names[0]),
+            cycles=list(names[1]),
+            modes=list(names[2]),
+        )
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> SegmentedRecording:
+        """Build a recording from a postprocessed or filtered DataFrame."""
+        codes: list[A1[np.integer]] = []
+        names: list[Sequence[str]] = []
+        for col in _LABELS:
+            c, uniques = pd.factorize(df[col], sort=False)
+            codes.append(c)
+            names.append([str(u) for u in uniques])
+        time, disp, force = (df[col].to_numpy(np.float64) for col in _SERIES)
+        return cls.from_codes(
+            time,
+            disp,
+            force,
+            labels=(codes[0], codes[1], codes[2]),
+            names=(names[0], names[1], names[2]),
+        )
+
+    def to_df(self) -> pd.DataFrame:
+        """Return the recording as a DataFrame with categorical protocol, cycle and mode."""
+        lengths = self.index["stop"] - self.index["start"]
+        return pd.DataFrame(
+            {
+                col: pd.Categorical.from_codes(np.repeat(self.index[col], lengths), categories=c)
+                for col, c in zip(_LABELS, (self.protocols, self.cycles, self.modes), strict=True)
+            }
+            | {"time": self.time, "disp": self.disp, "force": self.force},
+        )
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def _slice(self, rows: slice) -> SegmentedRecording:
+        index = self.index[rows].copy()
+        if len(index):
+            offset = index["start"][0]
+            index["start"] -= offset
+            index["stop"] -= offset
+            samples = slice(offset, offset + index["stop"][-1])
+        else:
+            samples = slice(0, 0)
+        return SegmentedRecording(
+            time=self.time[samples],
+            disp=self.disp[samples],
+            force=self.force[samples],
+            index=index,
+            protocols=self.protocols,
+            cycles=self.cycles,
+            modes=self.modes,
+        )
+
+    def _runs(
+        self,
+        protocol: str | Collection[str] | None,
+        cycle: str | Collection[str] | None,
+        mode: str | Collection[str] | None,
+    ) -> A1[np.intp]:
+        mask = (
+            _match(self.protocols, protocol)[self.index["protocol"]]
+            & _match(self.cycles, cycle)[self.index["cycle"]]
+            & _match(self.modes, mode)[self.index["mode"]]
+        )
+        return np.flatnonzero(mask)
+
+    def segments(
+        self,
+        *,
+        protocol: str | Collection[str] | None = None,
+        cycle: str | Collection[str] | None = None,
+        mode: str | Collection[str] | None = None,
+    ) -> Sequence[SegmentedRecording]:
+        """Return views of the samples matching every given label, one per contiguous block.
+
+        Each label is a name or a collection of names, None matches any label.
+        """
+        runs = self._runs(protocol, cycle, mode)
+        if not len(runs):
+            return []
+        breaks = np.flatnonzero(np.diff(runs) > 1) + 1
+        return [self._slice(slice(block[0], block[-1] + 1)) for block in np.split(runs, breaks)]
+
+    def select(
+        self,
+        *,
+        protocol: str | Collection[str] | None = None,
+        cycle: str | Collection[str] | None = None,
+        mode: str | Collection[str] | None = None,
+    ) -> Ok[SegmentedRecording] | Err:
+        """Return the view of the samples matching every label if they are contiguous."""
+        match self.segments(protocol=protocol, cycle=cycle, mode=mode):
+            case [view]:
+                return Ok(view)
+            case []:
+                return Err(LookupError(f"No data for {protocol=}, {cycle=}, {mode=}"))
+            case views:
+                msg = f"Data for {protocol=}, {cycle=}, {mode=} is split in {len(views)} blocks"
+                return Err(ValueError(msg))
+
+    def last_cycle(self, protocol: str) -> Ok[SegmentedRecording] | Err:
+        """Return the view of the last cycle of `protocol`."""
+        runs = self._runs(protocol, None, None)
+        if not len(runs):
+            return Err(LookupError(f"No data for protocol {protocol}"))
+        return self.select(protocol=protocol, cycle=self.cycles[self.index["cycle"][runs[-1]]])
+
+    def protocols_matching(self, *terms: str) -> Sequence[str]:
+        """Return the recorded protocols whose name contains every term, ignoring case."""
+        present = dict.fromkeys(self.index["protocol"][self.index["protocol"] >= 0].tolist())
+        return [
+            self.protocols[p]
+            for p in present
+            if all(t.lower() in self.protocols[p].lower() for t in terms)
+        ]
+
+    def label(self, run: int = 0) -> tuple[str, str, str]:
+        """Return the protocol, cycle and mode of a run, ``""`` where it is unlabelled."""
+        row = self.index[run]
+        return (
+            self.protocols[row["protocol"]] if row["protocol"] >= 0 else "",
+            self.cycles[row["cycle"]] if row["cycle"] >= 0 else "",
+            self.modes[row["mode"]] if row["mode"] >= 0 else "",
+        )
+
+
+def import_recording(file: Path) -> Ok[SegmentedRecording] | Err:
+    """Read a postprocessed ``.csv`` or filtered ``.tsv`` file into a `SegmentedRecording`."""
+    if not file.exists():
+        return Err(FileExistsError(f"{file} not found"))
+    sep = "\t" if file.suffix == ".tsv" else ","
+    df = pd.read_csv(file, sep=sep, usecols=[*_LABELS, *_SERIES])
+    return Ok(SegmentedRecording.from_df(df))
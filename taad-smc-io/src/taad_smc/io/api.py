@@ -9,7 +9,18 @@ from typing import TYPE_CHECKING
 import pandas as pd
 from pytools.result import Err, Ok
 from taad_smc.tdms.api import import_tdms_data
-
+from taad_smc.tdms.struct import FLOAT_TYPES
+
+from ._cycles import CYCLE_DTYPE, CycleTensor, cycle_tensor
+from ._frame_cache import FRAME_CACHE, frame_cache_dir, load_frame_cache, save_frame_cache
+from ._pyramid import (
+    PYRAMID_SUFFIX,
+    RecordingPyramid,
+    export_pyramid,
+    import_pyramid,
+    pyramid_file,
+)
+from ._recording import SEGMENT_INDEX_DTYPE, SegmentedRecording, import_recording
 from ._search import check_for_files, find_data_subdirectories
 
 # from ._specimen_info import import_specimen_info
@@ -22,17 +33,31 @@ if TYPE_CHECKING:
     from ._types import PROTOCOL_NAMES, SpecimenInfo, TestProtocol
 
 __all__ = [
+    "CYCLE_DTYPE",
+    "FLOAT_TYPES",
+    "FRAME_CACHE",
+    "PYRAMID_SUFFIX",
+    "SEGMENT_INDEX_DTYPE",
     "CachableData",
+    "CycleTensor",
+    "RecordingPyramid",
+    "SegmentedRecording",
     "check_for_files",
     "construct_protocol",
+    "cycle_tensor",
+    "export_pyramid",
     "find_data_subdirectories",
+    "frame_cache_dir",
     "import_df",
+    "import_pyramid",
+    "import_recording",
     "import_specimen_info",
     "import_tdms_data",
     "import_test_protocol",
     "is_all_test_protocols",
     "is_specimen_info",
     "is_test_protocol",
+    "pyramid_file",
     "validate_protocol",
 ]
 
@@ -107,12 +132,21 @@ def import_test_protocol(file: Path) -> Ok[Mapping[str, TestProtocol]] | Err:
 
 
 class CachableData:
-    __slots__ = ("_data", "_file")
+    """A DataFrame read from `file` on first use and kept in memory.
+
+    With a `cache` directory, see `frame_cache_dir`, the first parse also saves the columns
+    there in binary and later instances memory-map them instead of parsing the text again,
+    as long as the size and modification time of `file` are unchanged.
+    """
+
+    __slots__ = ("_cache", "_data", "_file")
     _file: Path
+    _cache: Path | None
     _data: pd.DataFrame | None
 
-    def __init__(self, file: Path) -> None:
+    def __init__(self, file: Path, *, cache: Path | None = None) -> None:
         self._file = file
+        self._cache = cache
         self._data = None
 
     @property
@@ -122,12 +156,18 @@ class CachableData:
     def v(self) -> Ok[pd.DataFrame] | Err:
         if self._data is not None:
             return Ok(self._data)
+        if self._cache is not None and self._file.exists():
+            self._data = load_frame_cache(self._file, self._cache)
+            if self._data is not None:
+                return Ok(self._data)
         match import_df(self._file):
             case Err(e):
                 msg = f"Failed to import data from {self._file}: {e}"
                 return Err(FileExistsError(msg))
             case Ok(df):
                 self._data = df
+                if self._cache is not None:
+                    save_frame_cache(df, self._file, self._cache)
                 return Ok(df)
 
 
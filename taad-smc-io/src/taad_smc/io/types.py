@@ -1,4 +1,4 @@
-from taad_smc.tdms.struct import TDMSData, TDMSMetaData
+from taad_smc.tdms.struct import FLOAT_DTYPES, TDMSData, TDMSMetaData
 
 from ._types import (
     PROTOCOL_NAMES,
@@ -8,6 +8,7 @@ from ._types import (
 )
 
 __all__ = [
+    "FLOAT_DTYPES",
     "PROTOCOLS",
     "PROTOCOL_NAMES",
     "SpecimenInfo",
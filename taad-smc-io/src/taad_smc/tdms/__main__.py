@@ -8,10 +8,7 @@ from typing import TypedDict, Unpack
 from pytools.logging.api import BLogger, XLogger
 from pytools.logging.trait import LOG_LEVEL
 from pytools.result import Err, Ok
-
-from ._nptdms import import_tdms_muscle_typeless
-from ._plot import plot_data
-from .api import export_tdms
+from taad_smc.trace.api import StageTracer
 
 if typing.TYPE_CHECKING:
     from collections.abc import Sequence
@@ -23,6 +20,11 @@ parser = argparse.ArgumentParser(
 parser.add_argument("file", type=str, nargs="+", help="Path to the TDMS file to read.")
 parser.add_argument("--plot", action="store_true", help="Plot the raw data too.")
 parser.add_argument("--overwrite", action="store_true", help="Overwrite existing .raw files.")
+parser.add_argument(
+    "--trace",
+    action="store_true",
+    help="Write the time spent in each stage to <file>_tdms_trace.json.",
+)
 parser.add_argument(
     "--log",
     type=str,
@@ -35,6 +37,7 @@ parser.add_argument(
 class OptionKwargs(TypedDict):
     plot: bool
     overwrite: bool
+    trace: bool
     log: LOG_LEVEL | None
 
 
@@ -51,6 +54,7 @@ def parse_args(args: list[str] | None = None) -> Arguments:
             "plot": parser.parse_args(args).plot,
             "log": parser.parse_args(args).log,
             "overwrite": parser.parse_args(args).overwrite,
+            "trace": parser.parse_args(args).trace,
         },
     }
 
@@ -59,18 +63,32 @@ def main(file: str | Path, **kwargs: Unpack[OptionKwargs]) -> None:
     file = Path(file)
     if file.with_suffix(".raw").exists() and not kwargs.get("overwrite"):
         return
+    # Imported here so that --help and skipped files do not load nptdms.
+    from ._nptdms import import_tdms_muscle_typeless
+    from .api import export_tdms
+
     log_level = kwargs.get("log")
     log = (
         BLogger("BRIEF") if log_level is None else XLogger(log_level, file.with_suffix(".tdms_log"))
     )
     log.brief(f"Reading TDMS file: {file}")
-    match import_tdms_muscle_typeless(file):
-        case Ok(data):
-            export_tdms(data, prefix=file)
-        case Err(e):
-            raise e
+    tracer = StageTracer(log=log)
+    with tracer.stage("read") as span:
+        match import_tdms_muscle_typeless(file):
+            case Ok(data):
+                span.samples = n = len(data.time)
+            case Err(e):
+                raise e
+    with tracer.stage("export", n):
+        export_tdms(data, prefix=file)
     if kwargs.get("plot"):
-        plot_data(data, fout=file.with_suffix(".png"))
+        from ._plot import plot_data
+
+        with tracer.stage("plot", n):
+            plot_data(data, fout=file.with_suffix(".png"))
+    tracer.report()
+    if kwargs.get("trace"):
+        tracer.export(file.with_name(f"{file.stem}_tdms_trace.json"))
     log.brief("Done.")
 
 
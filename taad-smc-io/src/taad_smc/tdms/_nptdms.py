@@ -21,7 +21,9 @@ if TYPE_CHECKING:
 __all__ = ["import_tdms_muscle_typeless"]
 
 
-def import_tdms_muscle_typeless(file: Path) -> Ok[TDMSData[np.float64]] | Err:
+def import_tdms_muscle_typeless[F: np.floating = np.float64](
+    file: Path, *, dtype: type[F] = np.float64
+) -> Ok[TDMSData[F]] | Err:
     if file.suffix != ".tdms":
         msg = f"Unsupported file type: {file.suffix}"
         return Err(ValueError(msg))
@@ -51,8 +53,8 @@ def import_tdms_muscle_typeless(file: Path) -> Ok[TDMSData[np.float64]] | Err:
         force_voltage_range=float(tdms.properties.get("Force Voltage Range")),
         position_voltage_range=float(tdms.properties.get("Position Voltage Range")),
     )
-    force: A1[np.float64] = group["Force"][:].astype(np.float64)
-    disp: A1[np.float64] = group["Position"][:].astype(np.float64)
+    force: A1[F] = group["Force"][:].astype(dtype)
+    disp: A1[F] = group["Position"][:].astype(dtype)
     time = np.arange(0, len(force)) / metadata.daq_rate
     return Ok(
         TDMSData(
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 import matplotlib.pyplot as plt
 import numpy as np
 from pytools.plotting.api import create_figure, update_figure_setting
+from taad_smc.decimate.api import decimate_for_axis
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -25,10 +26,10 @@ def plot_data[F: np.floating](data: TDMSData[F], *, fout: Path) -> None:
     # ax[0].set_ylabel("Force (mN)")
     # ax[1].plot(time, force, "k-", label="Force (mN)")
     # ax[0].plot(time, disp, "k-", label="Strain")
-    ax[0].plot(data.time, data.disp, "k-", label="Strain")
+    ax[0].plot(*decimate_for_axis(ax[0], data.time, data.disp), "k-", label="Strain")
     ax[0].set_xlabel("Time (s)")
     ax[0].set_ylabel("Strain")
-    ax[1].plot(data.time, data.force, "k-", label="Force (mN)")
+    ax[1].plot(*decimate_for_axis(ax[1], data.time, data.force), "k-", label="Force (mN)")
     ax[1].set_xlabel("Time (s)")
     ax[1].set_ylabel("Force (mN)")
     fig.savefig(fout)
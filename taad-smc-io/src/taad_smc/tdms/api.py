@@ -27,7 +27,9 @@ def read_tdms_metadata_from_json(raw: dict[str, Any]) -> Ok[TDMSMetaData] | Err:
     return Ok(TDMSMetaData(**{k.name: raw[k.name] for k in dc.fields(TDMSMetaData)}))
 
 
-def import_tdms_raw(file: Path) -> Ok[TDMSData[np.float64]] | Err:
+def import_tdms_raw[F: np.floating = np.float64](
+    file: Path, *, dtype: type[F] = np.float64
+) -> Ok[TDMSData[F]] | Err:
     if file.suffix != ".raw":
         msg = f"Unsupported file type: {file.suffix}"
         return Err(ValueError(msg))
@@ -48,8 +50,8 @@ def import_tdms_raw(file: Path) -> Ok[TDMSData[np.float64]] | Err:
     return Ok(
         TDMSData(
             time=data_csv[:, 0],
-            disp=data_csv[:, 1],
-            force=data_csv[:, 2],
+            disp=data_csv[:, 1].astype(dtype),
+            force=data_csv[:, 2].astype(dtype),
             command=metadata.command,
             fiber_length=metadata.fiber,
             initial_force=metadata.force,
@@ -84,17 +86,21 @@ def export_tdms[F: np.floating](data: TDMSData[F], *, prefix: Path) -> None:
     )
 
 
-def import_tdms_data(file: Path) -> Ok[TDMSData[np.float64]] | Err:
+def import_tdms_data[F: np.floating = np.float64](
+    file: Path, *, dtype: type[F] = np.float64
+) -> Ok[TDMSData[F]] | Err:
     """Return struct containing the tdms data as numpy arrays.
 
     Parameters
     ----------
     file : Path
         Path to the TDMS file to read.
+    dtype : type[F], Kwarg
+        Working dtype of the displacement and force; the time is always float64.
 
     Returns
     -------
-    TDMSData[np.float64]
+    TDMSData[F]
         Struct containing the TDMS data as numpy arrays.
 
     Note:
@@ -102,12 +108,12 @@ def import_tdms_data(file: Path) -> Ok[TDMSData[np.float64]] | Err:
     provided for compatibility with typed function signatures.
 
     """
-    match import_tdms_muscle_typeless(file):
+    match import_tdms_muscle_typeless(file, dtype=dtype):
         case Ok(data):
             return Ok(data)
         case Err(e):
             msg = f"Failed to import TDMS file {file}: {e}"
-    match import_tdms_raw(file):
+    match import_tdms_raw(file, dtype=dtype):
         case Ok(data):
             return Ok(data)
         case Err(e):
@@ -1,12 +1,20 @@
 import dataclasses as dc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pytools.arrays import A1
 
-__all__ = ["ParsedArgs", "TDMSData", "TDMSMetaData"]
+__all__ = ["FLOAT_DTYPES", "FLOAT_TYPES", "ParsedArgs", "TDMSData", "TDMSMetaData"]
+
+FLOAT_DTYPES = Literal["float32", "float64"]
+FLOAT_TYPES: Mapping[FLOAT_DTYPES, type[np.floating]] = {
+    "float32": np.float32,
+    "float64": np.float64,
+}
 
 
 @dc.dataclass(slots=True, frozen=True)
@@ -31,7 +39,13 @@ class TDMSMetaData:
 
 @dc.dataclass(slots=True)
 class TDMSData[F: np.floating]:
-    time: A1[F]
+    """Channels of a recording in the working dtype `F`.
+
+    The time stays in float64 whatever `F` is: in float32 the sample times of a recording of
+    more than a few minutes can no longer be told apart.
+    """
+
+    time: A1[np.float64]
     disp: A1[F]
     force: A1[F]
     command: float
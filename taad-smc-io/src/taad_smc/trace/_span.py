@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pytools.logging.api import NLOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+
+__all__ = ["Span", "StageTracer", "peak_rss"]
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of the process in bytes."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else 1024 * rss
+
+
+@dc.dataclass(slots=True)
+class Span:
+    """Resources used by one stage.
+
+    `rss_delta` is how much the peak RSS of the process grew during the stage, which is zero
+    when the stage stayed below an earlier high-water mark.
+    """
+
+    name: str
+    samples: int
+    wall: float = 0.0
+    cpu: float = 0.0
+    peak_rss: int = 0
+    rss_delta: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.samples / self.wall if self.wall > 0 else float("inf")
+
+    def __str__(self) -> str:
+        msg = (
+            f"{self.name}: {self.wall:.3f} s wall, {self.cpu:.3f} s cpu,"
+            f" peak RSS {self.peak_rss / 2**20:.0f} MiB (+{self.rss_delta / 2**20:.0f} MiB)"
+        )
+        if self.samples:
+            msg += f", {self.throughput / 1e6:.3g} MS/s"
+        return msg
+
+
+class StageTracer:
+    """Time the stages of a pipeline and report them through the logger.
+
+    Each ``with tracer.stage(name, samples):`` block is logged at info level when it ends; the
+    spans can be written to a JSON trace with `export`.
+    """
+
+    __slots__ = ("_log", "_spans")
+    _log: ILogger
+    _spans: list[Span]
+
+    def __init__(self, *, log: ILogger = NLOGGER) -> None:
+        self._log = log
+        self._spans = []
+
+    @property
+    def spans(self) -> Sequence[Span]:
+        return self._spans
+
+    @contextmanager
+    def stage(self, name: str, samples: int = 0) -> Iterator[Span]:
+        """Record the body of the with statement as the stage `name`.
+
+        The yielded span can be given the number of samples once it is known. The span is
+        recorded and logged even when the body raises.
+        """
+        span = Span(name=name, samples=samples)
+        rss = peak_rss()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield span
+        finally:
+            span.wall = time.perf_counter() - wall
+            span.cpu = time.process_time() - cpu
+            span.peak_rss = peak_rss()
+            span.rss_delta = span.peak_rss - rss
+            self._spans.append(span)
+            self._log.info(str(span))
+
+    def report(self) -> None:
+        """Log the total time and the share of every stage."""
+        total = sum(s.wall for s in self._spans)
+        if not total:
+            return
+        shares = ", ".join(f"{s.name} {s.wall / total:.0%}" for s in self._spans)
+        self._log.brief(f"Finished in {total:.3f} s ({shares}).")
+
+    def asdict(self) -> dict[str, Any]:
+        return {
+            "peak_rss": peak_rss(),
+            "spans": [{**dc.asdict(s), "throughput": s.throughput} for s in self._spans],
+        }
+
+    def export(self, fout: Path) -> None:
+        """Write the recorded spans to `fout` as JSON."""
+        with fout.open("w") as f:
+            json.dump(self.asdict(), f, indent=4)
@@ -0,0 +1,3 @@
+from ._span import Span, StageTracer, peak_rss
+
+__all__ = ["Span", "StageTracer", "peak_rss"]
@@ -2,33 +2,63 @@ from typing import TYPE_CHECKING
 
 from pytools.logging.api import BLogger
 from pytools.path import expand_as_path
-from taad_smc.io.api import import_df
+from taad_smc.trace.api import StageTracer
 
 from ._argparse import options_from_args, parse_args
-from ._filtering import filter_curves
-from ._tools import find_split_points, plot_loop
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from pytools.logging.trait import ILogger
+    from taad_smc.io.types import FLOAT_DTYPES
 
     from ._types import FilterKwargs
 
 
-def main(file: Path, *, fout: str | None, opt: FilterKwargs, log: ILogger) -> None:
+def main(
+    file: Path,
+    *,
+    fout: str | None,
+    opt: FilterKwargs,
+    log: ILogger,
+    workers: int = 1,
+    trace: bool = False,
+    dtype: FLOAT_DTYPES = "float64",
+) -> None:
     log.info(f"Trying out filter for file: {file}")
     if fout and (file.parent / fout).exists():
         log.info(f"Output file {fout} already exists skipping...")
         return
-    df = import_df(file).unwrap()
-    split_points = find_split_points(df, ["protocol", "cycle", "mode"])
-    ff = filter_curves(df, cols=["force", "disp"], index=split_points, **opt).unwrap()
+    # pandas, scipy and matplotlib are only loaded for files that are filtered.
+    from taad_smc.io.api import FLOAT_TYPES, SegmentedRecording, export_pyramid, import_df
+
+    from ._filtering import filter_curves
+    from ._tools import find_split_points, plot_loop
+
+    tracer = StageTracer(log=log)
+    with tracer.stage("import") as span:
+        df = import_df(file).unwrap()
+        span.samples = n = len(df)
+    with tracer.stage("filter_curves", n):
+        split_points = find_split_points(df, ["protocol", "cycle", "mode"])
+        ff = filter_curves(
+            df,
+            cols=["force", "disp"],
+            index=split_points,
+            dtype=FLOAT_TYPES[dtype],
+            **opt,
+        ).unwrap()
     figname = file.with_name(f"Filtered_{opt['method'].capitalize()}.png")
-    plot_loop(df, ff, fout=figname).unwrap()
+    with tracer.stage("plot", n):
+        plot_loop(df, ff, fout=figname, workers=workers).unwrap()
     if fout:
+        with tracer.stage("export", n):
+            ff.to_csv(file.parent / fout, sep="\t", index=False)
+            export_pyramid(SegmentedRecording.from_df(ff), file.parent / fout)
         log.info(f"Exported filtered data to: {fout}")
-        ff.to_csv(file.parent / fout, sep="\t", index=False)
+    tracer.report()
+    if trace:
+        tracer.export(file.with_name(f"{file.stem}_filter_trace.json"))
 
 
 if __name__ == "__main__":
@@ -39,4 +69,12 @@ if __name__ == "__main__":
     if not files:
         log.warn("No input files provided. Exiting.")
     for file in files:
-        main(file, fout=args.export, opt=opts, log=log)
+        main(
+            file,
+            fout=args.export,
+            opt=opts,
+            log=log,
+            workers=args.workers,
+            trace=args.trace,
+            dtype=args.dtype,
+        )
@@ -3,6 +3,7 @@ import dataclasses as dc
 from typing import TYPE_CHECKING, get_args
 
 from pytools.logging.trait import LOG_LEVEL
+from taad_smc.io.types import FLOAT_DTYPES
 
 from ._types import FILTER_METHODS, FilterKwargs
 
@@ -18,6 +19,18 @@ _parser.add_argument("--log", type=str.upper, choices=get_args(LOG_LEVEL))
 _parser.add_argument("--window", type=float, help="Window size for filtering.")
 _parser.add_argument("--method", type=str.lower, choices=get_args(FILTER_METHODS))
 _parser.add_argument("--export", type=str, help="Path to export filtered data.")
+_parser.add_argument("--workers", type=int, help="Number of processes rendering the figures.")
+_parser.add_argument(
+    "--trace",
+    action="store_true",
+    help="Write the time spent in each stage to <file>_filter_trace.json.",
+)
+_parser.add_argument(
+    "--dtype",
+    type=str.lower,
+    choices=get_args(FLOAT_DTYPES),
+    help="Dtype the filtered force and displacement are computed and exported in.",
+)
 
 
 @dc.dataclass(slots=True)
@@ -30,13 +43,24 @@ class ParsedArguments:
     plot: bool
     log: LOG_LEVEL
     export: str | None
+    workers: int
+    trace: bool
+    dtype: FLOAT_DTYPES
 
 
 def parse_args(args: list[str] | None = None) -> ParsedArguments:
     return _parser.parse_args(
         args,
         namespace=ParsedArguments(
-            files=[], method="gaussian", window=101, plot=False, log="INFO", export=None
+            files=[],
+            method="gaussian",
+            window=101,
+            plot=False,
+            log="INFO",
+            export=None,
+            workers=1,
+            trace=False,
+            dtype="float64",
         ),
     )
 
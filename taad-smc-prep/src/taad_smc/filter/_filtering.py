@@ -51,9 +51,14 @@ def filter_curve_segment[F: np.number](
 
 
 def filter_curves_i(
-    df: pd.DataFrame, col: str, index: Iterable[int], **kwargs: Unpack[FilterKwargs]
+    df: pd.DataFrame,
+    col: str,
+    index: Iterable[int],
+    *,
+    dtype: type[np.floating] = np.float64,
+    **kwargs: Unpack[FilterKwargs],
 ) -> Ok[pd.DataFrame] | Err:
-    array = df[[col]].to_numpy(np.float64).flatten()
+    array = df[[col]].to_numpy(dtype).flatten()
     for i, j in pairwise(index):
         match filter_curve_segment(array[i:j], **kwargs):
             case Ok(filtered_segment):
@@ -69,12 +74,17 @@ def filter_curves(
     cols: Iterable[str],
     *,
     index: Iterable[int] | None = None,
+    dtype: type[np.floating] = np.float64,
     **kwargs: Unpack[FilterKwargs],
 ) -> Ok[pd.DataFrame] | Err:
+    """Filter the columns `cols` of `df` separately between consecutive `index` rows.
+
+    The filtered columns are stored in `dtype`.
+    """
     index = (0, len(df)) if index is None else index
     filtered_df = df.copy()
     for c in cols:
-        match filter_curves_i(filtered_df, c, index, **kwargs):
+        match filter_curves_i(filtered_df, c, index, dtype=dtype, **kwargs):
             case Ok(filtered_df):
                 pass
             case Err(e):
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Unpack
 import numpy as np
 from matplotlib import pyplot as plt
 from pytools.plotting.api import create_figure, legend_kwargs, style_kwargs, update_figure_setting
+from taad_smc.decimate.api import decimate_for_axis, decimate_for_logx_axis
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -24,7 +25,7 @@ def semilogx[T: np.number](
     update_figure_setting(fig, **kwargs)
     style = style_kwargs(**kwargs)
     for d in data:
-        ax.semilogx(d.x, d.y, **style)
+        ax.semilogx(*decimate_for_logx_axis(ax, d.x, d.y), **style)
     curve_labels = kwargs.get("curve_labels")
     if curve_labels is not None:
         fig.legend(curve_labels, **legend_kwargs(**kwargs))
@@ -41,7 +42,7 @@ def plotxy[T: np.number](
     update_figure_setting(fig, **kwargs)
     style = style_kwargs(**kwargs)
     for d in data:
-        ax.plot(d.x, d.y, **style)
+        ax.plot(*decimate_for_axis(ax, d.x, d.y), **style)
     curve_labels = kwargs.get("curve_labels")
     if curve_labels is not None:
         fig.legend(curve_labels, **legend_kwargs(**kwargs))
@@ -1,5 +1,5 @@
 # pyright: reportUnknownMemberType=false
-from functools import reduce
+from functools import partial, reduce
 from operator import iand
 from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict, Unpack
 
@@ -7,6 +7,8 @@ import numpy as np
 import pandas as pd
 from pytools.plotting.trait import PlotKwargs
 from pytools.result import Err, Ok
+from taad_smc.decimate.api import resample_logspace
+from taad_smc.plot.api import render_specs
 
 from ._plotting import plotxy, semilogx
 from ._types import PlotData
@@ -38,18 +40,22 @@ def make_semilogplot(
     if not mask.any():
         msg = f"No data found with terms: {terms}"
         return Err(LookupError(msg))
-    df_data = [x for _, x in df[mask].groupby("protocol", sort=False)]
-    ff_data = [x for _, x in ff[mask].groupby("protocol", sort=False)]
+    df_data = [x for _, x in df[mask].groupby("protocol", sort=False, observed=True)]
+    ff_data = [x for _, x in ff[mask].groupby("protocol", sort=False, observed=True)]
     plot_data: Sequence[PlotData[np.float64]] = [
         PlotData(
-            p["time"].to_numpy(np.float64) - p["time"].to_numpy(np.float64).min(),
-            p["force"].to_numpy(np.float64),
+            *resample_logspace(
+                p["time"].to_numpy(np.float64) - p["time"].to_numpy(np.float64).min(),
+                p["force"].to_numpy(np.float64),
+            )
         )
         for p in df_data
     ] + [
         PlotData(
-            p["time"].to_numpy(np.float64) - p["time"].to_numpy(np.float64).min(),
-            p["force"].to_numpy(np.float64),
+            *resample_logspace(
+                p["time"].to_numpy(np.float64) - p["time"].to_numpy(np.float64).min(),
+                p["force"].to_numpy(np.float64),
+            )
         )
         for p in ff_data
     ]
@@ -78,8 +84,8 @@ def make_plotxy(
     if not mask.any():
         msg = f"No data found with terms: {terms}"
         return Err(LookupError(msg))
-    df_data = [x for _, x in df[mask].groupby("protocol", sort=False)]
-    ff_data = [x for _, x in ff[mask].groupby("protocol", sort=False)]
+    df_data = [x for _, x in df[mask].groupby("protocol", sort=False, observed=True)]
+    ff_data = [x for _, x in ff[mask].groupby("protocol", sort=False, observed=True)]
     plot_data: Sequence[PlotData[np.float64]] = [
         PlotData(p["disp"].to_numpy(np.float64), p["force"].to_numpy(np.float64)) for p in df_data
     ] + [PlotData(p["disp"].to_numpy(np.float64), p["force"].to_numpy(np.float64)) for p in ff_data]
@@ -107,8 +113,8 @@ def make_plottime(
     mask = filter_df(df, terms)
     if not mask.any():
         return Err(LookupError(f"No data found with terms: {terms}"))
-    df_data = [x for _, x in df[mask].groupby("protocol", sort=False)]
-    ff_data = [x for _, x in ff[mask].groupby("protocol", sort=False)]
+    df_data = [x for _, x in df[mask].groupby("protocol", sort=False, observed=True)]
+    ff_data = [x for _, x in ff[mask].groupby("protocol", sort=False, observed=True)]
     plot_data: Sequence[PlotData[np.float64]] = [
         PlotData(
             p["time"].to_numpy(np.float64) - p["time"].to_numpy(np.float64).min(),
@@ -177,13 +183,33 @@ PLOTS: Mapping[str, PlotSpec] = {
 }
 
 
-def plot_loop(df: pd.DataFrame, ff: pd.DataFrame, *, fout: Path) -> Ok[None] | Err:
+def _render_spec(
+    frames: Mapping[str, pd.DataFrame],
+    spec: PlotSpec,
+    *,
+    fout: Path,
+    kwargs: PlotKwargs,
+) -> Ok[None] | Err:
+    return make_plot(frames["df"], frames["ff"], spec.terms, fout, spec.mode, **kwargs)
+
+
+def plot_loop(
+    df: pd.DataFrame, ff: pd.DataFrame, *, fout: Path, workers: int = 1
+) -> Ok[Mapping[str, Ok[None] | Err]] | Err:
     # ylim = (df["force"].min() - 23, df["force"].max() + 23)
     kwargs = PlotKwargs(linewidth=0.5, figsize=(8, 3), padleft=0.06, dpi=300)
-    for spec in PLOTS.values():
-        match make_plot(df, ff, spec.terms, fout, spec.mode, **kwargs):
+    if workers > 1:
+        render = partial(_render_spec, fout=fout, kwargs=kwargs)
+        results = render_specs({"df": df, "ff": ff}, PLOTS, render, workers=workers)
+    else:
+        results = {
+            name: make_plot(df, ff, spec.terms, fout, spec.mode, **kwargs)
+            for name, spec in PLOTS.items()
+        }
+    for name, res in results.items():
+        match res:
             case Ok():
-                print("Plot created successfully.")
+                print(f"Plot {name} created successfully.")
             case Err(e):
-                print(f"Plot skipped: {e}")
-    return Ok(None)
+                print(f"Plot {name} skipped: {e}")
+    return Ok(results)
@@ -0,0 +1,101 @@
+"""Run the whole per-specimen pipeline on a cohort with a pool of worker processes.
+
+Every protocol folder found under the cohort goes through tdms, pwlsplit, filter and plot
+after its specimen went through prep, and each specimen is summarized once all of its
+folders are filtered. Stages whose inputs did not change since their last successful run are
+left alone; the run is recorded in ``pipeline_report.json`` in the cohort folder. With
+``--catalog`` the specimens are read from the cohort's catalog, see ``taad_smc.catalog``.
+"""
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import BLogger
+from pytools.logging.trait import LogLevel
+from pytools.result import Err, Ok
+from taad_smc.catalog.api import open_catalog
+
+from ._argparse import parser_cmdline_args
+from ._graph import build_graph
+from ._run import log_results, run_graph, write_results
+from ._state import load_state, save_state
+from ._types import PipelineOptions
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytools.logging.trait import ILogger
+
+    from ._argparse import ParsedArguments
+    from ._types import TaskResult
+
+STATE_FILE = ".taad_pipeline.json"
+REPORT_FILE = "pipeline_report.json"
+
+
+def parser_optional_args(args: ParsedArguments) -> PipelineOptions:
+    return PipelineOptions(
+        stages=args.stages,
+        workers=max(1, args.workers),
+        force=args.force,
+        dry_run=args.dry_run,
+        window=args.smoothing_window,
+        repeat=args.smoothing_repeat,
+        refine=args.refine,
+        filter_method=args.filter_method,
+        filter_window=args.filter_window,
+        dtype=args.dtype,
+        validate=args.validate,
+        catalog=args.catalog,
+        log=LogLevel[args.log],
+    )
+
+
+def main(cohort: Path, opts: PipelineOptions, *, log: ILogger) -> Ok[Sequence[TaskResult]] | Err:
+    log.brief(f"Processing cohort {cohort}")
+    specimens: Sequence[Path] | None = None
+    if opts.catalog:
+        match open_catalog(cohort, log=log):
+            case Ok(catalog):
+                specimens = catalog.specimen_paths()
+                log.info(f"Found {len(specimens)} specimens in the catalog")
+            case Err(e):
+                return Err(e)
+    match build_graph(cohort, opts.stages, specimens=specimens, log=log):
+        case Ok(tasks):
+            log.info(f"Found {len(tasks)} tasks")
+        case Err(e):
+            return Err(e)
+    state = load_state(cohort / STATE_FILE)
+    try:
+        results = run_graph(tasks, state, opts=opts, log=log)
+    finally:
+        if not opts.dry_run:
+            save_state(cohort / STATE_FILE, state)
+    log_results(results, log=log)
+    if not opts.dry_run:
+        write_results(results, cohort / REPORT_FILE)
+    if opts.catalog and not opts.dry_run:
+        match open_catalog(cohort, rescan=True, log=log):
+            case Ok():
+                pass
+            case Err(e):
+                log.warn(f"Failed to refresh the catalog of {cohort}: {e}")
+    return Ok(results)
+
+
+if __name__ == "__main__":
+    args = parser_cmdline_args()
+    opts = parser_optional_args(args)
+    logger = BLogger(args.log)
+    failed = False
+    for cohort in args.cohorts:
+        match main(Path(cohort), opts, log=logger):
+            case Ok(results):
+                failed |= any(r.status == "failed" for r in results)
+            case Err(e):
+                logger.error(f"Failed to process {cohort}: {e}")
+                failed = True
+    if failed:
+        sys.exit(1)
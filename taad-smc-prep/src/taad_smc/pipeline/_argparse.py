@@ -0,0 +1,117 @@
+import argparse
+import dataclasses as dc
+import os
+from typing import get_args
+
+from pytools.logging.trait import LOG_LEVEL
+from taad_smc.filter._types import FILTER_METHODS
+from taad_smc.io.types import FLOAT_DTYPES
+from taad_smc.segment.trait import REFINEMENT_METHODS
+
+from ._types import STAGES
+
+__all__ = ["parser_cmdline_args"]
+
+_parser = argparse.ArgumentParser(
+    description="Run every stage of the pipeline on a cohort of specimens.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_parser.add_argument(
+    "cohorts", type=str, nargs="+", help="Specimen folders, or folders of specimen folders."
+)
+_parser.add_argument(
+    "--stages",
+    type=str.lower,
+    nargs="+",
+    choices=get_args(STAGES),
+    help="Stages to run; the outputs of the other stages must already exist.",
+)
+_parser.add_argument("--workers", type=int, help="Number of worker processes.")
+_parser.add_argument(
+    "--force", action="store_true", help="Rerun every stage, even when it is up to date."
+)
+_parser.add_argument(
+    "--dry-run", action="store_true", help="List the stages that would run without running them."
+)
+_parser.add_argument(
+    "--catalog",
+    action="store_true",
+    help="Take the specimens from the cohort's catalog and refresh it after the run.",
+)
+_parser.add_argument(
+    "--smoothing-window",
+    type=float,
+    help="Smoothing window size for the filtered derivatives.",
+)
+_parser.add_argument(
+    "--smoothing-repeat",
+    type=int,
+    help="Number of times to repeat the smoothing.",
+)
+_parser.add_argument(
+    "--refine",
+    type=str.lower,
+    choices=get_args(REFINEMENT_METHODS),
+    help="Refine breakpoints by coordinate-descent sweeps or by dynamic programming.",
+)
+_parser.add_argument(
+    "--filter-method",
+    type=str.lower,
+    choices=get_args(FILTER_METHODS),
+    help="Filter applied to the segmented curves.",
+)
+_parser.add_argument("--filter-window", type=float, help="Window size of the curve filter.")
+_parser.add_argument(
+    "--dtype",
+    type=str.lower,
+    choices=get_args(FLOAT_DTYPES),
+    help="Working dtype of the pwlsplit and filter stages.",
+)
+_parser.add_argument(
+    "--validate",
+    action="store_true",
+    help="Check float32 segmentations against float64 and fall back to it on mismatch.",
+)
+_parser.add_argument(
+    "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set  log level."
+)
+
+
+@dc.dataclass(slots=True)
+class ParsedArguments:
+    cohorts: list[str]
+    stages: list[STAGES]
+    workers: int
+    force: bool
+    dry_run: bool
+    catalog: bool
+    smoothing_window: float
+    smoothing_repeat: int
+    refine: REFINEMENT_METHODS
+    filter_method: FILTER_METHODS
+    filter_window: float
+    dtype: FLOAT_DTYPES
+    validate: bool
+    log: LOG_LEVEL
+
+
+def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
+    return _parser.parse_args(
+        args,
+        namespace=ParsedArguments(
+            [],
+            stages=list(get_args(STAGES)),
+            workers=os.cpu_count() or 1,
+            force=False,
+            dry_run=False,
+            catalog=False,
+            smoothing_window=50,
+            smoothing_repeat=3,
+            refine="sweep",
+            filter_method="gaussian",
+            filter_window=101,
+            dtype="float64",
+            validate=False,
+            log="INFO",
+        ),
+    )
@@ -0,0 +1,144 @@
+# Copyright (c) 2025 Will Zhang
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+from taad_smc.io.api import find_data_subdirectories
+
+from ._types import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping, Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+
+    from ._types import STAGES
+
+__all__ = ["build_graph", "find_specimens"]
+
+
+def find_specimens(cohort: Path) -> Sequence[Path]:
+    """Return `cohort` if it is a specimen folder, otherwise its specimen subfolders."""
+    if isinstance(find_data_subdirectories(cohort), Ok):
+        return [cohort]
+    return sorted(
+        d for d in cohort.iterdir() if d.is_dir() and isinstance(find_data_subdirectories(d), Ok)
+    )
+
+
+def _recording(folder: Path) -> Path | None:
+    tdms = folder / f"{folder.name}.tdms"
+    if tdms.exists():
+        return tdms
+    raw = tdms.with_suffix(".raw")
+    return raw if raw.exists() else None
+
+
+def _specimen_tasks(home: Path, *, log: ILogger) -> Sequence[Task]:
+    match find_data_subdirectories(home):
+        case Ok(protocols):
+            folders = [f for iterations in protocols.values() for f in iterations.values()]
+        case Err(e):
+            log.warn(f"Skipping {home}: {e}")
+            return []
+    prep = Task(
+        key=f"prep:{home}",
+        stage="prep",
+        target=home,
+        inputs=[home / "key.json"],
+        outputs=[f / name for f in sorted(folders) for name in ("key.json", "protocol.json")],
+        deps=[],
+    )
+    tasks: list[Task] = [prep]
+    filtered: list[Path] = []
+    filters: list[str] = []
+    for folder in sorted(folders):
+        if (recording := _recording(folder)) is None:
+            log.warn(f"No recording found in {folder}, skipping it.")
+            continue
+        csv, tsv = recording.with_suffix(".csv"), folder / "filtered.tsv"
+        if recording.suffix == ".tdms":
+            raw = recording.with_suffix(".raw")
+            tasks.append(
+                Task(
+                    key=f"tdms:{folder}",
+                    stage="tdms",
+                    target=recording,
+                    inputs=[recording],
+                    outputs=[raw, raw.with_suffix(".json")],
+                    deps=[],
+                )
+            )
+        split = Task(
+            key=f"pwlsplit:{folder}",
+            stage="pwlsplit",
+            target=recording,
+            inputs=[recording, folder / "protocol.json", folder / "key.json"],
+            outputs=[csv],
+            deps=[prep.key],
+        )
+        filt = Task(
+            key=f"filter:{folder}",
+            stage="filter",
+            target=csv,
+            inputs=[csv],
+            outputs=[tsv],
+            deps=[split.key],
+        )
+        plot = Task(
+            key=f"plot:{folder}",
+            stage="plot",
+            target=tsv,
+            inputs=[tsv],
+            outputs=[],
+            deps=[filt.key],
+        )
+        tasks.extend((split, filt, plot))
+        filtered.append(tsv)
+        filters.append(filt.key)
+    tasks.append(
+        Task(
+            key=f"summary:{home}",
+            stage="summary",
+            target=home,
+            inputs=[home / "key.json", *filtered],
+            outputs=[home / "summary.png"],
+            deps=filters,
+        )
+    )
+    return tasks
+
+
+def build_graph(
+    cohort: Path,
+    stages: Collection[STAGES],
+    *,
+    specimens: Sequence[Path] | None = None,
+    log: ILogger = NLOGGER,
+) -> Ok[Mapping[str, Task]] | Err:
+    """Return the tasks of every specimen under `cohort`, keyed by `Task.key`.
+
+    The specimen folders are searched for unless `specimens` are given. Only tasks of the
+    requested `stages` are kept. Dependencies on stages that are left out are dropped, their
+    outputs are expected to be present already.
+    """
+    specimens = find_specimens(cohort) if specimens is None else specimens
+    if not specimens:
+        return Err(FileNotFoundError(f"No specimen folders found in {cohort}"))
+    tasks = {
+        t.key: t for home in specimens for t in _specimen_tasks(home, log=log) if t.stage in stages
+    }
+    return Ok(
+        {
+            k: Task(
+                key=t.key,
+                stage=t.stage,
+                target=t.target,
+                inputs=t.inputs,
+                outputs=t.outputs,
+                deps=[d for d in t.deps if d in tasks],
+            )
+            for k, t in tasks.items()
+        }
+    )
@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+import json
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+from taad_smc.filter.__main__ import main as filter_main
+from taad_smc.plot.__main__ import main as plot_main
+from taad_smc.plot._parallel import init_agg_worker
+from taad_smc.prep.__main__ import main as prep_main
+from taad_smc.pwlsplit.__main__ import main as pwlsplit_main
+from taad_smc.pwlsplit._types import SegmentOptions
+from taad_smc.summary.__main__ import main as summary_main
+from taad_smc.tdms.__main__ import main as tdms_main
+from taad_smc.trace.api import StageTracer
+
+from ._state import is_up_to_date, signature
+from ._types import TaskResult
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, MutableMapping, Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import ILogger
+
+    from ._state import Signature
+    from ._types import PipelineOptions, Task
+
+__all__ = ["log_results", "run_graph", "write_results"]
+
+
+def _run_stage(task: Task, opts: PipelineOptions) -> None:
+    match task.stage:
+        case "prep":
+            match prep_main(task.target, log=NLOGGER, overwrite=opts.force):
+                case Ok():
+                    pass
+                case Err(e):
+                    raise e
+        case "tdms":
+            tdms_main(task.target, plot=False, overwrite=True, trace=False)
+        case "pwlsplit":
+            seg_opts = SegmentOptions(
+                plot=False,
+                diagnostics="off",
+                overwrite=True,
+                window=opts.window,
+                repeat=opts.repeat,
+                refine=opts.refine,
+                trace=False,
+                log=opts.log,
+                dtype=opts.dtype,
+                validate=opts.validate,
+            )
+            pwlsplit_main(task.target, seg_opts, log=NLOGGER)
+        case "filter":
+            # The filter CLI skips folders that already have an output.
+            for p in task.outputs:
+                p.unlink(missing_ok=True)
+            filter_main(
+                task.target,
+                fout="filtered.tsv",
+                opt={"method": opts.filter_method, "window": opts.filter_window},
+                log=NLOGGER,
+                dtype=opts.dtype,
+            )
+        case "plot":
+            figures = plot_main(task.target)
+            if not figures:
+                raise FileNotFoundError(f"Nothing plotted from {task.target}")
+            failed: list[str] = []
+            for name, res in figures.items():
+                match res:
+                    case Ok():
+                        pass
+                    # Figures of protocols missing from the recording are skipped, not failed.
+                    case Err(LookupError()):
+                        pass
+                    case Err(e):
+                        failed.append(f"{name}: {e}")
+            if failed:
+                raise RuntimeError("Some figures failed:\n" + "\n".join(failed))
+        case "summary":
+            summary_main(task.target, log=NLOGGER)
+
+
+def _execute(task: Task, opts: PipelineOptions) -> TaskResult:
+    """Run one task in a worker process; failures are returned, never raised."""
+    tracer = StageTracer()
+    try:
+        with tracer.stage(task.stage):
+            _run_stage(task, opts)
+    except Exception as e:  # noqa: BLE001
+        return TaskResult(task.key, "failed", tracer.spans[-1].wall, f"{type(e).__name__}: {e}")
+    missing = [str(p) for p in task.outputs if not p.exists()]
+    if missing:
+        return TaskResult(task.key, "failed", tracer.spans[-1].wall, f"Missing {missing}")
+    return TaskResult(task.key, "done", tracer.spans[-1].wall)
+
+
+def _dependents(tasks: Mapping[str, Task]) -> Mapping[str, Sequence[str]]:
+    dependents: dict[str, list[str]] = {k: [] for k in tasks}
+    for t in tasks.values():
+        for d in t.deps:
+            dependents[d].append(t.key)
+    return dependents
+
+
+def run_graph(
+    tasks: Mapping[str, Task],
+    state: MutableMapping[str, Signature],
+    *,
+    opts: PipelineOptions,
+    log: ILogger = NLOGGER,
+) -> Sequence[TaskResult]:
+    """Run `tasks` on a process pool, each once all of its dependencies completed.
+
+    A task is skipped when a dependency failed, and left alone when it is up to date according
+    to `state`, unless a dependency ran or `opts.force` is set. The input signature of every
+    successful task is recorded in `state`. With `opts.dry_run`, nothing is run and tasks that
+    would run are marked as planned.
+    """
+    dependents = _dependents(tasks)
+    waiting = {k: set(t.deps) for k, t in tasks.items()}
+    ready = deque(k for k, w in waiting.items() if not w)
+    results: dict[str, TaskResult] = {}
+    running: dict[Future[TaskResult], tuple[str, Signature | None]] = {}
+
+    def finish(res: TaskResult) -> None:
+        results[res.key] = res
+        msg = f"{res.status:<10} {res.key}" + (f" ({res.wall:.2f} s)" if res.wall else "")
+        if res.status == "failed":
+            log.error(f"{msg}: {res.error}")
+        else:
+            log.info(msg)
+        for d in dependents[res.key]:
+            waiting[d].discard(res.key)
+            if not waiting[d]:
+                ready.append(d)
+
+    def submit(pool: ProcessPoolExecutor | None, key: str) -> None:
+        task = tasks[key]
+        deps = [results[d] for d in task.deps]
+        if blocked := [r.key for r in deps if r.status in ("failed", "skipped")]:
+            finish(TaskResult(key, "skipped", error=f"{blocked[0]} did not complete"))
+            return
+        sig = signature(task.inputs)
+        stale = opts.force or any(r.status in ("done", "planned") for r in deps)
+        if not stale and is_up_to_date(task, sig, state):
+            finish(TaskResult(key, "up_to_date"))
+        elif pool is None:
+            finish(TaskResult(key, "planned"))
+        else:
+            running[pool.submit(_execute, task, opts)] = (key, sig)
+
+    if opts.dry_run:
+        while ready:
+            submit(None, ready.popleft())
+        return [results[k] for k in tasks]
+    with ProcessPoolExecutor(max_workers=opts.workers, initializer=init_agg_worker) as pool:
+        while ready or running:
+            while ready:
+                submit(pool, ready.popleft())
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, sig = running.pop(future)
+                try:
+                    res = future.result()
+                except Exception as e:  # noqa: BLE001
+                    res = TaskResult(key, "failed", error=f"{type(e).__name__}: {e}")
+                if res.status == "done" and sig is not None:
+                    state[key] = sig
+                finish(res)
+    return [results[k] for k in tasks]
+
+
+def log_results(results: Sequence[TaskResult], *, log: ILogger) -> None:
+    counts = Counter(r.status for r in results)
+    log.brief(", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+    for r in results:
+        if r.status == "failed":
+            log.error(f"{r.key}: {r.error}")
+
+
+def write_results(results: Sequence[TaskResult], fout: Path) -> None:
+    """Write the status, wall time and error of every task, with the count of each status."""
+    report: dict[str, Any] = {
+        "counts": dict(Counter(r.status for r in results)),
+        "wall": sum(r.wall for r in results),
+        "tasks": [dc.asdict(r) for r in results],
+    }
+    with fout.open("w") as f:
+        json.dump(report, f, indent=4)
@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Will Zhang
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from ._types import Task
+
+__all__ = ["Signature", "is_up_to_date", "load_state", "save_state", "signature"]
+
+type Signature = list[tuple[str, int, int]]
+
+
+def signature(paths: Sequence[Path]) -> Signature | None:
+    """Return the path, modification time and size of every file, or None if one is missing."""
+    sig: Signature = []
+    for p in paths:
+        if not p.exists():
+            return None
+        stat = p.stat()
+        sig.append((str(p), stat.st_mtime_ns, stat.st_size))
+    return sig
+
+
+def is_up_to_date(task: Task, sig: Signature | None, state: Mapping[str, Signature]) -> bool:
+    """Return whether `task` last succeeded with the same inputs and its outputs still exist."""
+    if sig is None or state.get(task.key) != sig:
+        return False
+    return all(p.exists() for p in task.outputs)
+
+
+def load_state(file: Path) -> dict[str, Signature]:
+    if not file.exists():
+        return {}
+    with file.open("r") as f:
+        raw: dict[str, list[list[str | int]]] = json.load(f)
+    return {k: [(str(p), int(t), int(s)) for p, t, s in v] for k, v in raw.items()}
+
+
+def save_state(file: Path, state: Mapping[str, Signature]) -> None:
+    with file.open("w") as f:
+        json.dump(state, f, indent=1)
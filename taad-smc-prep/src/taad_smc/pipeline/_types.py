@@ -0,0 +1,57 @@
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from pytools.logging.trait import LogLevel
+    from taad_smc.filter._types import FILTER_METHODS
+    from taad_smc.io.types import FLOAT_DTYPES
+    from taad_smc.segment.trait import REFINEMENT_METHODS
+
+__all__ = ["STAGES", "PipelineOptions", "Task", "TaskResult", "TaskStatus"]
+
+STAGES = Literal["prep", "tdms", "pwlsplit", "filter", "plot", "summary"]
+TaskStatus = Literal["done", "planned", "up_to_date", "failed", "skipped"]
+
+
+@dc.dataclass(slots=True, frozen=True)
+class Task:
+    """One stage applied to one protocol folder, or to a specimen for prep and summary.
+
+    `target` is the path the stage's CLI is given. The task is up to date when every one of
+    `outputs` exists and `inputs` are unchanged since its last successful run.
+    """
+
+    key: str
+    stage: STAGES
+    target: Path
+    inputs: Sequence[Path]
+    outputs: Sequence[Path]
+    deps: Sequence[str]
+
+
+@dc.dataclass(slots=True)
+class TaskResult:
+    key: str
+    status: TaskStatus
+    wall: float = 0.0
+    error: str = ""
+
+
+@dc.dataclass(slots=True)
+class PipelineOptions:
+    stages: Sequence[STAGES]
+    workers: int
+    force: bool
+    dry_run: bool
+    window: float
+    repeat: int
+    refine: REFINEMENT_METHODS
+    filter_method: FILTER_METHODS
+    filter_window: float
+    dtype: FLOAT_DTYPES
+    validate: bool
+    catalog: bool
+    log: LogLevel
@@ -0,0 +1,14 @@
+from ._graph import build_graph, find_specimens
+from ._run import run_graph
+from ._types import STAGES, PipelineOptions, Task, TaskResult, TaskStatus
+
+__all__ = [
+    "STAGES",
+    "PipelineOptions",
+    "Task",
+    "TaskResult",
+    "TaskStatus",
+    "build_graph",
+    "find_specimens",
+    "run_graph",
+]
@@ -0,0 +1,122 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false
+import dataclasses as dc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from concurrent.futures import Future
+
+__all__ = [
+    "SharedFrame",
+    "init_agg_worker",
+    "load_shared_dataframe",
+    "render_specs",
+    "share_dataframe",
+]
+
+
+@dc.dataclass(slots=True, frozen=True)
+class SharedFrame:
+    """Handle to a DataFrame dumped column-wise to `.npy` files.
+
+    Numeric columns are stored as is, every other column as integer codes into
+    `categories`. Only this handle is pickled to worker processes.
+    """
+
+    folder: Path
+    columns: Sequence[str]
+    categories: Mapping[str, Sequence[str]]
+
+
+def share_dataframe(df: pd.DataFrame, folder: Path) -> SharedFrame:
+    folder.mkdir(parents=True, exist_ok=True)
+    categories: dict[str, Sequence[str]] = {}
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_numeric_dtype(values):
+            np.save(folder / f"{col}.npy", values.to_numpy())
+            continue
+        codes, uniques = pd.factorize(values, sort=False)
+        np.save(folder / f"{col}.npy", codes.astype(np.int32))
+        categories[str(col)] = [str(u) for u in uniques]
+    return SharedFrame(folder=folder, columns=[str(c) for c in df.columns], categories=categories)
+
+
+def load_shared_dataframe(shared: SharedFrame) -> pd.DataFrame:
+    """Return a DataFrame whose numeric columns are read-only memory maps."""
+    columns: dict[str, object] = {}
+    for col in shared.columns:
+        values = np.load(shared.folder / f"{col}.npy", mmap_mode="r")
+        match shared.categories.get(col):
+            case None:
+                columns[col] = values
+            case categories:
+                columns[col] = pd.Categorical.from_codes(values, categories=categories)
+    return pd.DataFrame(columns, copy=False)
+
+
+def init_agg_worker() -> None:
+    mpl.use("Agg")
+
+
+def _render_shared[S](
+    render: Callable[[Mapping[str, pd.DataFrame], S], Ok[None] | Err],
+    shared: Mapping[str, SharedFrame],
+    spec: S,
+) -> Ok[None] | Err:
+    return render({k: load_shared_dataframe(v) for k, v in shared.items()}, spec)
+
+
+def _collect(future: Future[Ok[None] | Err]) -> Ok[None] | Err:
+    match future.exception():
+        case None:
+            return future.result()
+        case e:
+            return Err(e)
+
+
+def render_specs[S](
+    frames: Mapping[str, pd.DataFrame],
+    specs: Mapping[str, S],
+    render: Callable[[Mapping[str, pd.DataFrame], S], Ok[None] | Err],
+    *,
+    workers: int,
+) -> Mapping[str, Ok[None] | Err]:
+    """Render independent figure specs concurrently in worker processes.
+
+    Parameters
+    ----------
+    frames : Mapping[str, pd.DataFrame]
+        Data shared by every spec. Each frame is written once to a temporary folder and
+        memory-mapped by the workers instead of being pickled per task.
+    specs : Mapping[str, S]
+        Named figure specifications passed to `render`.
+    render : Callable[[Mapping[str, pd.DataFrame], S], Ok[None] | Err]
+        Picklable module-level function drawing one figure with the Agg backend.
+    workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    Mapping[str, Ok[None] | Err]
+        Result of each spec, keyed like `specs`. Exceptions raised in a worker are
+        returned as `Err`.
+
+    """
+    with TemporaryDirectory(prefix="taad_smc_plot_") as tmp:
+        shared = {k: share_dataframe(v, Path(tmp) / k) for k, v in frames.items()}
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_agg_worker) as pool:
+            futures = {
+                name: pool.submit(_render_shared, render, shared, spec)
+                for name, spec in specs.items()
+            }
+            return {name: _collect(f) for name, f in futures.items()}
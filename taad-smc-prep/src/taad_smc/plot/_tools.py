@@ -0,0 +1,161 @@
+# Copyright (c) 2025 Will Zhang
+# License MIT License
+# pyright: reportUnknownMemberType=false
+from functools import partial
+from typing import TYPE_CHECKING, Literal, NamedTuple, Unpack
+
+from pytools.result import Err, Ok
+from taad_smc.decimate.api import resample_logspace
+from taad_smc.io.api import SegmentedRecording
+
+from ._parallel import render_specs
+from ._plotting import plotxy, semilogx
+from ._types import PlotData
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    import numpy as np
+    import pandas as pd
+    from pytools.plotting.trait import PlotKwargs
+
+
+def make_semilogplot(
+    data: SegmentedRecording,
+    terms: Sequence[str],
+    file: Path,
+    **kwargs: Unpack[PlotKwargs],
+) -> Ok[None] | Err:
+    protocols = data.protocols_matching(*terms)
+    if not protocols:
+        msg = f"No data found with terms: {terms}"
+        return Err(LookupError(msg))
+    segmented_data = [v for p in protocols for v in data.segments(protocol=p)]
+    plot_data: Sequence[PlotData[np.float64]] = [
+        PlotData(*resample_logspace(p.time - p.time.min(), p.force)) for p in segmented_data
+    ]
+    kwargs["xlabel"] = "Time (s)"
+    kwargs["ylabel"] = "Force (mN)"
+    kwargs["curve_labels"] = [p.label()[0] for p in segmented_data]
+    kwargs["padbottom"] = 0.15
+    semilogx(
+        plot_data,
+        file.parent / f"Post_{'_'.join(terms)}_plot.png",
+        **kwargs,
+    )
+    return Ok(None)
+
+
+def make_plotxy(
+    data: SegmentedRecording,
+    terms: Sequence[str],
+    file: Path,
+    **kwargs: Unpack[PlotKwargs],
+) -> Ok[None] | Err:
+    protocols = data.protocols_matching(*terms)
+    if not protocols:
+        msg = f"No data found with terms: {terms}"
+        return Err(LookupError(msg))
+    segmented_data = [v for p in protocols for v in data.segments(protocol=p, cycle="cycle_2")]
+    plot_data = [PlotData(p.disp, p.force) for p in segmented_data]
+    kwargs["xlabel"] = "Strain"
+    kwargs["ylabel"] = "Force (mN)"
+    kwargs["curve_labels"] = [p.label()[0] for p in segmented_data]
+    kwargs["padbottom"] = 0.15
+    plotxy(
+        plot_data,
+        file.parent / f"Post_{'_'.join(terms)}_plot.png",
+        **kwargs,
+    )
+    return Ok(None)
+
+
+def make_plottime(
+    data: SegmentedRecording,
+    terms: Sequence[str],
+    file: Path,
+    **kwargs: Unpack[PlotKwargs],
+) -> Ok[None] | Err:
+    protocols = data.protocols_matching(*terms)
+    if not protocols:
+        return Err(LookupError(f"No data found with terms: {terms}"))
+    segmented_data = [v for p in protocols for v in data.segments(protocol=p)]
+    plot_data = [PlotData(p.time, p.force) for p in segmented_data]
+    kwargs["xlabel"] = "Time (s)"
+    kwargs["ylabel"] = "Force (mN)"
+    kwargs["curve_labels"] = [p.label()[0] for p in segmented_data]
+    kwargs["padbottom"] = 0.15
+    plotxy(
+        plot_data,
+        file.parent / f"Post_{'_'.join(terms)}_plot.png",
+        **kwargs,
+    )
+    return Ok(None)
+
+
+def make_plot(
+    data: SegmentedRecording,
+    terms: Sequence[str],
+    file: Path,
+    mode: Literal["xy", "semilog", "time"],
+    **kwargs: Unpack[PlotKwargs],
+) -> Ok[None] | Err:
+    match mode:
+        case "xy":
+            return make_plotxy(data, terms, file, **kwargs)
+        case "semilog":
+            return make_semilogplot(data, terms, file, **kwargs)
+        case "time":
+            return make_plottime(data, terms, file, **kwargs)
+
+
+class PlotSpec(NamedTuple):
+    terms: Sequence[str]
+    mode: Literal["xy", "semilog", "time"]
+
+
+PLOTS: Mapping[str, PlotSpec] = {
+    "activation_log": PlotSpec(("Activation",), "semilog"),
+    "activation_xy": PlotSpec(("Activation",), "time"),
+    "precondition": PlotSpec(("Preconditioning",), "xy"),
+    "relaxation": PlotSpec(("Relax",), "semilog"),
+    "cycling_30": PlotSpec(("Saw", "30"), "xy"),
+    "cycling_20": PlotSpec(("Saw", "20"), "xy"),
+    "cycling_10": PlotSpec(("Saw", "10"), "xy"),
+    "cycling_slow": PlotSpec(("Saw", "slow"), "xy"),
+    "cycling_mid": PlotSpec(("Saw", "mid"), "xy"),
+    "cycling_fast": PlotSpec(("Saw", "fast"), "xy"),
+}
+
+
+def _render_spec(
+    frames: Mapping[str, pd.DataFrame],
+    spec: PlotSpec,
+    *,
+    file: Path,
+    kwargs: PlotKwargs,
+) -> Ok[None] | Err:
+    data = SegmentedRecording.from_df(frames["data"])
+    return make_plot(data, spec.terms, file, spec.mode, **kwargs)
+
+
+def plot_loop(
+    data: SegmentedRecording, *, file: Path, workers: int = 1
+) -> Mapping[str, Ok[None] | Err]:
+    kwargs: PlotKwargs = {"ylim": (data.force.min() - 25, data.force.max() + 25)}
+    if workers > 1:
+        render = partial(_render_spec, file=file, kwargs=kwargs)
+        results = render_specs({"data": data.to_df()}, PLOTS, render, workers=workers)
+    else:
+        results = {
+            name: make_plot(data, spec.terms, file, spec.mode, **kwargs)
+            for name, spec in PLOTS.items()
+        }
+    for name, res in results.items():
+        match res:
+            case Ok(None):
+                print(f"Plot {name} created successfully.")
+            case Err(msg):
+                print(f"Plot {name} skipped: {msg}")
+    return results
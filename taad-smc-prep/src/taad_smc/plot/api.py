@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from .diagnostics import DIAGNOSTIC_MODES, DiagnosticSink
+
+if TYPE_CHECKING:
+    from ._parallel import SharedFrame, load_shared_dataframe, render_specs, share_dataframe
+
+__all__ = [
+    "DIAGNOSTIC_MODES",
+    "DiagnosticSink",
+    "SharedFrame",
+    "load_shared_dataframe",
+    "render_specs",
+    "share_dataframe",
+]
+
+_PARALLEL = frozenset({"SharedFrame", "load_shared_dataframe", "render_specs", "share_dataframe"})
+
+
+def __getattr__(name: str) -> object:
+    # matplotlib and pandas are only loaded when the rendering helpers are used.
+    if name in _PARALLEL:
+        from . import _parallel
+
+        return getattr(_parallel, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,105 @@
+# Copyright (c) 2025 Will Zhang
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Literal, Self
+
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from types import TracebackType
+
+    from pytools.logging.trait import ILogger
+
+__all__ = ["DIAGNOSTIC_MODES", "DiagnosticSink"]
+
+DIAGNOSTIC_MODES = Literal["off", "inline", "deferred", "background"]
+
+
+class DiagnosticSink:
+    """Collect diagnostic figures away from the processing hot path.
+
+    Callers record a module-level render function together with the (already decimated)
+    data it needs. Depending on `mode` the figure is
+
+    - ``"off"``: dropped without rendering,
+    - ``"inline"``: rendered immediately, as the CLIs used to do,
+    - ``"deferred"``: kept in memory and rendered by `flush`,
+    - ``"background"``: rendered by a worker process while processing continues.
+
+    Use the sink as a context manager so pending figures are rendered on exit.
+    """
+
+    __slots__ = ("_log", "_mode", "_pending", "_pool")
+    _mode: DIAGNOSTIC_MODES
+    _log: ILogger
+    _pending: list[tuple[Callable[..., None], tuple[object, ...], dict[str, object]]]
+    _pool: ProcessPoolExecutor | None
+
+    def __init__(self, mode: DIAGNOSTIC_MODES = "off", *, log: ILogger = NLOGGER) -> None:
+        self._mode = mode
+        self._log = log
+        self._pending = []
+        self._pool = None
+
+    @property
+    def mode(self) -> DIAGNOSTIC_MODES:
+        return self._mode
+
+    @property
+    def enabled(self) -> bool:
+        """Whether recorded figures are ever rendered; skip preparing data if not."""
+        return self._mode != "off"
+
+    def record[**P](self, render: Callable[P, None], /, *args: P.args, **kwargs: P.kwargs) -> None:
+        match self._mode:
+            case "off":
+                return
+            case "inline":
+                render(*args, **kwargs)
+            case "deferred":
+                self._pending.append((render, args, kwargs))
+            case "background":
+                if self._pool is None:
+                    # matplotlib is only loaded once a figure is sent to the worker.
+                    from ._parallel import init_agg_worker
+
+                    self._pool = ProcessPoolExecutor(max_workers=1, initializer=init_agg_worker)
+                future: Future[None] = self._pool.submit(render, *args, **kwargs)
+                future.add_done_callback(self._report)
+
+    def _report(self, future: Future[None]) -> None:
+        if (e := future.exception()) is not None:
+            self._log.warn(f"Diagnostic plot failed: {e}")
+
+    def flush(self) -> Ok[None] | Err:
+        """Render deferred figures and wait for the background worker to finish."""
+        failed: list[str] = []
+        pending, self._pending = self._pending, []
+        for render, args, kwargs in pending:
+            try:
+                render(*args, **kwargs)
+            except (OSError, ValueError, LookupError) as e:
+                failed.append(f"{getattr(render, '__name__', render)}: {e}")
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if failed:
+            return Err(RuntimeError("\n".join(failed)))
+        return Ok(None)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        match self.flush():
+            case Ok():
+                pass
+            case Err(e):
+                self._log.warn(f"Some diagnostic plots failed:\n{e}")
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from pytools.logging.trait import ILogger
 
 
-def main(home: Path, *, log: ILogger, **opts: Unpack[ProgramOptions]) -> None:
+def main(home: Path, *, log: ILogger, **opts: Unpack[ProgramOptions]) -> Ok[None] | Err:
     log.brief(f"Processing folder {home}")
     match find_data_subdirectories(home):
         case Ok(folders):
@@ -24,10 +24,11 @@ def main(home: Path, *, log: ILogger, **opts: Unpack[ProgramOptions]) -> None:
             log.info(pformat(folders))
         case Err(e):
             log.error(f"Failed to find data subdirectories in {home}: {e}")
-            return
+            return Err(e)
     specimen_infokey_loop(filetree, log=log, **opts).unwrap()
     protocol_generation_loop(filetree, log=log, **opts).unwrap()
     log.info(f"Finished processing folder {home}")
+    return Ok(None)
 
 
 if __name__ == "__main__":
@@ -3,62 +3,105 @@ from pprint import pformat
 from typing import TYPE_CHECKING
 
 from pytools.logging.api import BLogger
-
-from pwlsplit.curve.peaks import construct_initial_segmentation
-from pwlsplit.plot import plot_prepped_data
-from pwlsplit.segment.refine import opt_index
+from pytools.logging.trait import LogLevel
+from pytools.result import Err, Ok
+from taad_smc.plot.diagnostics import DiagnosticSink
+from taad_smc.trace.api import StageTracer
 
 from ._argparse import parser_cmdline_args
-from ._io import import_data
-from ._loops import segmentation_loop
-from ._tools import (
-    compile_taadsmc_curves,
-    construct_postprocessed_df,
-    create_names,
-    filter_derivative,
-    parser_optional_args,
-)
+from ._names import create_names
+from ._types import SegmentOptions
 
 if TYPE_CHECKING:
     from pytools.logging.trait import ILogger
 
-    from ._types import SegmentOptions
+    from ._argparse import ParsedArguments
+
+
+def parser_optional_args(args: ParsedArguments) -> SegmentOptions:
+    return SegmentOptions(
+        plot=args.plot,
+        diagnostics=args.diagnostics if args.plot else "off",
+        overwrite=args.overwrite,
+        log=LogLevel[args.log],
+        window=args.smoothing_window,
+        repeat=args.smoothing_repeat,
+        refine=args.refine,
+        trace=args.trace,
+        threads=args.threads,
+        dtype=args.dtype,
+        validate=args.validate,
+        max_shift=args.validate_shift,
+        rtol=args.validate_rtol,
+    )
 
 
-def main(file: Path, opts: SegmentOptions, *, log: ILogger) -> None:
+def main(
+    file: Path, opts: SegmentOptions, *, log: ILogger, sink: DiagnosticSink | None = None
+) -> None:
     log.brief(f"Processing file: {file}")
     log.info("Options:", pformat(opts, sort_dicts=False))
     names = create_names(file).unwrap()
     if names.csv.exists() and not opts.overwrite:
         log.info(f"Output for {file} already exists, skipping...")
         return
+    # scipy, pandas and the pwlsplit plots are only loaded for files that are segmented.
+    from taad_smc.io.api import FLOAT_TYPES
+
+    from ._io import import_data
+    from ._loops import segment_recording
+    from ._precision import compare_segmentations
+    from ._tools import compile_taadsmc_curves, compile_taadsmc_table, construct_postprocessed_df
+
+    tracer = StageTracer(log=log)
     log.info("Importing data...")
-    data, protocol, info = import_data(names, log=log).unwrap()
+    with tracer.stage("import") as span:
+        data, protocol, info = import_data(names, dtype=FLOAT_TYPES[opts.dtype], log=log).unwrap()
+        span.samples = n = len(data.time)
     log.info("Data imported successfully.")
     log.debug(pformat(data, sort_dicts=False))
     log.debug(pformat(info, sort_dicts=False))
     log.debug(pformat(protocol, sort_dicts=False))
-    log.info("Filtering derivative...")
-    prepped_data = filter_derivative(data.disp, window=opts.window, repeat=opts.repeat)
-    log.info("Plotting prepped data...")
-    plot_prepped_data(prepped_data, fout=names.parent / "FindPeaks_prepped.png")
     protocol_map, curves = compile_taadsmc_curves(protocol).unwrap()
+    compiled = compile_taadsmc_table(protocol_map, sample_rate=data.meta.daq_rate)
     log.info("Protocol constructed successfully.")
     log.debug(pformat(protocol_map, sort_dicts=False))
     log.debug(pformat(curves, sort_dicts=False))
-    log.info("Constructing initial segmentation...")
-    segmentation = construct_initial_segmentation(curves).unwrap()
-    log.debug(pformat(segmentation, sort_dicts=False))
-    fparent = names.parent if opts.plot else None
-    segmentation = segmentation_loop(
-        protocol_map, segmentation, prepped_data, log=log, fparent=fparent
+    segmentation = segment_recording(
+        data,
+        compiled,
+        curves,
+        opts=opts,
+        tracer=tracer,
+        log=log,
+        fparent=names.parent,
+        sink=DiagnosticSink("off") if sink is None else sink,
     ).unwrap()
-    log.info("Refining segmentation...")
-    segmentation.idx = opt_index(
-        prepped_data.x, segmentation.idx, window=int(opts.window), max_iter=100, log=log
-    )
-    df = construct_postprocessed_df(data, info, protocol_map, segmentation)
-    df.to_csv(names.csv, index=False)
+    if opts.validate and opts.dtype != "float64":
+        log.info(f"Validating the {opts.dtype} segmentation against float64...")
+        with tracer.stage("validate", n):
+            reference_data, _, _ = import_data(names, log=log).unwrap()
+            reference = segment_recording(
+                reference_data, compiled, curves, opts=opts, tracer=StageTracer(), log=log
+            ).unwrap()
+        match compare_segmentations(
+            reference.idx,
+            segmentation.idx,
+            reference_data.disp,
+            max_shift=opts.max_shift,
+            rtol=opts.rtol,
+        ):
+            case Ok(report):
+                log.info("Segmentation agrees with float64:", pformat(report, sort_dicts=False))
+            case Err(e):
+                log.warn(f"{e}; exporting the float64 segmentation instead.")
+                data, segmentation = reference_data, reference
+    with tracer.stage("export", n):
+        df = construct_postprocessed_df(data, info, compiled, segmentation)
+        df.to_csv(names.csv, index=False)
+    tracer.report()
+    if opts.trace:
+        tracer.export(file.with_name(f"{file.stem}_pwlsplit_trace.json"))
     log.brief(f"Final segmentation (n={len(data.time)}) complete.")
 
 
@@ -69,5 +112,6 @@ if __name__ == "__main__":
     files = [Path(f) for name in args.files for f in Path().glob(name)]
     if not files:
         logger.error("No input files found. with input patterns: ", args.files)
-    for file in files:
-        main(file, opts=opts, log=logger)
+    with DiagnosticSink(opts.diagnostics, log=logger) as sink:
+        for file in files:
+            main(file, opts=opts, log=logger, sink=sink)
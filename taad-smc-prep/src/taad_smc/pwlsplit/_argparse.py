@@ -3,6 +3,9 @@ import dataclasses as dc
 from typing import get_args
 
 from pytools.logging.trait import LOG_LEVEL
+from taad_smc.io.types import FLOAT_DTYPES
+from taad_smc.plot.diagnostics import DIAGNOSTIC_MODES
+from taad_smc.segment.trait import REFINEMENT_METHODS
 
 __all__ = ["parser_cmdline_args"]
 
@@ -12,6 +15,12 @@ _parser = argparse.ArgumentParser(
 )
 _parser.add_argument("files", type=str, nargs="+", help="Path to the TDMS files to split.")
 _parser.add_argument("--plot", action="store_true", help="Plot the split data.")
+_parser.add_argument(
+    "--diagnostics",
+    type=str.lower,
+    choices=get_args(DIAGNOSTIC_MODES),
+    help="How diagnostic figures are rendered when --plot is given.",
+)
 _parser.add_argument(
     "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set  log level."
 )
@@ -25,23 +34,81 @@ _parser.add_argument(
     type=int,
     help="Number of times to repeat the smoothing.",
 )
+_parser.add_argument(
+    "--refine",
+    type=str.lower,
+    choices=get_args(REFINEMENT_METHODS),
+    help="Refine breakpoints by coordinate-descent sweeps or by dynamic programming.",
+)
+_parser.add_argument(
+    "--threads",
+    type=int,
+    help="Threads filtering the derivatives of a file, in chunks of the signal.",
+)
 _parser.add_argument("--overwrite", action="store_true", help="Overwrite existing output files.")
+_parser.add_argument(
+    "--trace",
+    action="store_true",
+    help="Write the time spent in each stage to <file>_pwlsplit_trace.json.",
+)
+_parser.add_argument(
+    "--dtype",
+    type=str.lower,
+    choices=get_args(FLOAT_DTYPES),
+    help="Working dtype of the displacement and force; float32 halves memory traffic.",
+)
+_parser.add_argument(
+    "--validate",
+    action="store_true",
+    help="Segment again in float64 and fall back to it if the breakpoints disagree.",
+)
+_parser.add_argument(
+    "--validate-shift",
+    type=int,
+    help="Largest breakpoint shift in samples accepted by --validate.",
+)
+_parser.add_argument(
+    "--validate-rtol",
+    type=float,
+    help="Largest relative change of the fit residual accepted by --validate.",
+)
 
 
 @dc.dataclass(slots=True)
 class ParsedArguments:
     files: list[str]
     plot: bool
+    diagnostics: DIAGNOSTIC_MODES
     log: LOG_LEVEL
     overwrite: bool
     smoothing_window: float
     smoothing_repeat: int
+    refine: REFINEMENT_METHODS
+    threads: int
+    trace: bool
+    dtype: FLOAT_DTYPES
+    validate: bool
+    validate_shift: int
+    validate_rtol: float
 
 
 def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
     return _parser.parse_args(
         args,
         namespace=ParsedArguments(
-            [], plot=False, log="INFO", overwrite=False, smoothing_window=50, smoothing_repeat=3
+            [],
+            plot=False,
+            diagnostics="background",
+            log="INFO",
+            overwrite=False,
+            smoothing_window=50,
+            smoothing_repeat=3,
+            refine="sweep",
+            threads=1,
+            trace=False,
+            dtype="float64",
+            validate=False,
+            validate_shift=2,
+            validate_rtol=1e-3,
         ),
     )
@@ -24,12 +24,13 @@ def _format_dict(dct: object, indent: int = 2) -> str:
     return pformat(dct, indent=indent, sort_dicts=False)
 
 
-def import_data(
+def import_data[F: np.floating = np.float64](
     names: FileNames,
     *,
+    dtype: type[F] = np.float64,
     log: ILogger = NLOGGER,
-) -> Ok[tuple[TDMSData[np.float64], Mapping[str, TestProtocol], SpecimenInfo]] | Err:
-    match import_tdms_data(names.raw):
+) -> Ok[tuple[TDMSData[F], Mapping[str, TestProtocol], SpecimenInfo]] | Err:
+    match import_tdms_data(names.raw, dtype=dtype):
         case Ok(data):
             log.debug("TDMS data imported successfully.", _format_dict(data))
         case Err(e):
@@ -3,39 +3,121 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 from pytools.result import Err, Ok
+from taad_smc.segment.api import dp_index
 
-from pwlsplit.plot import plot_segmentation_part
+from pwlsplit.curve.peaks import construct_initial_segmentation
+from pwlsplit.plot import plot_prepped_data, plot_segmentation_part
+from pwlsplit.segment.refine import opt_index
 from pwlsplit.segment.split import adjust_segmentation
 
+from ._tools import (
+    decimate_prepped_data,
+    decimate_segmentation,
+    filter_derivative,
+    prepped_envelope_indices,
+)
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
+    from pytools.arrays import A1
     from pytools.logging.trait import ILogger
+    from taad_smc.plot.diagnostics import DiagnosticSink
+    from taad_smc.segment.struct import CompiledProtocol
+    from taad_smc.tdms.struct import TDMSData
+    from taad_smc.trace.api import StageTracer
 
-    from pwlsplit.trait import PreppedData, Segmentation
+    from pwlsplit.trait import PreppedData, Segmentation, SegmentDict
 
-    from ._types import PROTOCOL_MAP
+    from ._types import SegmentOptions
 
 
 def segmentation_loop[F: np.floating, I: np.integer](
-    protocol_map: PROTOCOL_MAP,
+    compiled: CompiledProtocol,
     segmentation: Segmentation[F, I],
     prepped_data: PreppedData[F],
     *,
     log: ILogger,
     fparent: Path | None = None,
+    sink: DiagnosticSink | None = None,
 ) -> Ok[Segmentation[F, I]] | Err:
-    for k, (prot, cycles) in enumerate(protocol_map.items()):
+    protocol_ids = compiled.table["protocol_id"]
+    # Decimated once for the figures of every protocol, see `decimate_segmentation`.
+    plotted: tuple[A1[np.intp], PreppedData[F]] | None = None
+    for k, prot in enumerate(compiled.names):
         log.brief(f"Working on Protocol: {prot}")
-        cycle_idx = sorted({c for cycle in cycles.values() for c in cycle})
+        cycle_idx = (np.flatnonzero(protocol_ids == k) + 1).tolist()
         match adjust_segmentation(prepped_data, segmentation, cycle_idx):
             case Ok(segmentation):
                 log.debug(pformat(segmentation.idx, sort_dicts=False))
-                if fparent is not None:
+                if fparent is not None and sink is not None and sink.enabled:
+                    if plotted is None:
+                        kept = prepped_envelope_indices(prepped_data)
+                        plotted = kept, decimate_prepped_data(prepped_data, kept)
+                    kept, decimated = plotted
                     fig_name = f"FindPeaks_{k}_{prot}_segmentation.png"
-                    plot_segmentation_part(
-                        prepped_data, segmentation, cycle_idx, fout=fparent / fig_name
+                    sink.record(
+                        plot_segmentation_part,
+                        decimated,
+                        decimate_segmentation(segmentation, kept),
+                        cycle_idx,
+                        fout=fparent / fig_name,
                     )
             case Err(e):
                 return Err(e)
     return Ok(segmentation)
+
+
+def segment_recording[F: np.floating](
+    data: TDMSData[F],
+    compiled: CompiledProtocol,
+    curves: Sequence[SegmentDict],
+    *,
+    opts: SegmentOptions,
+    tracer: StageTracer,
+    log: ILogger,
+    fparent: Path | None = None,
+    sink: DiagnosticSink | None = None,
+) -> Ok[Segmentation[F, np.intp]] | Err:
+    """Segment the displacement of `data` and refine its breakpoints, in the dtype of `data`."""
+    n = len(data.time)
+    log.info("Filtering derivative...")
+    with tracer.stage("filter_derivative", n):
+        prepped_data = filter_derivative(
+            data.disp, window=opts.window, repeat=opts.repeat, threads=opts.threads
+        )
+    if fparent is not None and sink is not None and sink.enabled:
+        log.info("Recording prepped data plot...")
+        fout = fparent / "FindPeaks_prepped.png"
+        sink.record(plot_prepped_data, decimate_prepped_data(prepped_data), fout=fout)
+    log.info("Constructing initial segmentation...")
+    with tracer.stage("segmentation", n):
+        match construct_initial_segmentation(curves):
+            case Ok(segmentation):
+                log.debug(pformat(segmentation, sort_dicts=False))
+            case Err(e):
+                return Err(e)
+        match segmentation_loop(
+            compiled, segmentation, prepped_data, log=log, fparent=fparent, sink=sink
+        ):
+            case Ok(segmentation):
+                pass
+            case Err(e):
+                return Err(e)
+    log.info("Refining segmentation...")
+    with tracer.stage("refine", n):
+        match opts.refine:
+            case "sweep":
+                segmentation.idx = opt_index(
+                    prepped_data.x,
+                    segmentation.idx,
+                    window=int(opts.window),
+                    max_iter=100,
+                    log=log,
+                )
+            case "dp":
+                segmentation.idx = dp_index(
+                    prepped_data.x, segmentation.idx, windows=int(opts.window), log=log
+                )
+    return Ok(segmentation)
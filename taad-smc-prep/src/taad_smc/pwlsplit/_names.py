@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pytools.result import Err, Ok
+
+from ._types import FileNames
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def create_names(file: Path) -> Ok[FileNames] | Err:
+    parent = file.parent
+    if not (parent / "protocol.json").exists():
+        return Err(FileExistsError(f"File {parent / 'protocol.json'} does not exist."))
+    if not (parent / "key.json").exists():
+        return Err(FileExistsError(f"File {parent / 'key.json'} does not exist."))
+    return Ok(
+        FileNames(
+            parent=parent,
+            raw=file,
+            csv=file.with_suffix(".csv"),
+            protocol=parent / "protocol.json",
+            info=parent / "key.json",
+        )
+    )
@@ -0,0 +1,50 @@
+# Copyright (c) 2025 Will Zhang
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pytools.result import Err, Ok
+from taad_smc.segment.api import SegmentCost
+
+from ._types import PrecisionReport
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1
+
+__all__ = ["compare_segmentations"]
+
+
+def compare_segmentations[F: np.floating, I: np.integer](
+    reference: A1[I],
+    index: A1[I],
+    data: A1[F],
+    *,
+    max_shift: int,
+    rtol: float,
+) -> Ok[PrecisionReport] | Err:
+    """Check the breakpoints `index` against the float64 breakpoints `reference`.
+
+    Both are scored by the float64 residual of the piecewise-linear interpolant of `data`.
+    Fails when a breakpoint moved by more than `max_shift` samples or when the residual
+    differs from the reference one by more than `rtol`.
+    """
+    if len(index) != len(reference):
+        msg = f"Found {len(index)} breakpoints instead of {len(reference)}"
+        return Err(ValueError(msg))
+    cost = SegmentCost(data)
+    report = PrecisionReport(
+        breakpoints=len(index),
+        max_shift=int(np.abs(index.astype(np.intp) - reference).max(initial=0)),
+        residual=cost.total(index),
+        reference_residual=cost.total(reference),
+    )
+    if report.max_shift > max_shift:
+        msg = f"Breakpoints moved by up to {report.max_shift} samples, tolerance is {max_shift}"
+        return Err(ValueError(msg))
+    drift = abs(report.residual - report.reference_residual)
+    if drift > rtol * max(report.reference_residual, np.finfo(np.float64).tiny):
+        msg = (
+            f"Residual {report.residual:.6g} differs from {report.reference_residual:.6g} "
+            f"by more than {rtol:g}"
+        )
+        return Err(ValueError(msg))
+    return Ok(report)
@@ -1,58 +1,33 @@
+import copy
+from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-from pytools.logging.trait import LogLevel
 from pytools.result import Err, Ok
 from scipy.ndimage import gaussian_filter
-from taad_smc.io.api import construct_protocol
+from taad_smc.decimate.api import minmax_union_indices
+from taad_smc.io.api import SegmentedRecording, construct_protocol
+from taad_smc.segment.api import compile_curves, gaussian_radius, halo_chunked, sample_rows
+from taad_smc.segment.struct import TAADCurve
+from taad_smc.segment.trait import CURVE_SEGMENTS, CurveSegment
 
 from pwlsplit.trait import PreppedData, Segmentation, SegmentDict
 
-from ._types import PROTOCOL_MAP, FileNames, SegmentOptions
+from ._types import PROTOCOL_MAP
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
-    from pathlib import Path
 
+    import pandas as pd
     from pytools.arrays import A1
     from taad_smc.io.types import SpecimenInfo, TestProtocol
+    from taad_smc.segment.struct import CompiledProtocol
     from taad_smc.tdms.struct import TDMSData
 
-    from ._argparse import ParsedArguments
 
-
-def parser_optional_args(args: ParsedArguments) -> SegmentOptions:
-    return SegmentOptions(
-        plot=args.plot,
-        overwrite=args.overwrite,
-        log=LogLevel[args.log],
-        window=args.smoothing_window,
-        repeat=args.smoothing_repeat,
-    )
-
-
-def create_names(file: Path) -> Ok[FileNames] | Err:
-    parent = file.parent
-    if not (parent / "protocol.json").exists():
-        return Err(FileExistsError(f"File {parent / 'protocol.json'} does not exist."))
-    if not (parent / "key.json").exists():
-        return Err(FileExistsError(f"File {parent / 'key.json'} does not exist."))
-    return Ok(
-        FileNames(
-            parent=parent,
-            raw=file,
-            csv=file.with_suffix(".csv"),
-            protocol=parent / "protocol.json",
-            info=parent / "key.json",
-        )
-    )
-
-
-def filter_derivative[F: np.floating](
-    arr: A1[F], *, window: float, repeat: int = 5
-) -> PreppedData[F]:
-    y: A1[F] = arr - arr[0]
+def _derivative_chain[F: np.floating](
+    y: A1[F], *, window: float, repeat: int
+) -> tuple[A1[F], A1[F], A1[F]]:
     for _ in range(repeat):
         y = gaussian_filter(y, sigma=window)
     # y = signal.wiener(y, mysize=int(window)).astype(arr.dtype)
@@ -62,9 +37,53 @@ def filter_derivative[F: np.floating](
     ddy = np.gradient(dy)
     for _ in range(repeat):
         ddy = gaussian_filter(ddy, sigma=window)
+    return y, dy, ddy
+
+
+def filter_derivative[F: np.floating](
+    arr: A1[F], *, window: float, repeat: int = 5, threads: int = 1
+) -> PreppedData[F]:
+    """Smooth `arr` and its first two derivatives, in `threads` halo-chunked threads.
+
+    The result does not depend on `threads`, see `halo_chunked`.
+    """
+    y, dy, ddy = halo_chunked(
+        partial(_derivative_chain, window=window, repeat=repeat),
+        arr - arr[0],
+        halo=3 * repeat * gaussian_radius(window) + 2,
+        outputs=3,
+        threads=threads,
+    )
     return PreppedData(n=len(arr), x=arr, y=y, dy=dy / dy.max(), ddy=ddy / ddy.max())
 
 
+def prepped_envelope_indices[F: np.floating](data: PreppedData[F]) -> A1[np.intp]:
+    """Return the samples on the min/max envelope of any series of `data`."""
+    return minmax_union_indices(data.x, data.y, data.dy, data.ddy)
+
+
+def decimate_prepped_data[F: np.floating](
+    data: PreppedData[F], idx: A1[np.intp] | None = None
+) -> PreppedData[F]:
+    """Keep the samples `idx` of `data`, its `prepped_envelope_indices` by default."""
+    idx = prepped_envelope_indices(data) if idx is None else idx
+    return PreppedData(n=len(idx), x=data.x[idx], y=data.y[idx], dy=data.dy[idx], ddy=data.ddy[idx])
+
+
+def decimate_segmentation[F: np.floating, I: np.integer](
+    segmentation: Segmentation[F, I], idx: A1[np.intp]
+) -> Segmentation[F, I]:
+    """Return a copy of `segmentation` on the samples `idx` kept by `decimate_prepped_data`.
+
+    Every breakpoint moves to the first kept sample at or after it. Only `idx` is copied, the
+    rest is shared with `segmentation`.
+    """
+    part = copy.copy(segmentation)
+    kept = np.minimum(np.searchsorted(idx, segmentation.idx), len(idx) - 1)
+    part.idx = kept.astype(segmentation.idx.dtype)
+    return part
+
+
 def compile_taadsmc_curves(
     protocol: Mapping[str, TestProtocol],
 ) -> Ok[tuple[PROTOCOL_MAP, Sequence[SegmentDict]]] | Err:
@@ -92,30 +111,69 @@ def compile_taadsmc_curves(
     return Ok((protocol_map, curves))
 
 
-def construct_postprocessed_df[F: np.floating, I: np.integer](
+def _segment_template(
+    segments: Sequence[SegmentDict], sample_rate: int
+) -> TAADCurve[np.float64, np.intp]:
+    duration = np.array([s.get("time", 0.0) for s in segments], dtype=np.float64)
+    delta = np.array([s.get("delta", 0.0) for s in segments], dtype=np.float64)
+    time = np.concatenate(([0.0], np.cumsum(duration)))
+    return TAADCurve(
+        nth=0,
+        idx=np.rint(time * sample_rate).astype(np.intp),
+        order=np.arange(len(segments) + 1, dtype=np.intp),
+        time=time,
+        disp=np.concatenate(([0.0], np.cumsum(delta))),
+        slope=np.divide(delta, duration, out=np.zeros_like(delta), where=duration > 0),
+        curve=[CurveSegment(s["curve"]) for s in segments],
+    )
+
+
+def compile_taadsmc_table(protocol_map: PROTOCOL_MAP, *, sample_rate: int) -> CompiledProtocol:
+    """Compile the protocol map into the breakpoint table shared with `taad_smc.segment`.
+
+    Holds have no nominal duration, so `time` and `idx` only count the ramps. Row `k` of the
+    table is segment ``k + 1`` of the pwlsplit segmentation.
+    """
+    first_cycles = {p: next(iter(c.values())) for p, c in protocol_map.items() if c}
+    templates = {
+        p: (_segment_template(list(segments.values()), sample_rate), len(protocol_map[p]))
+        for p, segments in first_cycles.items()
+    }
+    return compile_curves(templates, sample_rate=sample_rate)
+
+
+def construct_segmented_recording[F: np.floating, I: np.integer](
     data: TDMSData[F],
     info: SpecimenInfo,
-    protocol_map: PROTOCOL_MAP,
+    compiled: CompiledProtocol,
     index: Segmentation[F, I],
-) -> pd.DataFrame:
-    protocols = np.empty_like(data.time, dtype="U20")
-    cycle = np.empty_like(data.time, dtype="U20")
-    mode = np.empty_like(data.time, dtype="U20")
-    for p, cycles in protocol_map.items():
-        for c, segments in cycles.items():
-            for ix, seg in segments.items():
-                slice_ix = slice(index.idx[ix - 1], index.idx[ix])
-                protocols[slice_ix] = p.encode("utf-8")
-                cycle[slice_ix] = c.encode("utf-8")
-                mode[slice_ix] = seg["curve"].encode("utf-8")
+) -> SegmentedRecording:
+    table = compiled.table
+    rows = sample_rows(index.idx, len(table), len(data.time))
+    inside = rows >= 0
+    n_cycles = int(table["cycle"].max(initial=0)) + 1
     disp = (data.disp + 0.5 * info["strain"]) * info["input_length_mm"] / info["actual_length_mm"]
-    return pd.DataFrame(
-        {
-            "protocol": protocols,
-            "cycle": cycle,
-            "mode": mode,
-            "time": data.time,
-            "disp": disp,
-            "force": data.force,
-        },
+    return SegmentedRecording.from_codes(
+        data.time,
+        disp,
+        data.force,
+        labels=(
+            np.where(inside, table["protocol_id"][rows], -1),
+            np.where(inside, table["cycle"][rows], -1),
+            np.where(inside, table["kind"][rows].astype(np.intp), -1),
+        ),
+        names=(
+            compiled.names,
+            [f"cycle_{i}" for i in range(n_cycles)],
+            [c.value for c in CURVE_SEGMENTS],
+        ),
     )
+
+
+def construct_postprocessed_df[F: np.floating, I: np.integer](
+    data: TDMSData[F],
+    info: SpecimenInfo,
+    compiled: CompiledProtocol,
+    index: Segmentation[F, I],
+) -> pd.DataFrame:
+    return construct_segmented_recording(data, info, compiled, index).to_df()
@@ -11,15 +11,26 @@ if TYPE_CHECKING:
 
     from pytools.arrays import A1
     from pytools.logging.trait import LogLevel
+    from taad_smc.io.types import FLOAT_DTYPES
+    from taad_smc.plot.diagnostics import DIAGNOSTIC_MODES
+    from taad_smc.segment.trait import REFINEMENT_METHODS
 
 
 @dc.dataclass(slots=True)
 class SegmentOptions:
     plot: bool
+    diagnostics: DIAGNOSTIC_MODES
     overwrite: bool
     window: float
     repeat: int
+    refine: REFINEMENT_METHODS
+    trace: bool
     log: LogLevel
+    dtype: FLOAT_DTYPES = "float64"
+    validate: bool = False
+    max_shift: int = 2
+    rtol: float = 1e-3
+    threads: int = 1
 
 
 @dc.dataclass(slots=True)
@@ -31,6 +42,16 @@ class FileNames:
     info: Path
 
 
+@dc.dataclass(slots=True, frozen=True)
+class PrecisionReport:
+    """Agreement of a segmentation with the one computed in float64."""
+
+    breakpoints: int
+    max_shift: int
+    residual: float
+    reference_residual: float
+
+
 @dc.dataclass(slots=True)
 class DataSeries[F: np.floating]:
     x: A1[F]
@@ -6,68 +6,128 @@ from typing import TYPE_CHECKING
 
 from pytools.logging.api import NLOGGER, BLogger
 from pytools.result import Err, Ok
-from taad_smc.segment._refinement import opt_index
+from taad_smc.plot.diagnostics import DiagnosticSink
+from taad_smc.segment._refinement import dp_index, opt_index
+from taad_smc.trace.api import StageTracer
 
-from ._index import find_first_index, get_index_list
-from ._io import construct_postprocessed_df, import_data
+from ._cost import SegmentCost
 from ._parser import parser
-from ._plotting import plot_filtered
-from ._protocol import create_curves, generate_tags
-from ._segment import filtered_derivatives, segment_duration
+from ._protocol import compile_protocol, protocol_nodes
 
 if TYPE_CHECKING:
     from pytools.logging.trait import ILogger
 
-    from .trait import Arguments
+    from .trait import REFINEMENT_METHODS, SEGMENTATION_ENGINES, Arguments
 
 
 def parse_cli_args(args: list[str] | None = None) -> Arguments:
     """Parse command line arguments."""
-    files = [v for val in parser.parse_args(args).file for v in Path().glob(val)]
-    return {"file": files}
+    parsed = parser.parse_args(args)
+    files = [v for val in parsed.file for v in Path().glob(val)]
+    return {
+        "file": files,
+        "diagnostics": parsed.diagnostics if parsed.plot else "off",
+        "engine": parsed.engine,
+        "refine": parsed.refine,
+        "threads": parsed.threads,
+        "trace": parsed.trace,
+    }
 
 
-def main(file: Path, *, log: ILogger = NLOGGER) -> None:
+def main(
+    file: Path,
+    *,
+    engine: SEGMENTATION_ENGINES = "peaks",
+    refine: REFINEMENT_METHODS = "sweep",
+    threads: int = 1,
+    trace: bool = False,
+    sink: DiagnosticSink | None = None,
+    log: ILogger = NLOGGER,
+) -> None:
     log.info(f"Processing file: {file}")
     if file.with_suffix(".csv").exists():
         log.info(f"Output for {file} already exists, skipping...")
         return
-    match import_data(file, log=log):
-        case Err(e):
-            raise e
-        case Ok((data, protocol)):
-            pass
+    # scipy, pandas and matplotlib are only loaded for files that are segmented.
+    from ._index import find_first_index, get_compiled_index_list
+    from ._io import construct_postprocessed_df, import_data
+    from ._plotting import decimate_series, plot_filtered
+    from ._segment import filtered_derivatives, segment_nodes
+    from ._template import template_segmentation
+
+    tracer = StageTracer(log=log)
+    with tracer.stage("import") as span:
+        match import_data(file, log=log):
+            case Err(e):
+                raise e
+            case Ok((data, protocol)):
+                span.samples = n = len(data.time)
     if not protocol:
         log.info(f"Protocol is empty for {file}, skipping...")
         return
     data.disp = data.disp - data.disp[0]
-    filtered_data = filtered_derivatives(data.time, data.disp, smoothing_window=50, repeat=5)
-    plot_filtered(filtered_data, fout=file.parent / "filtered_plot.png")
-    first_idx = find_first_index(filtered_data.x, tol=1e-2, log=log)
-    curves = create_curves(protocol, start_idx=first_idx, log=log)
-    log.debug("Curves created successfully.", pformat(curves, indent=2, sort_dicts=False))
-    curves_tags = generate_tags(curves)
-    main_index = get_index_list(curves, length=filtered_data.x.size, log=log)
-    log.debug("Main index created successfully.", pformat(main_index, indent=2, sort_dicts=False))
-    for k, v in curves.items():
-        log.info(f"Processing {k} with {len(v)} curves.")
-        main_index = segment_duration(
-            filtered_data,
-            v,
-            main_index,
-            fout=file.parent / f"Findpeak_{k}_transition.png",
-            log=log,
+    with tracer.stage("filter_derivative", n):
+        filtered_data = filtered_derivatives(
+            data.time, data.disp, smoothing_window=50, repeat=5, threads=threads
         )
+    sink = DiagnosticSink("off") if sink is None else sink
+    if sink.enabled:
+        fout = file.parent / "filtered_plot.png"
+        sink.record(plot_filtered, decimate_series(filtered_data), fout=fout)
+    with tracer.stage("segmentation", n):
+        match engine:
+            case "template":
+                compiled, main_index = template_segmentation(filtered_data, protocol, log=log)
+            case "peaks":
+                first_idx = find_first_index(filtered_data.x, tol=1e-2, log=log)
+                compiled = compile_protocol(protocol, start_idx=first_idx, log=log)
+                main_index = get_compiled_index_list(compiled, length=filtered_data.x.size, log=log)
+                log.debug(
+                    "Main index created successfully.",
+                    pformat(main_index, indent=2, sort_dicts=False),
+                )
+                for k in protocol:
+                    nodes = protocol_nodes(compiled, k)
+                    log.info(f"Processing {k} with {len(nodes) - 1} segments.")
+                    main_index = segment_nodes(
+                        filtered_data,
+                        nodes,
+                        main_index,
+                        fout=file.parent / f"Findpeak_{k}_transition.png",
+                        sink=sink,
+                        log=log,
+                    )
     log.debug(f"final protocol {len(data.time)}:", format(main_index.idx))
     log.info("Optimizing main index...")
-    new_index = opt_index(data.disp, main_index.idx, windows=50, log=log)
-    main_index.idx = new_index
-    df = construct_postprocessed_df(data, main_index, curves_tags)
-    df.to_csv(file.with_suffix(".csv"), index=False)
+    with tracer.stage("refine", n):
+        match refine:
+            case "sweep":
+                main_index.idx = opt_index(data.disp, main_index.idx, windows=50, log=log)
+            case "dp":
+                main_index.idx = dp_index(data.disp, main_index.idx, windows=50, log=log)
+    if trace:
+        # A full pass over the recording, only worth it when the run is being inspected.
+        residual = SegmentCost(data.disp).total(main_index.idx)
+        log.info(f"Residual of the refined segmentation: {residual:.6g}")
+    with tracer.stage("export", n):
+        df = construct_postprocessed_df(data, main_index, compiled)
+        df.to_csv(file.with_suffix(".csv"), index=False)
+    tracer.report()
+    if trace:
+        tracer.export(file.with_name(f"{file.stem}_segment_trace.json"))
 
 
 if __name__ == "__main__":
     args = parse_cli_args()
     log = BLogger("INFO")
-    for file in args["file"]:
-        main(file, log=log)
+    with DiagnosticSink(args["diagnostics"], log=log) as sink:
+        for file in args["file"]:
+            main(
+                file,
+                engine=args["engine"],
+                refine=args["refine"],
+                threads=args["threads"],
+                trace=args["trace"],
+                sink=sink,
+                log=log,
+            )
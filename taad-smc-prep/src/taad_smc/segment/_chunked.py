@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Will Zhang
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pytools.arrays import A1
+
+__all__ = ["gaussian_radius", "halo_chunked"]
+
+
+def gaussian_radius(sigma: float, truncate: float = 4.0) -> int:
+    """Return the half width of the kernel of ``scipy.ndimage.gaussian_filter1d``."""
+    return int(truncate * float(sigma) + 0.5)
+
+
+def halo_chunked[F: np.floating](
+    chain: Callable[[A1[F]], Sequence[A1[F]]],
+    x: A1[F],
+    *,
+    halo: int,
+    outputs: int,
+    threads: int = 1,
+) -> Sequence[A1[F]]:
+    """Run `chain` on overlapping chunks of `x` in `threads` threads and stitch its outputs.
+
+    Every sample of the `outputs` series returned by `chain` must only depend on the input
+    samples at most `halo` away. Chunks are extended by `halo` samples on both sides, so the
+    part of a chunk that is kept sees the same inputs as in ``chain(x)`` and the stitched
+    series are bit-identical to it. The ``scipy.ndimage`` filters release the GIL while they
+    run, so the chunks filter concurrently.
+    """
+    n = len(x)
+    # Chunks shorter than a few halos spend most of their time on the overlap.
+    chunks = min(threads, n // max(4 * halo, 1))
+    if chunks <= 1:
+        return chain(x)
+    out = [np.empty(n, dtype=x.dtype) for _ in range(outputs)]
+    bounds = np.linspace(0, n, chunks + 1).astype(np.intp)
+
+    def run(start: int, stop: int) -> None:
+        lo, hi = max(start - halo, 0), min(stop + halo, n)
+        for series, chunk in zip(out, chain(x[lo:hi]), strict=True):
+            series[start:stop] = chunk[start - lo : stop - lo]
+
+    with ThreadPoolExecutor(max_workers=chunks) as pool:
+        list(pool.map(run, bounds[:-1].tolist(), bounds[1:].tolist()))
+    return out
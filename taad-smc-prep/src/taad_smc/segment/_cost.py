@@ -0,0 +1,55 @@
+# Copyright (c) 2025 Will Zhang
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1
+
+__all__ = ["SegmentCost"]
+
+
+class SegmentCost:
+    """Least-squares cost of linearly interpolating a signal between two samples.
+
+    Built once per signal in O(N) from the cumulative sums of y, y^2 and t*y. The cost of any
+    segment ``[i, j]`` is then O(1), so breakpoint searches no longer depend on the signal
+    length. Sums over the sample offset ``t - i`` and its square use closed forms, which avoids
+    the cancellation of cumulative t^2 sums on long recordings.
+    """
+
+    __slots__ = ("_sty", "_sy", "_syy", "_y")
+    _y: A1[np.float64]
+    _sy: A1[np.float64]
+    _syy: A1[np.float64]
+    _sty: A1[np.float64]
+
+    def __init__[F: np.floating](self, data: A1[F]) -> None:
+        self._y = data.astype(np.float64)
+        t = np.arange(len(data), dtype=np.float64)
+        self._sy, self._syy, self._sty = (
+            np.concatenate(([0.0], np.cumsum(v))) for v in (self._y, self._y**2, t * self._y)
+        )
+
+    def __len__(self) -> int:
+        return len(self._y)
+
+    def segment[I: np.integer](self, i: A1[I], j: A1[I]) -> A1[np.float64]:
+        """Squared residual of the chord from ``y[i]`` to ``y[j]`` over ``y[i:j + 1]``.
+
+        `i` and `j` broadcast against each other; pairs with ``i > j`` are meaningless.
+        """
+        sy, syy, sty = (s[j + 1] - s[i] for s in (self._sy, self._syy, self._sty))
+        length = np.asarray(j - i, dtype=np.float64)
+        n = length + 1
+        s_tau = length * n / 2
+        s_tau2 = length * n * (2 * length + 1) / 6
+        s_tauy = sty - i * sy
+        a = self._y[i]
+        b = np.divide(self._y[j] - a, length, out=np.zeros_like(length), where=length > 0)
+        return syy - 2 * a * sy - 2 * b * s_tauy + n * a * a + 2 * a * b * s_tau + b * b * s_tau2
+
+    def total[I: np.integer](self, index: A1[I]) -> float:
+        """Residual of the piecewise-linear interpolant through ``y[index]``."""
+        index = np.minimum(index, len(self._y) - 1)
+        return float(self.segment(index[:-1], index[1:]).sum())
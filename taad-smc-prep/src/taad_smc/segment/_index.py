@@ -7,7 +7,7 @@ from pytools.logging.api import NLOGGER
 from scipy.ndimage import gaussian_filter1d
 
 from .struct import Segmentation, TAADCurve
-from .trait import CurvePoint, CurveSegment
+from .trait import CURVE_SEGMENTS, CurvePoint, CurveSegment
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
     from pytools.arrays import A1
     from pytools.logging.trait import ILogger
 
+    from .struct import CompiledProtocol
+
 
 def _is_peak(
     left: CurveSegment,
@@ -86,6 +88,45 @@ def get_index_list[F: np.floating, I: np.integer](
     )
 
 
+def get_compiled_index_list(
+    compiled: CompiledProtocol,
+    length: int,
+    *,
+    log: ILogger = NLOGGER,
+) -> Segmentation[np.intp, np.float64]:
+    """Vectorized `get_index_list` for a protocol compiled with its "Start" and "End" holds.
+
+    Breakpoint `i` of the result is the start of row `i` of the table, so the nodes returned
+    by `protocol_nodes` index directly into it.
+    """
+    table = compiled.table
+    index = np.append(table["idx"], length).astype(np.intp)
+    left, right = table["kind"][:-1], table["kind"][1:]
+    hold = CURVE_SEGMENTS.index(CurveSegment.HOLD)
+    if np.any((left == hold) & (right == hold)):
+        msg = "Consecutive 'Hold' segments found."
+        raise ValueError(msg)
+    peaks = (right == CURVE_SEGMENTS.index(CurveSegment.STRETCH)) | (
+        (right == hold) & (left == CURVE_SEGMENTS.index(CurveSegment.RECOVER))
+    )
+    kinds = [
+        CurvePoint.VALLEY,
+        *[CurvePoint.PEAK if p else CurvePoint.VALLEY for p in peaks],
+        CurvePoint.VALLEY,
+    ]
+    rates = np.zeros(len(index), dtype=np.float64)
+    rates[1:-1] = compiled.sample_rate * np.diff(table["slope"])
+    rates = rates / rates.max()
+    log.info("Last index:", index[-1])
+    log.debug(
+        f"Main index (n = {len(index)}):",
+        pformat(index, indent=2, sort_dicts=False),
+        f"kinds (n = {len(kinds)}):",
+        pformat(kinds, indent=2, sort_dicts=False),
+    )
+    return Segmentation(idx=index, kind=kinds, rate=rates)
+
+
 def find_first_index[F: np.floating](
     arr: A1[F],
     *,
@@ -12,13 +12,16 @@ from taad_smc.segment.trait import OldProtocol
 from taad_smc.tdms._nptdms import import_tdms_muscle_typeless
 from taad_smc.tdms.api import import_tdms_raw
 
+from ._protocol import sample_rows
+from .trait import CURVE_SEGMENTS
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Mapping
 
     from pytools.logging.trait import ILogger
     from taad_smc.tdms.struct import TDMSData
 
-    from .struct import Segmentation
+    from .struct import CompiledProtocol, Segmentation
     from .trait import TestProtocol
 
 
@@ -104,20 +107,24 @@ def import_data(
 def construct_postprocessed_df[F: np.floating, I: np.integer](
     data: TDMSData[F],
     index: Segmentation[I, F],
-    tags: Sequence[tuple[str, int, str]],
+    compiled: CompiledProtocol,
 ) -> pd.DataFrame:
-    protocols = np.empty(len(data.time), dtype="U20")
-    cycle = np.zeros_like(data.time, dtype=np.intp)
-    mode = np.empty(len(data.time), dtype="U20")
-    for k, start, end in zip(tags, index.idx, index.idx[1:], strict=False):
-        protocols[start:end] = k[0].encode("utf-8")
-        cycle[start:end] = k[1]
-        mode[start:end] = k[2].encode("utf-8")
+    table = compiled.table
+    rows = sample_rows(index.idx, len(table), len(data.time))
+    inside = rows >= 0
+    # "Start" and "End" keep the "Hold" label used by `generate_tags`
+    modes = [*(c.value for c in CURVE_SEGMENTS), "Hold"]
+    mode_codes = table["kind"].astype(np.intp)
+    mode_codes[[0, -1]] = len(CURVE_SEGMENTS)
     return pd.DataFrame(
         {
-            "protocol": protocols,
-            "cycle": cycle,
-            "mode": mode,
+            "protocol": pd.Categorical.from_codes(
+                np.where(inside, table["protocol_id"][rows], -1), categories=compiled.names
+            ),
+            "cycle": np.where(inside, table["cycle"][rows], 0).astype(np.intp),
+            "mode": pd.Categorical.from_codes(
+                np.where(inside, mode_codes[rows], -1), categories=modes
+            ),
             "time": data.time,
             "disp": data.disp - data.disp[0],
             "force": data.force,
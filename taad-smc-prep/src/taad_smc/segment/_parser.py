@@ -1,6 +1,44 @@
 import argparse
+from typing import get_args
+
+from taad_smc.plot.diagnostics import DIAGNOSTIC_MODES
+
+from .trait import REFINEMENT_METHODS, SEGMENTATION_ENGINES
 
 parser = argparse.ArgumentParser(
     description="Read a TDMS file and print its contents.",
 )
 parser.add_argument("file", type=str, nargs="+", help="Path to the TDMS file to read.")
+parser.add_argument("--plot", action="store_true", help="Save the diagnostic figures.")
+parser.add_argument(
+    "--diagnostics",
+    type=str.lower,
+    default="background",
+    choices=get_args(DIAGNOSTIC_MODES),
+    help="How diagnostic figures are rendered when --plot is given.",
+)
+parser.add_argument(
+    "--engine",
+    type=str.lower,
+    default="peaks",
+    choices=get_args(SEGMENTATION_ENGINES),
+    help="Locate transitions by peak detection or by matching the protocol waveform.",
+)
+parser.add_argument(
+    "--refine",
+    type=str.lower,
+    default="sweep",
+    choices=get_args(REFINEMENT_METHODS),
+    help="Refine breakpoints by coordinate-descent sweeps or by dynamic programming.",
+)
+parser.add_argument(
+    "--threads",
+    type=int,
+    default=1,
+    help="Threads filtering the derivatives of a file, in chunks of the signal.",
+)
+parser.add_argument(
+    "--trace",
+    action="store_true",
+    help="Write the stage times to <file>_segment_trace.json and log the final residual.",
+)
@@ -1,9 +1,13 @@
 # pyright: reportUnknownMemberType = false
+import dataclasses as dc
 from typing import TYPE_CHECKING
 
 import numpy as np
 from matplotlib import pyplot as plt
 from pytools.plotting.api import create_figure, update_figure_setting
+from taad_smc.decimate.api import minmax_union_indices
+
+from .struct import DataSeries
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -11,7 +15,29 @@ if TYPE_CHECKING:
 
     from pytools.arrays import A1
 
-    from .struct import DataSeries, Segmentation, Split
+    from .struct import Segmentation, Split
+
+
+@dc.dataclass(slots=True)
+class TransitionDiagnostic[F: np.floating]:
+    """Decimated data needed to draw the transition figure of one protocol."""
+
+    x: A1[F]
+    y: A1[F]
+    z: A1[F]
+    slope: A1[F]
+    inflection: A1[F]
+    split_x: A1[F]
+    split_y: A1[F]
+    split_z: A1[F]
+    xlim: tuple[float, float]
+
+
+def decimate_series[F: np.floating](data: DataSeries[F]) -> DataSeries[F]:
+    idx = minmax_union_indices(data.y, data.z, data.dz, data.ddz)
+    return DataSeries(
+        x=data.x[idx], y=data.y[idx], z=data.z[idx], dz=data.dz[idx], ddz=data.ddz[idx]
+    )
 
 
 def plot_filtered[F: np.floating](
@@ -33,51 +59,62 @@ def plot_filtered[F: np.floating](
     plt.close(fig)
 
 
-def plot_transition[F: np.floating, I: np.integer](
+def prepare_transition[F: np.floating, I: np.integer](
     data: DataSeries[F],
     nodes: A1[I],
     seg: Segmentation[I, F],
     splits: Sequence[Split],
-    *,
-    fout: Path,
-) -> None:
+) -> TransitionDiagnostic[F]:
     split_indicies = np.array([s.idx for s in splits], dtype=np.intp)
-    i_start = (seg.idx[nodes.min()] + seg.idx[nodes.min() - 1]) // 2
+    i_start = int((seg.idx[nodes.min()] + seg.idx[nodes.min() - 1]) // 2)
     i_end = min(int(seg.idx[min(nodes.max() + 1, len(seg.idx) - 1)]), len(data.x) - 1)
-    print("i_start:", i_start, "i_end:", i_end)
-    start = data.x[int(i_start)]
-    end = data.x[min(int(i_end), len(data.x) - 1)]
-    # end = data.x[-1]
-    fig, ax = create_figure(4, figsize=(10, 8), dpi=180)
     rates = np.absolute(seg.rate[nodes]).min()
-    relative_data = np.zeros_like(data.ddz)
-    relative_data[i_start:] = data.ddz[i_start:] / rates
+    window = slice(i_start, i_end + 1)
+    slope = data.dz[window] / data.dz[split_indicies[0] : split_indicies[-1]].max()
+    inflection = data.ddz[window] / rates
+    idx = minmax_union_indices(data.y[window], data.z[window], slope, inflection)
+    return TransitionDiagnostic(
+        x=data.x[window][idx],
+        y=data.y[window][idx],
+        z=data.z[window][idx],
+        slope=slope[idx],
+        inflection=inflection[idx],
+        split_x=data.x[split_indicies],
+        split_y=data.y[split_indicies],
+        split_z=data.z[split_indicies],
+        xlim=(float(data.x[i_start]), float(data.x[i_end])),
+    )
+
+
+def render_transition[F: np.floating](diag: TransitionDiagnostic[F], *, fout: Path) -> None:
+    fig, ax = create_figure(4, figsize=(10, 8), dpi=180)
     update_figure_setting(fig)
-    ax[0].set_xlim(start, end)
-    ax[1].set_xlim(start, end)
-    ax[2].set_xlim(start, end)
+    ax[0].set_xlim(*diag.xlim)
+    ax[1].set_xlim(*diag.xlim)
+    ax[2].set_xlim(*diag.xlim)
     ax[2].set_ylim(-1.2, 1.2)
-    ax[3].set_xlim(start, end)
+    ax[3].set_xlim(*diag.xlim)
     ax[3].set_ylim(-1.2, 1.2)
-    ax[0].plot(data.x, data.y, "k-", label="Displacement")
-    ax[0].plot(data.x[split_indicies], data.y[split_indicies], "ro", label="Segments")
+    ax[0].plot(diag.x, diag.y, "k-", label="Displacement")
+    ax[0].plot(diag.split_x, diag.split_y, "ro", label="Segments")
     ax[0].set_xlabel("Time (s)")
-    ax[1].plot(data.x, data.z, "k-", label="Filtered")
-    ax[1].plot(data.x[split_indicies], data.z[split_indicies], "ro", label="Segments")
+    ax[1].plot(diag.x, diag.z, "k-", label="Filtered")
+    ax[1].plot(diag.split_x, diag.split_z, "ro", label="Segments")
     ax[1].set_xlabel("Time (s)")
-    ax[2].plot(
-        data.x,
-        data.dz / data.dz[split_indicies[0] : split_indicies[-1]].max(),
-        "k-",
-        label="Slope",
-    )
+    ax[2].plot(diag.x, diag.slope, "k-", label="Slope")
     ax[2].set_xlabel("Time (s)")
-    ax[3].plot(
-        data.x,
-        relative_data,
-        "k-",
-        label="Inflection",
-    )
+    ax[3].plot(diag.x, diag.inflection, "k-", label="Inflection")
     ax[3].set_xlabel("Time (s)")
     fig.savefig(fout)
     plt.close(fig)
+
+
+def plot_transition[F: np.floating, I: np.integer](
+    data: DataSeries[F],
+    nodes: A1[I],
+    seg: Segmentation[I, F],
+    splits: Sequence[Split],
+    *,
+    fout: Path,
+) -> None:
+    render_transition(prepare_transition(data, nodes, seg, splits), fout=fout)
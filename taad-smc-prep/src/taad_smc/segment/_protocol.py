@@ -5,12 +5,13 @@ from typing import TYPE_CHECKING
 import numpy as np
 from pytools.logging.api import NLOGGER
 
-from .struct import TAADCurve
-from .trait import CurveSegment, Protocol, TestProtocol
+from .struct import BREAKPOINT_DTYPE, CompiledProtocol, TAADCurve
+from .trait import CURVE_SEGMENTS, CurveSegment, Protocol, TestProtocol
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Mapping, Sequence
 
+    from pytools.arrays import A1
     from pytools.logging.trait import ILogger
 
 
@@ -245,3 +246,98 @@ def create_curves(
     aligned_curves = aligned_curve_indices(curves, start_idx=start_idx)
     log.debug("Curves:", pformat(aligned_curves, indent=2, sort_dicts=False))
     return aligned_curves
+
+
+_CURVE_TEMPLATES: Mapping[str, Callable[[Protocol, int], TAADCurve[np.float64, np.intp]]] = {
+    "Sawtooth": create_sawtooth_curve,
+    "Trapazoid": create_trapazoid_curve,
+    "Flat": create_flat_curve,
+    "Slack": create_slack_curve,
+}
+
+
+def compile_curves[F: np.floating, I: np.integer](
+    templates: Mapping[str, tuple[TAADCurve[F, I], int]],
+    *,
+    start_idx: int = 0,
+    sample_rate: int = 5000,
+    bracket: bool = False,
+) -> CompiledProtocol:
+    """Tile single-cycle curves into a breakpoint table.
+
+    Parameters
+    ----------
+    templates : Mapping[str, tuple[TAADCurve[F, I], int]]
+        First cycle of every protocol, starting at time and index 0, and its repeat count.
+    start_idx : int, optional
+        Sample index of the first breakpoint.
+    sample_rate : int, optional
+        Samples per second of the recording.
+    bracket : bool, optional
+        Surround the protocol with the "Start" and "End" holds of the recording.
+
+    Returns
+    -------
+    CompiledProtocol
+        One row per segment of every repeat, without looping over the repeats.
+
+    """
+    names = list(templates)
+    blocks: list[np.ndarray[tuple[int], np.dtype[np.void]]] = []
+    idx_offset, time_offset = start_idx, start_idx / sample_rate
+    for pid, (curve, repeat) in enumerate(templates.values(), start=int(bracket)):
+        k = len(curve.curve)
+        nth = np.repeat(np.arange(repeat), k)
+        block = np.zeros(repeat * k, dtype=BREAKPOINT_DTYPE)
+        block["idx"] = np.tile(curve.idx[:-1], repeat) + nth * curve.idx[-1] + idx_offset
+        block["time"] = np.tile(curve.time[:-1], repeat) + nth * curve.time[-1] + time_offset
+        block["disp"] = np.tile(curve.disp[:-1], repeat)
+        block["slope"] = np.tile(curve.slope, repeat)
+        block["kind"] = np.tile([CURVE_SEGMENTS.index(c) for c in curve.curve], repeat)
+        block["protocol_id"] = pid
+        block["cycle"] = nth
+        blocks.append(block)
+        idx_offset += repeat * int(curve.idx[-1])
+        time_offset += repeat * float(curve.time[-1])
+    if bracket:
+        start = np.zeros(1, dtype=BREAKPOINT_DTYPE)
+        start["kind"] = CURVE_SEGMENTS.index(CurveSegment.HOLD)
+        end = start.copy()
+        end["idx"], end["time"], end["protocol_id"] = idx_offset, time_offset, len(names) + 1
+        blocks = [start, *blocks, end]
+        names = ["Start", *names, "End"]
+    table = np.concatenate(blocks) if blocks else np.zeros(0, dtype=BREAKPOINT_DTYPE)
+    return CompiledProtocol(names=names, table=table, sample_rate=sample_rate)
+
+
+def compile_protocol(
+    protocol: Mapping[str, TestProtocol],
+    start_idx: int = 0,
+    *,
+    sample_rate: int = 5000,
+    log: ILogger = NLOGGER,
+) -> CompiledProtocol:
+    """Compile the protocol into a breakpoint table, replacing `create_curves`."""
+    templates = {
+        k: (_CURVE_TEMPLATES[v["type"]](v["args"], sample_rate), v["repeat"])
+        for k, v in protocol.items()
+    }
+    compiled = compile_curves(templates, start_idx=start_idx, sample_rate=sample_rate, bracket=True)
+    log.debug(f"Breakpoints (n = {len(compiled.table)}):", pformat(compiled.table, indent=2))
+    return compiled
+
+
+def protocol_nodes(compiled: CompiledProtocol, name: str) -> A1[np.intp]:
+    """Return the breakpoints, as rows of the table, bounding the segments of a protocol."""
+    rows = np.flatnonzero(compiled.table["protocol_id"] == compiled.names.index(name))
+    return np.append(rows, rows[-1] + 1)
+
+
+def sample_rows[I: np.integer](idx: A1[I], n_rows: int, length: int) -> A1[np.intp]:
+    """Return the table row each sample belongs to, or -1 outside of the segmentation.
+
+    Row `r` spans ``idx[r]:idx[r + 1]``; `idx` must be sorted.
+    """
+    rows = np.searchsorted(idx, np.arange(length), side="right") - 1
+    rows[rows >= min(n_rows, len(idx) - 1)] = -1
+    return rows
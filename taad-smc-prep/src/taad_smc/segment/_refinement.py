@@ -6,44 +6,43 @@ import numpy as np
 from pytools.logging.api import NLOGGER
 from pytools.progress import ProgressBar
 
+from ._cost import SegmentCost
+
 if TYPE_CHECKING:
     from pytools.arrays import A1
     from pytools.logging.trait import ILogger
 
-__all__ = ["opt_index"]
-
-
-def interp_norm[F: np.floating, I: np.integer](
-    data: A1[F],
-    index: A1[I],
-    skip: int = 25,
-) -> float:
-    y = np.interp(np.arange(0, len(data), skip), index, data[index])
-    res = data[::skip] - y
-    return float(res @ res)
+__all__ = ["dp_index", "opt_index"]
 
 
-def optimize_i[F: np.floating, I: np.integer](
-    data: A1[F],
+def optimize_i[I: np.integer](
+    cost: SegmentCost,
     index: A1[I],
     position: int,
     windows: int,
 ) -> A1[I]:
-    diff = np.zeros((2 * windows + 1, index.size), dtype=index.dtype)
-    diff[:, position] = np.arange(-windows, windows + 1, dtype=index.dtype)
-    pars = diff + index
-    fit = np.array([interp_norm(data, p) for p in pars])
-    return pars[fit.argmin()]
+    left, right = index[position - 1], index[position + 1]
+    candidates = index[position] + np.arange(-windows, windows + 1, dtype=index.dtype)
+    fit = np.where(
+        (left <= candidates) & (candidates <= right),
+        cost.segment(left, candidates) + cost.segment(candidates, right),
+        np.inf,
+    )
+    if not np.isfinite(fit).any():
+        return index
+    pars = index.copy()
+    pars[position] = candidates[fit.argmin()]
+    return pars
 
 
-def optimize[F: np.floating, I: np.integer](
-    data: A1[F],
+def optimize[I: np.integer](
+    cost: SegmentCost,
     index: A1[I],
     windows: int,
 ) -> A1[I]:
     bart = ProgressBar(n=index.size - 2)
     for i in range(1, index.size - 1):
-        index = optimize_i(data, index, i, windows)
+        index = optimize_i(cost, index, i, windows)
         bart.next()
     return index
 
@@ -56,10 +55,11 @@ def opt_index[F: np.floating, I: np.integer](
     max_iter: int = 100,
     log: ILogger = NLOGGER,
 ) -> A1[I]:
+    cost = SegmentCost(data)
     old_index = index.copy()
     old_index[-1] = index[-1] - 1
     for i in range(max_iter):
-        new_index = optimize(data, old_index, windows)
+        new_index = optimize(cost, old_index, windows)
         diff = np.abs(new_index - old_index)
         log.disp(f"Iteration {i}: {diff.sum()}")
         if np.array_equal(new_index, old_index):
@@ -68,3 +68,44 @@ def opt_index[F: np.floating, I: np.integer](
         windows = windows - 1 if windows > 1 else 1
     old_index[-1] = old_index[-1] + 1
     return old_index
+
+
+def dp_index[F: np.floating, I: np.integer](
+    data: A1[F],
+    index: A1[I],
+    windows: int,
+    *,
+    log: ILogger = NLOGGER,
+) -> A1[I]:
+    """Least-squares optimal breakpoints within `windows` samples of `index`.
+
+    Deterministic alternative to `opt_index`. The piecewise-linear interpolant of `data` at
+    the breakpoints is fitted by dynamic programming over the bands around the initial guess.
+    The first and last breakpoints are kept fixed. Each segment cost is O(1) from prefix sums,
+    so the fit is O(N + K * windows^2) for K breakpoints.
+    """
+    last = len(data) - 1
+    guess = np.minimum(index.astype(np.intp), last)
+    offsets = np.arange(-windows, windows + 1)
+    bands = np.clip(guess[:, None] + offsets, 0, last)
+    infeasible = (guess[:, None] + offsets < 0) | (guess[:, None] + offsets > last)
+    infeasible[[0, -1]] = offsets != 0
+    segments = SegmentCost(data)
+    cost = np.where(infeasible[0], np.inf, 0.0)
+    back = np.zeros((len(guess) - 1, len(offsets)), dtype=np.intp)
+    for k in range(1, len(guess)):
+        i, j = bands[k - 1][:, None], bands[k][None, :]
+        total = cost[:, None] + np.where(i < j, segments.segment(i, j), np.inf)
+        back[k - 1] = total.argmin(axis=0)
+        cost = np.where(infeasible[k], np.inf, total.min(axis=0))
+    if not np.isfinite(cost).any():
+        msg = "No strictly increasing set of breakpoints exists within the search windows."
+        raise ValueError(msg)
+    state = int(cost.argmin())
+    new_index = index.copy()
+    for k in range(len(guess) - 1, 0, -1):
+        new_index[k] = bands[k, state]
+        state = int(back[k - 1, state])
+    new_index[0], new_index[-1] = index[0], index[-1]
+    log.disp(f"DP refinement moved {np.abs(new_index - index).sum()} samples in total.")
+    return new_index
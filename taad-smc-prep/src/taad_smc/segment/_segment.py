@@ -1,3 +1,4 @@
+from functools import partial
 from pprint import pformat
 from typing import TYPE_CHECKING
 
@@ -5,8 +6,10 @@ import numpy as np
 from pytools.logging.api import NLOGGER
 from scipy.ndimage import gaussian_filter1d
 from scipy.signal import find_peaks
+from taad_smc.plot.diagnostics import DiagnosticSink
 
-from ._plotting import plot_transition
+from ._chunked import gaussian_radius, halo_chunked
+from ._plotting import prepare_transition, render_transition
 from .struct import DataSeries, Segmentation, Split, TAADCurve
 from .trait import CurvePoint
 
@@ -18,17 +21,12 @@ if TYPE_CHECKING:
     from pytools.logging.trait import ILogger
 
 
-def filtered_derivatives[F: np.floating](
-    time: A1[F],
-    data: A1[F],
-    *,
-    smoothing_window: float,
-    repeat: int = 5,
-) -> DataSeries[F]:
+def _derivative_chain[F: np.floating](
+    data: A1[F], *, smoothing_window: float, repeat: int
+) -> tuple[A1[F], A1[F], A1[F]]:
     # sos = butter(15, 100, "lowpass", fs=5000, output="sos")
-    x = data.copy()
     # x = sosfiltfilt(sos, x).astype(data.dtype)
-    x = gaussian_filter1d(x, smoothing_window)
+    x = gaussian_filter1d(data, smoothing_window)
     for _ in range(repeat):
         x = gaussian_filter1d(x, smoothing_window)
     dx: A1[F] = np.gradient(x) * 5000
@@ -39,6 +37,29 @@ def filtered_derivatives[F: np.floating](
     # ddx = sosfiltfilt(sos, ddx).astype(data.dtype)
     for _ in range(repeat):
         ddx = gaussian_filter1d(ddx, 10)
+    return x, dx, ddx
+
+
+def filtered_derivatives[F: np.floating](
+    time: A1[F],
+    data: A1[F],
+    *,
+    smoothing_window: float,
+    repeat: int = 5,
+    threads: int = 1,
+) -> DataSeries[F]:
+    """Smooth `data` and take its first two derivatives, in `threads` halo-chunked threads.
+
+    The result does not depend on `threads`, see `halo_chunked`.
+    """
+    halo = (repeat + 1) * gaussian_radius(smoothing_window) + repeat * gaussian_radius(10) + 2
+    x, dx, ddx = halo_chunked(
+        partial(_derivative_chain, smoothing_window=smoothing_window, repeat=repeat),
+        data,
+        halo=halo,
+        outputs=3,
+        threads=threads,
+    )
     ddx = ddx / ddx.max()
     # dx = sosfilt(sos, dx).astype(data.dtype)
     # ddx = sosfilt(sos, ddx).astype(data.dtype)
@@ -120,9 +141,23 @@ def segment_duration[F: np.floating, I: np.integer](
     seg: Segmentation[I, F],
     *,
     fout: Path | None = None,
+    sink: DiagnosticSink | None = None,
     log: ILogger = NLOGGER,
 ) -> Segmentation[I, F]:
     nodes = np.unique([i for c in curves for i in c.order])
+    return segment_nodes(data, nodes, seg, fout=fout, sink=sink, log=log)
+
+
+def segment_nodes[F: np.floating, I: np.integer](
+    data: DataSeries[F],
+    nodes: A1[np.intp],
+    seg: Segmentation[I, F],
+    *,
+    fout: Path | None = None,
+    sink: DiagnosticSink | None = None,
+    log: ILogger = NLOGGER,
+) -> Segmentation[I, F]:
+    """Locate the breakpoints `nodes` of one protocol in the filtered data."""
     splits = find_indexes(data.ddz, nodes, seg, log=log)
     log.debug(
         "Splits found:",
@@ -135,7 +170,10 @@ def segment_duration[F: np.floating, I: np.integer](
         ),
     )
     if fout is not None:
-        plot_transition(data, nodes, seg, splits, fout=fout)
+        sink = DiagnosticSink("inline") if sink is None else sink
+        if sink.enabled:
+            diag = prepare_transition(data, nodes, seg, splits)
+            sink.record(render_transition, diag, fout=fout)
     seg = validate_curve_indices(seg, nodes, splits, log=log)
     seg.idx[-1] = len(data.x)
     return seg
@@ -0,0 +1,132 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from pprint import pformat
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pytools.logging.api import NLOGGER
+from scipy.signal import correlate
+
+from ._index import get_compiled_index_list
+from ._protocol import compile_protocol
+from .trait import CurvePoint
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytools.arrays import A1
+    from pytools.logging.trait import ILogger
+
+    from .struct import CompiledProtocol, DataSeries, Segmentation
+    from .trait import TestProtocol
+
+__all__ = ["align_template", "refine_breakpoints", "synthesize_template", "template_segmentation"]
+
+
+def synthesize_template(compiled: CompiledProtocol) -> A1[np.float64]:
+    """Return the piecewise-linear displacement prescribed by a compiled protocol.
+
+    The template spans from the first breakpoint to the start of the "End" hold.
+    """
+    table = compiled.table
+    start, end = int(table["idx"][0]), int(table["idx"][-1])
+    return np.interp(np.arange(start, end + 1), table["idx"], table["disp"])
+
+
+def align_template[F: np.floating](signal: A1[F], template: A1[np.float64]) -> int:
+    """Return the lag maximizing the FFT cross-correlation of `template` with `signal`.
+
+    Both series are centered first; only lags where the template lies entirely within the
+    signal are considered.
+    """
+    if len(template) > len(signal):
+        msg = f"Protocol ({len(template)} samples) is longer than the data ({len(signal)})."
+        raise ValueError(msg)
+    corr = correlate(signal - signal.mean(), template - template.mean(), mode="valid", method="fft")
+    return int(np.argmax(corr))
+
+
+def refine_breakpoints[F: np.floating, I: np.integer](
+    ddz: A1[F],
+    seg: Segmentation[I, F],
+    window: int,
+) -> A1[np.intp]:
+    """Move every interior breakpoint to the extremum of `ddz` around its expected position.
+
+    The search window of each breakpoint is limited to `window` samples and to half the
+    distance to its neighbours, rounded down on its right, so breakpoints that were strictly
+    increasing stay so. All breakpoints are refined at once on a
+    ``(n_breakpoints, 2 * window + 1)`` gather.
+    """
+    idx = seg.idx.astype(np.intp)
+    interior = idx[1:-1]
+    gaps = np.diff(idx)
+    # Two neighbours can never meet: together they cover at most gap - 1 samples of it.
+    left = np.minimum(window, gaps[:-1] // 2)
+    right = np.minimum(window, np.maximum((gaps[1:] - 1) // 2, 0))
+    offsets = np.arange(-window, window + 1)
+    candidates = np.clip(interior[:, None] + offsets, 0, len(ddz) - 1)
+    sign = np.where(np.array([k == CurvePoint.PEAK for k in seg.kind[1:-1]]), 1.0, -1.0)
+    values = ddz[candidates] * sign[:, None]
+    values[(offsets < -left[:, None]) | (offsets > right[:, None])] = -np.inf
+    refined = idx.copy()
+    refined[1:-1] = candidates[np.arange(len(interior)), values.argmax(axis=1)]
+    return refined
+
+
+def _shift(compiled: CompiledProtocol, lag: int) -> CompiledProtocol:
+    """Return `compiled` started `lag` samples later; the "Start" hold still starts at 0."""
+    table = compiled.table.copy()
+    table["idx"][1:] += lag
+    table["time"][1:] += lag / compiled.sample_rate
+    return dc.replace(compiled, table=table)
+
+
+def template_segmentation[F: np.floating](
+    data: DataSeries[F],
+    protocol: Mapping[str, TestProtocol],
+    *,
+    window: int = 2500,
+    log: ILogger = NLOGGER,
+) -> tuple[CompiledProtocol, Segmentation[np.intp, np.float64]]:
+    """Segment a recording by aligning it to the displacement synthesized from its protocol.
+
+    Alternative to the per-protocol `find_indexes` / `validate_curve_indices` engine. The
+    whole protocol is located with one FFT cross-correlation of the filtered displacement,
+    then every breakpoint is refined locally on the second derivative.
+
+    The recording is placed with that single lag, so the nominal durations of the protocol
+    must hold throughout it: a breakpoint that drifts more than `window` samples from where
+    the protocol puts it, e.g. after holds longer than prescribed, is not found.
+
+    Parameters
+    ----------
+    data : DataSeries[F]
+        Output of `filtered_derivatives`.
+    protocol : Mapping[str, TestProtocol]
+        Test protocol of the recording.
+    window : int, optional
+        Maximum distance, in samples, a breakpoint may move during the local refinement.
+    log : ILogger, optional
+        Logger.
+
+    Returns
+    -------
+    tuple[CompiledProtocol, Segmentation[np.intp, np.float64]]
+        The protocol compiled at the detected start, and the refined segmentation.
+
+    """
+    compiled = compile_protocol(protocol, log=log)
+    lag = align_template(data.z, synthesize_template(compiled))
+    log.info(f"Protocol aligned at index {lag}.")
+    compiled = _shift(compiled, lag)
+    seg = get_compiled_index_list(compiled, length=len(data.x), log=log)
+    refined = refine_breakpoints(data.ddz, seg, window)
+    log.debug(
+        "Refined breakpoints:",
+        pformat(refined, indent=2, sort_dicts=False),
+        "Shift from template:",
+        pformat(refined - seg.idx, indent=2, sort_dicts=False),
+    )
+    seg.idx = refined
+    return compiled, seg
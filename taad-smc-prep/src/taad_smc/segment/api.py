@@ -1,17 +1,44 @@
 __all__ = [
+    "SegmentCost",
+    "compile_curves",
+    "compile_protocol",
     "create_curves",
+    "dp_index",
     "filtered_derivatives",
     "find_first_index",
     "find_last_index",
+    "gaussian_radius",
     "generate_tags",
+    "get_compiled_index_list",
     "get_index_list",
+    "halo_chunked",
     "import_test_protocol",
     "plot_filtered",
+    "protocol_nodes",
+    "sample_rows",
     "segment_duration",
+    "segment_nodes",
+    "template_segmentation",
 ]
 
-from ._index import find_first_index, find_last_index, get_index_list
+from ._chunked import gaussian_radius, halo_chunked
+from ._cost import SegmentCost
+from ._index import (
+    find_first_index,
+    find_last_index,
+    get_compiled_index_list,
+    get_index_list,
+)
 from ._io import import_test_protocol
 from ._plotting import plot_filtered
-from ._protocol import create_curves, generate_tags
-from ._segment import filtered_derivatives, segment_duration
+from ._protocol import (
+    compile_curves,
+    compile_protocol,
+    create_curves,
+    generate_tags,
+    protocol_nodes,
+    sample_rows,
+)
+from ._refinement import dp_index
+from ._segment import filtered_derivatives, segment_duration, segment_nodes
+from ._template import template_segmentation
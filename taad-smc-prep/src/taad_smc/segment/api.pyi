@@ -1,11 +1,13 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 
 import numpy as np
 from pytools.arrays import A1
 from pytools.logging.trait import ILogger
+from taad_smc.plot.diagnostics import DiagnosticSink
 
-from .struct import DataSeries, Segmentation, TAADCurve
+from ._cost import SegmentCost as SegmentCost
+from .struct import CompiledProtocol, DataSeries, Segmentation, TAADCurve
 from .trait import TestProtocol
 
 def create_curves(
@@ -14,6 +16,22 @@ def create_curves(
     *,
     log: ILogger = ...,
 ) -> Mapping[str, Sequence[TAADCurve[np.float64, np.intp]]]: ...
+def compile_curves[F: np.floating, I: np.integer](
+    templates: Mapping[str, tuple[TAADCurve[F, I], int]],
+    *,
+    start_idx: int = 0,
+    sample_rate: int = 5000,
+    bracket: bool = False,
+) -> CompiledProtocol: ...
+def compile_protocol(
+    protocol: Mapping[str, TestProtocol],
+    start_idx: int = 0,
+    *,
+    sample_rate: int = 5000,
+    log: ILogger = ...,
+) -> CompiledProtocol: ...
+def protocol_nodes(compiled: CompiledProtocol, name: str) -> A1[np.intp]: ...
+def sample_rows[I: np.integer](idx: A1[I], n_rows: int, length: int) -> A1[np.intp]: ...
 def generate_tags(
     curves: Mapping[str, Sequence[TAADCurve[np.float64, np.intp]]],
 ) -> Sequence[tuple[str, int, str]]: ...
@@ -36,22 +54,62 @@ def get_index_list[F: np.floating, I: np.integer](
     *,
     log: ILogger = ...,
 ) -> Segmentation[I, F]: ...
+def get_compiled_index_list(
+    compiled: CompiledProtocol,
+    length: int,
+    *,
+    log: ILogger = ...,
+) -> Segmentation[np.intp, np.float64]: ...
 def filtered_derivatives[F: np.floating](
     time: A1[F],
     disp: A1[F],
     *,
     smoothing_window: int = 50,
     repeat: int = 5,
+    threads: int = 1,
 ) -> DataSeries[F]: ...
+def gaussian_radius(sigma: float, truncate: float = 4.0) -> int: ...
+def halo_chunked[F: np.floating](
+    chain: Callable[[A1[F]], Sequence[A1[F]]],
+    x: A1[F],
+    *,
+    halo: int,
+    outputs: int,
+    threads: int = 1,
+) -> Sequence[A1[F]]: ...
 def segment_duration[F: np.floating, I: np.integer](
     data: DataSeries[F],
     curves: Sequence[TAADCurve[F, I]],
     seg: Segmentation[I, F],
     *,
-    fout: Path,
+    fout: Path | None = None,
+    sink: DiagnosticSink | None = None,
+    log: ILogger = ...,
+) -> Segmentation[I, F]: ...
+def segment_nodes[F: np.floating, I: np.integer](
+    data: DataSeries[F],
+    nodes: A1[np.intp],
+    seg: Segmentation[I, F],
+    *,
+    fout: Path | None = None,
+    sink: DiagnosticSink | None = None,
     log: ILogger = ...,
 ) -> Segmentation[I, F]: ...
 def plot_filtered[F: np.floating](
     data: DataSeries[F],
     fout: Path,
 ) -> None: ...
+def dp_index[F: np.floating, I: np.integer](
+    data: A1[F],
+    index: A1[I],
+    windows: int,
+    *,
+    log: ILogger = ...,
+) -> A1[I]: ...
+def template_segmentation[F: np.floating](
+    data: DataSeries[F],
+    protocol: Mapping[str, TestProtocol],
+    *,
+    window: int = 2500,
+    log: ILogger = ...,
+) -> tuple[CompiledProtocol, Segmentation[np.intp, np.float64]]: ...
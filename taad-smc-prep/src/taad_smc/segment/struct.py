@@ -10,6 +10,23 @@ if TYPE_CHECKING:
 
     from .trait import CurvePoint, CurveSegment
 
+BREAKPOINT_DTYPE = np.dtype(
+    [
+        ("time", np.float64),
+        ("idx", np.intp),
+        ("disp", np.float64),
+        ("slope", np.float64),
+        ("kind", np.uint8),
+        ("protocol_id", np.int32),
+        ("cycle", np.int32),
+    ],
+)
+"""One row per segment, describing the breakpoint where it starts.
+
+`kind` is the position of the segment in `CURVE_SEGMENTS` and `protocol_id` the position of
+its protocol in `CompiledProtocol.names`.
+"""
+
 
 @dc.dataclass(slots=True)
 class TAADCurve[F: np.floating, I: np.integer]:
@@ -53,3 +70,16 @@ class DataSeries[F: np.floating]:
     z: A1[F]
     dz: A1[F]
     ddz: A1[F]
+
+
+@dc.dataclass(slots=True)
+class CompiledProtocol:
+    """Breakpoint table of a whole test protocol.
+
+    `table` has dtype `BREAKPOINT_DTYPE` and one row per segment in chronological order.
+    The breakpoint closing the last segment is not stored; it is the end of the recording.
+    """
+
+    names: Sequence[str]
+    table: np.ndarray[tuple[int], np.dtype[np.void]]
+    sample_rate: int
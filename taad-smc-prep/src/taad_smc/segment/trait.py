@@ -5,6 +5,8 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+    from taad_smc.plot.diagnostics import DIAGNOSTIC_MODES
+
 
 class CurveSegment(enum.StrEnum):
     STRETCH = "STRETCH"
@@ -12,6 +14,13 @@ class CurveSegment(enum.StrEnum):
     RECOVER = "RECOVER"
 
 
+CURVE_SEGMENTS: tuple[CurveSegment, ...] = tuple(CurveSegment)
+
+
+SEGMENTATION_ENGINES = Literal["peaks", "template"]
+REFINEMENT_METHODS = Literal["sweep", "dp"]
+
+
 class CurvePoint(enum.Enum):
     PEAK = enum.auto()
     VALLEY = enum.auto()
@@ -21,6 +30,11 @@ class Arguments(TypedDict):
     """TypedDict for command line arguments."""
 
     file: Sequence[Path]
+    diagnostics: DIAGNOSTIC_MODES
+    engine: SEGMENTATION_ENGINES
+    refine: REFINEMENT_METHODS
+    threads: int
+    trace: bool
 
 
 class Protocol(TypedDict, total=False):
@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+from pprint import pformat
+from typing import TYPE_CHECKING
+
+from pytools.logging.api import BLogger
+from pytools.logging.trait import LogLevel
+from pytools.result import Err, Ok
+from taad_smc.pwlsplit._names import create_names
+
+from ._argparse import parser_cmdline_args
+from ._types import StreamOptions
+
+if TYPE_CHECKING:
+    from pytools.logging.trait import ILogger
+
+    from ._argparse import ParsedArguments
+
+
+def parser_optional_args(args: ParsedArguments) -> StreamOptions:
+    return StreamOptions(
+        stdin=args.stdin,
+        rate=args.rate,
+        poll=args.poll,
+        timeout=args.timeout,
+        window=args.smoothing_window,
+        repeat=args.smoothing_repeat,
+        min_duration=args.min_duration,
+        noise_duration=args.noise_duration,
+        noise_factor=args.noise_factor,
+        min_velocity=args.min_velocity,
+        abort_fraction=args.abort_fraction,
+        max_mismatch=args.max_mismatch,
+        overwrite=args.overwrite,
+        log=LogLevel[args.log],
+    )
+
+
+def main(file: Path, opts: StreamOptions, *, log: ILogger) -> Ok[None] | Err:
+    log.brief(f"Streaming: {file}")
+    log.info("Options:", pformat(opts, sort_dicts=False))
+    names = create_names(file).unwrap()
+    if names.csv.exists() and not opts.overwrite:
+        log.info(f"Output for {file} already exists, skipping...")
+        return Ok(None)
+    # pandas, scipy and nptdms are only loaded once there is something to stream.
+    from taad_smc.io.api import import_specimen_info, import_test_protocol
+    from taad_smc.pwlsplit._tools import compile_taadsmc_curves, compile_taadsmc_table
+
+    from ._run import run_stream
+    from ._source import read_chunks, read_daq_rate, tail_tdms
+
+    protocol = import_test_protocol(names.protocol).unwrap()
+    info = import_specimen_info(names.info).unwrap()
+    protocol_map, _ = compile_taadsmc_curves(protocol).unwrap()
+    match opts.rate:
+        case None if opts.stdin:
+            return Err(ValueError("--rate is required when reading from stdin."))
+        case None:
+            rate = read_daq_rate(file, poll=opts.poll, timeout=opts.timeout).unwrap()
+        case rate:
+            pass
+    compiled = compile_taadsmc_table(protocol_map, sample_rate=round(rate))
+    chunks = (
+        read_chunks(sys.stdin.buffer, chunk_size=round(opts.poll * rate))
+        if opts.stdin
+        else tail_tdms(file, poll=opts.poll, timeout=opts.timeout, log=log)
+    )
+    match run_stream(chunks, compiled, rate=rate, info=info, fout=names.csv, opts=opts, log=log):
+        case Ok(segments):
+            log.brief(f"Streaming segmentation complete: {len(segments)} segments.")
+            return Ok(None)
+        case Err(e):
+            return Err(e)
+
+
+if __name__ == "__main__":
+    args = parser_cmdline_args()
+    opts = parser_optional_args(args)
+    logger = BLogger(args.log)
+    match main(Path(args.file), opts, log=logger):
+        case Ok():
+            pass
+        case Err(e):
+            logger.error(f"Aborted: {e}")
+            sys.exit(1)
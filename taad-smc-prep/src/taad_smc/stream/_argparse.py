@@ -0,0 +1,95 @@
+import argparse
+import dataclasses as dc
+from typing import get_args
+
+from pytools.logging.trait import LOG_LEVEL
+
+__all__ = ["parser_cmdline_args"]
+
+_parser = argparse.ArgumentParser(
+    description="Segment a TAAD experiment while it is being recorded.",
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+)
+_parser.add_argument(
+    "file",
+    type=str,
+    help="TDMS file being recorded; protocol.json and key.json must be in the same folder.",
+)
+_parser.add_argument(
+    "--stdin",
+    action="store_true",
+    help="Read interleaved float64 (position, force) pairs from stdin instead of the file.",
+)
+_parser.add_argument("--rate", type=float, help="Sampling rate; read from the file by default.")
+_parser.add_argument("--poll", type=float, help="Seconds between checks of the file.")
+_parser.add_argument(
+    "--timeout", type=float, help="Stop after the file has not grown for this many seconds."
+)
+_parser.add_argument("--smoothing-window", type=float, help="Width of the Gaussian filter.")
+_parser.add_argument("--smoothing-repeat", type=int, help="Number of smoothing passes.")
+_parser.add_argument(
+    "--min-duration", type=float, help="Seconds a new segment must last to be confirmed."
+)
+_parser.add_argument(
+    "--noise-duration",
+    type=float,
+    help="Seconds at rest at the start of the recording used to estimate the noise.",
+)
+_parser.add_argument(
+    "--noise-factor", type=float, help="Velocity threshold as a multiple of the noise."
+)
+_parser.add_argument("--min-velocity", type=float, help="Lower bound of the velocity threshold.")
+_parser.add_argument(
+    "--abort-fraction",
+    type=float,
+    help="Abort when a cycle peaks below this fraction of the first cycle of its protocol.",
+)
+_parser.add_argument(
+    "--max-mismatch", type=int, help="Abort after this many segments off the protocol."
+)
+_parser.add_argument(
+    "--log", type=str.upper, default="INFO", choices=get_args(LOG_LEVEL), help="Set log level."
+)
+_parser.add_argument("--overwrite", action="store_true", help="Overwrite existing output files.")
+
+
+@dc.dataclass(slots=True)
+class ParsedArguments:
+    file: str
+    stdin: bool
+    rate: float | None
+    poll: float
+    timeout: float
+    smoothing_window: float
+    smoothing_repeat: int
+    min_duration: float
+    noise_duration: float
+    noise_factor: float
+    min_velocity: float
+    abort_fraction: float
+    max_mismatch: int
+    log: LOG_LEVEL
+    overwrite: bool
+
+
+def parser_cmdline_args(args: list[str] | None = None) -> ParsedArguments:
+    return _parser.parse_args(
+        args,
+        namespace=ParsedArguments(
+            "",
+            stdin=False,
+            rate=None,
+            poll=0.5,
+            timeout=30.0,
+            smoothing_window=50,
+            smoothing_repeat=3,
+            min_duration=0.2,
+            noise_duration=0.5,
+            noise_factor=10.0,
+            min_velocity=0.0,
+            abort_fraction=0.5,
+            max_mismatch=3,
+            log="INFO",
+            overwrite=False,
+        ),
+    )
@@ -0,0 +1,63 @@
+# Copyright (c) 2025 Will Zhang
+from math import ceil, sqrt
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.ndimage import gaussian_filter1d
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1
+
+__all__ = ["StreamFilter"]
+
+
+class StreamFilter:
+    """Gaussian smoothing and velocity of a stream with a fixed lag.
+
+    `repeat` passes of a Gaussian of width `sigma`, as in `filter_derivative`, equal one pass
+    of width ``sigma * sqrt(repeat)``. A sample is released once the kernel support after it,
+    `lag` samples, has arrived, so released values do not change with later data.
+    """
+
+    __slots__ = ("_history", "_lag", "_pending", "_rate", "_sigma")
+    _sigma: float
+    _lag: int
+    _rate: float
+    _history: A1[np.float64]
+    _pending: int
+
+    def __init__(self, sigma: float, *, repeat: int = 1, rate: float = 5000) -> None:
+        self._sigma = sigma * sqrt(max(repeat, 1))
+        self._lag = ceil(4 * self._sigma) + 1
+        self._rate = rate
+        self._history = np.zeros(0, dtype=np.float64)
+        self._pending = 0
+
+    @property
+    def lag(self) -> int:
+        """Number of samples a released value trails the newest sample by."""
+        return self._lag
+
+    def _filter(self, stop: int) -> tuple[A1[np.float64], A1[np.float64]]:
+        buf = self._history
+        start = len(buf) - self._pending
+        z = gaussian_filter1d(buf, self._sigma, mode="nearest")
+        dz = gaussian_filter1d(buf, self._sigma, order=1, mode="nearest") * self._rate
+        self._pending = len(buf) - stop
+        self._history = buf[max(stop - self._lag, 0) :]
+        return z[start:stop], dz[start:stop]
+
+    def push(self, x: A1[np.float64]) -> tuple[A1[np.float64], A1[np.float64]]:
+        """Add samples and return the smoothed position and velocity of the released ones."""
+        self._history = np.concatenate((self._history, x))
+        self._pending += len(x)
+        stop = len(self._history) - self._lag
+        if stop <= len(self._history) - self._pending:
+            return np.zeros(0), np.zeros(0)
+        return self._filter(stop)
+
+    def flush(self) -> tuple[A1[np.float64], A1[np.float64]]:
+        """Release the last `lag` samples at the end of the stream."""
+        if self._pending == 0:
+            return np.zeros(0), np.zeros(0)
+        return self._filter(len(self._history))
@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Will Zhang
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+import numpy as np
+from taad_smc.segment.trait import CURVE_SEGMENTS, CurveSegment
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1
+    from taad_smc.segment.struct import CompiledProtocol
+
+__all__ = ["OnlineSegmenter", "StreamSegment"]
+
+_HOLD = CURVE_SEGMENTS.index(CurveSegment.HOLD)
+_STRETCH = CURVE_SEGMENTS.index(CurveSegment.STRETCH)
+_RECOVER = CURVE_SEGMENTS.index(CurveSegment.RECOVER)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class StreamSegment:
+    """A confirmed segment; `row` is its row in the breakpoint table, -1 if unscheduled."""
+
+    row: int
+    protocol: str
+    cycle: int
+    kind: CurveSegment
+    start: int
+    end: int
+
+
+class OnlineSegmenter:
+    """Split a velocity stream into ramps and holds and match them to the expected protocol.
+
+    Every sample is classified as STRETCH, RECOVER or HOLD by thresholding the smoothed
+    velocity. A change of kind is confirmed once the new kind has persisted for `min_length`
+    samples, at which point the finished segment is matched to the next row of the
+    breakpoint table. Holds the protocol does not expect are reported as unscheduled pauses.
+    The velocity threshold is `noise_factor` times the velocity noise of the first
+    `noise_length` samples, which must be at rest, but at least `min_velocity`.
+    """
+
+    __slots__ = (
+        "_candidate",
+        "_candidate_start",
+        "_compiled",
+        "_kind",
+        "_min_length",
+        "_min_velocity",
+        "_mismatches",
+        "_noise",
+        "_noise_factor",
+        "_noise_length",
+        "_position",
+        "_row",
+        "_start",
+        "_threshold",
+    )
+    _compiled: CompiledProtocol
+    _min_length: int
+    _noise_length: int
+    _noise_factor: float
+    _min_velocity: float
+    _noise: list[A1[np.float64]]
+    _threshold: float | None
+    _position: int
+    _kind: int
+    _start: int
+    _candidate: int | None
+    _candidate_start: int
+    _row: int
+    _mismatches: int
+
+    def __init__(
+        self,
+        compiled: CompiledProtocol,
+        *,
+        min_length: int,
+        noise_length: int,
+        noise_factor: float = 10.0,
+        min_velocity: float = 0.0,
+    ) -> None:
+        self._compiled = compiled
+        self._min_length = min_length
+        self._noise_length = noise_length
+        self._noise_factor = noise_factor
+        self._min_velocity = min_velocity
+        self._noise = []
+        self._threshold = None
+        self._position = 0
+        self._kind = _HOLD
+        self._start = 0
+        self._candidate = None
+        self._candidate_start = 0
+        self._row = 0
+        self._mismatches = 0
+
+    @property
+    def mismatches(self) -> int:
+        """Number of ramps that did not match the expected protocol."""
+        return self._mismatches
+
+    @property
+    def done(self) -> bool:
+        """Whether every row of the protocol has been matched."""
+        return self._row >= len(self._compiled.table)
+
+    def push(self, dz: A1[np.float64]) -> list[StreamSegment]:
+        """Classify the next velocity samples and return the segments they confirm."""
+        if self._threshold is None:
+            self._noise.append(dz)
+            if sum(len(v) for v in self._noise) < self._noise_length:
+                return []
+            dz = np.concatenate(self._noise)
+            self._noise = []
+            noise = float(dz[: self._noise_length].std())
+            self._threshold = max(self._noise_factor * noise, self._min_velocity)
+        kinds = np.full(len(dz), _HOLD, dtype=np.intp)
+        kinds[dz > self._threshold] = _STRETCH
+        kinds[dz < -self._threshold] = _RECOVER
+        runs = np.flatnonzero(np.diff(kinds, prepend=-1))
+        ends = np.append(runs[1:], len(kinds))
+        segments: list[StreamSegment] = []
+        for s, e in zip(runs, ends, strict=True):
+            segments.extend(self._advance(int(kinds[s]), self._position + s, self._position + e))
+        self._position += len(dz)
+        return segments
+
+    def finish(self) -> list[StreamSegment]:
+        """Close the segment in progress at the end of the stream."""
+        if self._position <= self._start:
+            return []
+        return [self._match(self._kind, self._start, self._position)]
+
+    def _advance(self, kind: int, start: int, end: int) -> list[StreamSegment]:
+        if kind == self._kind:
+            self._candidate = None
+            return []
+        if kind != self._candidate:
+            self._candidate, self._candidate_start = kind, start
+        if end - self._candidate_start < self._min_length:
+            return []
+        segment = self._match(self._kind, self._start, self._candidate_start)
+        self._kind, self._start, self._candidate = kind, self._candidate_start, None
+        return [segment]
+
+    def _match(self, kind: int, start: int, end: int) -> StreamSegment:
+        table, names = self._compiled.table, self._compiled.names
+        expected = table["kind"][self._row :]
+        if kind != _HOLD and len(expected) > 1 and expected[0] != kind == expected[1]:
+            # One expected segment was missed, e.g. a hold too short to be confirmed.
+            self._row += 1
+            self._mismatches += 1
+        if self.done or table["kind"][self._row] != kind:
+            if kind != _HOLD:
+                self._mismatches += 1
+            last = table[self._row - 1] if self._row else None
+            return StreamSegment(
+                row=-1,
+                protocol=names[last["protocol_id"]] if last is not None else "",
+                cycle=int(last["cycle"]) if last is not None else 0,
+                kind=CURVE_SEGMENTS[kind],
+                start=start,
+                end=end,
+            )
+        row = self._row
+        # Consecutive segments of the same kind cannot be told apart by velocity.
+        while self._row < len(table) and table["kind"][self._row] == kind:
+            self._row += 1
+        return StreamSegment(
+            row=row,
+            protocol=names[table["protocol_id"][row]],
+            cycle=int(table["cycle"][row]),
+            kind=CURVE_SEGMENTS[kind],
+            start=start,
+            end=end,
+        )
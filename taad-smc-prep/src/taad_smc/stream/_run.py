@@ -0,0 +1,203 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false
+from math import ceil
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+
+from ._filter import StreamFilter
+from ._online import OnlineSegmenter, StreamSegment
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.types import SpecimenInfo
+    from taad_smc.segment.struct import CompiledProtocol
+
+    from ._source import Chunk
+    from ._types import StreamOptions
+
+__all__ = ["run_stream"]
+
+
+class _SegmentWriter:
+    """Append the samples of each confirmed segment to the output CSV.
+
+    Raw samples are kept only from the end of the last written segment onwards.
+    """
+
+    __slots__ = ("_disp", "_force", "_fout", "_info", "_offset", "_rate", "_written")
+    _fout: Path
+    _rate: float
+    _info: SpecimenInfo
+    _disp: A1[np.float64]
+    _force: A1[np.float64]
+    _offset: int
+    _written: bool
+
+    def __init__(self, fout: Path, *, rate: float, info: SpecimenInfo) -> None:
+        self._fout = fout
+        self._rate = rate
+        self._info = info
+        self._disp = np.zeros(0, dtype=np.float64)
+        self._force = np.zeros(0, dtype=np.float64)
+        self._offset = 0
+        self._written = False
+
+    def append(self, chunk: Chunk) -> None:
+        self._disp = np.concatenate((self._disp, chunk.disp))
+        self._force = np.concatenate((self._force, chunk.force))
+
+    def _write(self, end: int, protocol: str, cycle: str, mode: str) -> A1[np.float64]:
+        n = end - self._offset
+        disp, force = self._disp[:n], self._force[:n]
+        info = self._info
+        df = pd.DataFrame(
+            {
+                "protocol": protocol,
+                "cycle": cycle,
+                "mode": mode,
+                "time": np.arange(self._offset, end) / self._rate,
+                "disp": (disp + 0.5 * info["strain"])
+                * info["input_length_mm"]
+                / info["actual_length_mm"],
+                "force": force,
+            },
+        )
+        mode = "a" if self._written else "w"
+        df.to_csv(self._fout, mode=mode, header=not self._written, index=False)
+        self._written = True
+        self._disp, self._force, self._offset = self._disp[n:], self._force[n:], end
+        return force
+
+    def write(self, segment: StreamSegment) -> float:
+        """Write the samples of `segment` and return its peak force."""
+        force = self._write(
+            segment.end, segment.protocol, f"cycle_{segment.cycle}", segment.kind.value
+        )
+        return float(force.max(initial=-np.inf))
+
+    def close(self) -> None:
+        """Write the samples that were not assigned to any segment without labels."""
+        if len(self._disp):
+            self._write(self._offset + len(self._disp), "", "", "")
+
+
+class _CyclePeaks:
+    """Report the peak force of every cycle and flag cycles far below the first one."""
+
+    __slots__ = ("_current", "_first", "_fraction", "_log", "_peak")
+    _fraction: float
+    _log: ILogger
+    _current: tuple[str, int] | None
+    _peak: float
+    _first: dict[str, float]
+
+    def __init__(self, fraction: float, *, log: ILogger) -> None:
+        self._fraction = fraction
+        self._log = log
+        self._current = None
+        self._peak = -np.inf
+        self._first = {}
+
+    def close(self) -> Ok[None] | Err:
+        if self._current is None:
+            return Ok(None)
+        (protocol, cycle), peak = self._current, self._peak
+        self._log.brief(f"{protocol} cycle {cycle}: peak force {peak:.4g}")
+        reference = self._first.setdefault(protocol, peak)
+        if reference > 0 and peak < self._fraction * reference:
+            msg = (
+                f"Peak force of {protocol} cycle {cycle} ({peak:.4g}) fell below"
+                f" {self._fraction:.0%} of the first cycle ({reference:.4g})."
+            )
+            return Err(RuntimeError(msg))
+        return Ok(None)
+
+    def add(self, segment: StreamSegment, peak: float) -> Ok[None] | Err:
+        key = (segment.protocol, segment.cycle)
+        if segment.row < 0 or key == self._current:
+            self._peak = max(self._peak, peak)
+            return Ok(None)
+        res = self.close()
+        self._current, self._peak = key, peak
+        return res
+
+
+def run_stream(
+    chunks: Iterable[Chunk],
+    compiled: CompiledProtocol,
+    *,
+    rate: float,
+    info: SpecimenInfo,
+    fout: Path,
+    opts: StreamOptions,
+    log: ILogger = NLOGGER,
+) -> Ok[Sequence[StreamSegment]] | Err:
+    """Segment a recording while it is acquired.
+
+    Every segment is written to `fout`, in the layout of the pwlsplit output, as soon as the
+    next boundary is confirmed, about ``min_duration`` seconds plus the filter lag after it.
+    Boundaries are located to within about the filter width and can be refined afterwards
+    with `dp_index`. Processing aborts when the protocol no longer matches or when the peak
+    force of a cycle collapses; the operator can also interrupt it with Ctrl+C. In every case
+    the samples received so far are written before returning.
+    """
+    filt = StreamFilter(opts.window, repeat=opts.repeat, rate=rate)
+    segmenter = OnlineSegmenter(
+        compiled,
+        min_length=ceil(opts.min_duration * rate),
+        noise_length=ceil(opts.noise_duration * rate),
+        noise_factor=opts.noise_factor,
+        min_velocity=opts.min_velocity,
+    )
+    writer = _SegmentWriter(fout, rate=rate, info=info)
+    peaks = _CyclePeaks(opts.abort_fraction, log=log)
+    segments: list[StreamSegment] = []
+    log.info(f"Velocity filter lag: {filt.lag / rate:.3g} s.")
+
+    def _emit(confirmed: Sequence[StreamSegment]) -> Ok[None] | Err:
+        for s in confirmed:
+            peak = writer.write(s)
+            segments.append(s)
+            log.info(f"{s.protocol} cycle {s.cycle} {s.kind}: {s.start}-{s.end}")
+            if s.row < 0 and s.kind != "HOLD":
+                log.warn(f"Unexpected {s.kind} at sample {s.start}.")
+            match peaks.add(s, peak):
+                case Err(e):
+                    return Err(e)
+                case Ok():
+                    pass
+        if segmenter.mismatches > opts.max_mismatch:
+            msg = f"{segmenter.mismatches} segments did not match the protocol."
+            return Err(RuntimeError(msg))
+        return Ok(None)
+
+    res: Ok[None] | Err = Ok(None)
+    try:
+        for chunk in chunks:
+            writer.append(chunk)
+            _, dz = filt.push(chunk.disp)
+            if isinstance(res := _emit(segmenter.push(dz)), Err):
+                break
+        else:
+            _, dz = filt.flush()
+            res = _emit([*segmenter.push(dz), *segmenter.finish()])
+            if isinstance(res, Ok):
+                res = peaks.close()
+    except KeyboardInterrupt:
+        res = Err(InterruptedError("Stopped by the operator."))
+    writer.close()
+    match res:
+        case Ok():
+            if not segmenter.done:
+                log.warn("The recording ended before the protocol was complete.")
+            return Ok(segments)
+        case Err(e):
+            return Err(e)
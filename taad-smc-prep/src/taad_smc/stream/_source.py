@@ -0,0 +1,98 @@
+# Copyright (c) 2025 Will Zhang
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportMissingTypeStubs=false
+import dataclasses as dc
+import struct
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+from nptdms import TdmsFile
+from pytools.logging.api import NLOGGER
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+    from typing import BinaryIO
+
+    from pytools.arrays import A1
+    from pytools.logging.trait import ILogger
+
+__all__ = ["Chunk", "read_chunks", "read_daq_rate", "tail_tdms"]
+
+# Errors nptdms raises while the acquisition is still writing the last segment.
+_PARTIAL_WRITE_ERRORS = (OSError, ValueError, KeyError, EOFError, struct.error)
+
+
+@dc.dataclass(slots=True)
+class Chunk:
+    disp: A1[np.float64]
+    force: A1[np.float64]
+
+
+def read_daq_rate(file: Path, *, poll: float = 0.5, timeout: float = 30.0) -> Ok[float] | Err:
+    """Return the DAQ rate of a TDMS file, waiting up to `timeout` for it to be created."""
+    waited = 0.0
+    while True:
+        try:
+            with TdmsFile.open(file) as tdms:
+                rate = tdms.properties.get("DAQ Rate")
+            break
+        except _PARTIAL_WRITE_ERRORS as e:
+            if waited >= timeout:
+                return Err(e)
+        time.sleep(poll)
+        waited += poll
+    if rate is None:
+        return Err(LookupError(f"'DAQ Rate' is missing from {file}."))
+    return Ok(float(rate))
+
+
+def tail_tdms(
+    file: Path,
+    *,
+    poll: float = 0.5,
+    timeout: float = 30.0,
+    log: ILogger = NLOGGER,
+) -> Generator[Chunk]:
+    """Yield the samples appended to the "Data" group of a TDMS file being recorded.
+
+    The file is polled every `poll` seconds and reopened when it grew; only the new samples
+    of the Force and Position channels are read. Iteration stops once the file has not
+    changed for `timeout` seconds.
+    """
+    seen, size, idle = 0, -1, 0.0
+    while idle < timeout:
+        if (current := file.stat().st_size if file.exists() else -1) == size:
+            time.sleep(poll)
+            idle += poll
+            continue
+        size, idle = current, 0.0
+        try:
+            with TdmsFile.open(file) as tdms:
+                group = tdms["Data"]
+                n = min(len(group["Force"]), len(group["Position"]))
+                if n <= seen:
+                    continue
+                force = group["Force"].read_data(seen, n - seen)
+                disp = group["Position"].read_data(seen, n - seen)
+        except _PARTIAL_WRITE_ERRORS as e:
+            log.debug(f"{file.name} is not readable yet: {e}")
+            continue
+        seen = n
+        yield Chunk(disp=disp.astype(np.float64), force=force.astype(np.float64))
+
+
+def read_chunks(stream: BinaryIO, *, chunk_size: int = 5000) -> Generator[Chunk]:
+    """Yield chunks of interleaved little-endian float64 (position, force) pairs.
+
+    Stand-in for the acquisition socket: works with pipes, ``socket.makefile("rb")`` and
+    regular files. Iteration stops at end of stream; a trailing partial pair is dropped.
+    """
+    buffer = bytearray(16 * chunk_size)
+    while n := stream.readinto(buffer):
+        while n % 16 and (more := stream.readinto(memoryview(buffer)[n:])):
+            n += more
+        pairs = np.frombuffer(buffer, dtype="<f8", count=(n // 16) * 2).reshape(-1, 2)
+        yield Chunk(disp=pairs[:, 0].copy(), force=pairs[:, 1].copy())
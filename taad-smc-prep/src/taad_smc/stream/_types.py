@@ -0,0 +1,23 @@
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pytools.logging.trait import LogLevel
+
+
+@dc.dataclass(slots=True)
+class StreamOptions:
+    stdin: bool
+    rate: float | None
+    poll: float
+    timeout: float
+    window: float
+    repeat: int
+    min_duration: float
+    noise_duration: float
+    noise_factor: float
+    min_velocity: float
+    abort_fraction: float
+    max_mismatch: int
+    overwrite: bool
+    log: LogLevel
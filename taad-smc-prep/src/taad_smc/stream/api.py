@@ -0,0 +1,15 @@
+__all__ = [
+    "Chunk",
+    "OnlineSegmenter",
+    "StreamFilter",
+    "StreamSegment",
+    "read_chunks",
+    "read_daq_rate",
+    "run_stream",
+    "tail_tdms",
+]
+
+from ._filter import StreamFilter
+from ._online import OnlineSegmenter, StreamSegment
+from ._run import run_stream
+from ._source import Chunk, read_chunks, read_daq_rate, tail_tdms
@@ -0,0 +1,13 @@
+# Copyright (c) 2025 Will Zhang
+import numpy as np
+from taad_smc.segment.api import dp_index
+
+
+def test_dp_index_overlapping_bands_strictly_increase() -> None:
+    data = np.interp(np.arange(400), [0, 32, 218, 295, 399], [0.0, 1.0, -0.5, 0.8, 0.0])
+    # Breakpoints 5 samples apart searched 25 samples around: their bands overlap.
+    index = np.array([0, 5, 10, 15, 20, 399])
+    new_index = dp_index(data, index, windows=25)
+    assert np.all(np.diff(new_index) > 0)
+    assert new_index[0] == index[0]
+    assert new_index[-1] == index[-1]
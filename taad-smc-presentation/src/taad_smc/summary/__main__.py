@@ -2,17 +2,8 @@ from typing import TYPE_CHECKING
 
 from pytools.logging.api import BLogger
 from pytools.path import expand_as_path
-from taad_smc.io.api import import_specimen_info
 
-from ._activation import summarize_activation_data
 from ._argparse import parse_arguments
-from ._cycling import summarize_activated_cycling_data, summarize_cycling_data
-from ._initialization import import_datafiles
-from ._plotting import create_legend_on_axis, create_ppgrid, save_and_close_fig
-from ._print import log_search_results
-from ._relaxation import summarize_relaxation_data
-from ._stats import summarize_peak_data
-from ._tools import search_for_ylim
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -22,6 +13,18 @@ if TYPE_CHECKING:
 
 def main(folder: Path, *, log: ILogger) -> None:
     log.brief(f"Generating summary for folder: {folder}")
+    # pandas and matplotlib are loaded here so that --help answers immediately.
+    from taad_smc.io.api import import_specimen_info
+
+    from ._activation import summarize_activation_data
+    from ._cycling import summarize_activated_cycling_data, summarize_cycling_data
+    from ._initialization import import_datafiles
+    from ._plotting import create_legend_on_axis, create_ppgrid, save_and_close_fig
+    from ._print import log_search_results
+    from ._relaxation import summarize_relaxation_data
+    from ._stats import summarize_peak_data
+    from ._tools import search_for_ylim
+
     database = import_datafiles(folder).unwrap()
     spec_info = import_specimen_info(folder / "key.json").unwrap()
     ylim = search_for_ylim(database).unwrap()
@@ -41,8 +44,19 @@ def main(folder: Path, *, log: ILogger) -> None:
     log.brief(f"Saved summary figure to: {folder / 'summary.png'}")
 
 
+def cohort_main(cohort: Path, *, points: int, log: ILogger) -> None:
+    log.brief(f"Generating cohort summary for folder: {cohort}")
+    # pandas, matplotlib and nptdms are loaded here so that --help answers immediately.
+    from ._cohort import summarize_cohort
+
+    summarize_cohort(cohort, points=max(2, points), log=log).unwrap()
+
+
 if __name__ == "__main__":
     args = parse_arguments()
     log = BLogger(args.log)
     for folder in expand_as_path(args.folders):
-        main(folder, log=log)
+        if args.cohort:
+            cohort_main(folder, points=args.points, log=log)
+        else:
+            main(folder, log=log)
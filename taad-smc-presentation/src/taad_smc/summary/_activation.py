@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Literal, Unpack
 import numpy as np
 from pytools.plotting.trait import PlotKwargs
 from pytools.result import Err, Ok
+from taad_smc.decimate.api import resample_logspace
 
 from ._plotting import semilogx_on_axis
 from ._tools import get_last_valid
@@ -52,10 +53,9 @@ def _create_plot_data_i(
     idx = data[data["mode"] == "HOLD"].index[0]
     time = data["time"] - data["time"].loc[idx] + 25.0
     time = time.to_numpy(dtype=np.float64)
-    return PlotData(
-        x=time,
-        y=data[["force"]].to_numpy(dtype=np.float64).flatten(),
-    )
+    force = data[["force"]].to_numpy(dtype=np.float64).flatten()
+    time, force = resample_logspace(time, force)
+    return PlotData(x=time, y=force)
 
 
 def _create_plot_data(
@@ -0,0 +1,226 @@
+"""Subtract the passive from the activated curves to get the active SMC force."""
+
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from pytools.result import Err, Ok
+from taad_smc.io.api import SegmentedRecording, import_specimen_info
+
+from ._aggregate import loading_curve, relaxation_curve
+from ._tools import get_last_valid
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A1
+    from taad_smc.io.api import SpecimenData
+
+type _A2 = np.ndarray[tuple[int, int], np.dtype[np.float64]]
+
+PASSIVE_STATES = Literal["initial", "deactivated"]
+ACTIVE_CACHE = "active_force.npz"
+
+ACTIVE_METRICS_DTYPE = np.dtype(
+    [
+        ("test", "U16"),
+        ("peak", np.float64),
+        ("mean", np.float64),
+        ("fraction", np.float64),
+    ],
+)
+"""One row per test: the peak and mean active force and the peak active over peak activated.
+
+Loading branches are averaged over strain and relaxation holds over log time. Values are NaN
+when the activated and passive curves do not overlap.
+"""
+
+
+@dc.dataclass(slots=True, frozen=True)
+class ActiveForce:
+    """Activated minus passive force of every test of a specimen, one row per test.
+
+    `loading` is sampled on `strain` for the ``Saw_*`` tests and `relaxation` on `time`, the
+    time since the start of the hold, for the ``Relax_*`` tests.
+    """
+
+    passive: PASSIVE_STATES
+    strain: A1[np.float64]
+    time: A1[np.float64]
+    loading_tests: Sequence[str]
+    loading: _A2
+    relaxation_tests: Sequence[str]
+    relaxation: _A2
+    metrics: np.ndarray[tuple[int], np.dtype[np.void]]
+
+
+def _stack(
+    activated: SegmentedRecording,
+    passive: SegmentedRecording,
+    tests: Sequence[str],
+    grid: A1[np.float64],
+    curve: Callable[[SegmentedRecording, A1[np.float64]], A1[np.float64] | None],
+) -> tuple[list[str], _A2, _A2]:
+    """Sample the last cycle of every test on `grid` for both states, NaN where missing."""
+    found: list[str] = []
+    rows: list[tuple[A1[np.float64], A1[np.float64]]] = []
+    for test in tests:
+        match activated.last_cycle(test), passive.last_cycle(test):
+            case Ok(a), Ok(p):
+                pass
+            case _:
+                continue
+        a_curve, p_curve = curve(a, grid), curve(p, grid)
+        if a_curve is None or p_curve is None:
+            continue
+        found.append(test)
+        rows.append((a_curve, p_curve))
+    a_rows = np.array([r[0] for r in rows]).reshape(len(rows), len(grid))
+    p_rows = np.array([r[1] for r in rows]).reshape(len(rows), len(grid))
+    return found, a_rows, p_rows
+
+
+def _metrics(
+    tests: Sequence[str], activated: _A2, active: _A2
+) -> np.ndarray[tuple[int], np.dtype[np.void]]:
+    seen = np.isfinite(active)
+    count = seen.sum(axis=1)
+    metrics = np.empty(len(tests), dtype=ACTIVE_METRICS_DTYPE)
+    metrics["test"] = tests
+    # fmax ignores NaN without warning on rows that are all NaN.
+    metrics["peak"] = np.fmax.reduce(active, axis=1, initial=-np.inf, where=seen)
+    metrics["peak"][count == 0] = np.nan
+    metrics["mean"] = np.divide(
+        np.where(seen, active, 0.0).sum(axis=1),
+        count,
+        out=np.full(len(tests), np.nan),
+        where=count > 0,
+    )
+    peak_activated = np.fmax.reduce(activated, axis=1, initial=-np.inf, where=seen)
+    metrics["fraction"] = np.divide(
+        metrics["peak"],
+        peak_activated,
+        out=np.full(len(tests), np.nan),
+        where=(count > 0) & (peak_activated > 0),
+    )
+    return metrics
+
+
+def compute_active_force(
+    database: SpecimenData, *, points: int = 200, passive: PASSIVE_STATES = "deactivated"
+) -> Ok[ActiveForce] | Err:
+    """Subtract the `passive` state from the activated state for every rate at once.
+
+    Loading branches are aligned by strain, on a grid up to the strain of ``key.json``, and
+    relaxation holds by the time since the start of the hold on a log-spaced grid.
+    """
+    match get_last_valid(database, "activated"), get_last_valid(database, passive):
+        case Ok(df_a), Ok(df_p) if df_a is not None and df_p is not None:
+            activated = SegmentedRecording.from_df(df_a)
+            reference = SegmentedRecording.from_df(df_p)
+        case (Err(e), _) | (_, Err(e)):
+            return Err(e)
+        case _:
+            return Err(LookupError(f"{database.home} has no activated and {passive} data"))
+    match import_specimen_info(database.home / "key.json"):
+        case Ok(info):
+            strain = np.linspace(0.0, info["strain"], points)
+        case Err(e):
+            return Err(e)
+    time = np.geomspace(1e-2, 1e3, points)
+    tests = [t for t in activated.protocols if t in reference.protocols]
+    saw, a_load, p_load = _stack(
+        activated, reference, [t for t in tests if t.startswith("Saw_")], strain, loading_curve
+    )
+    relax, a_relax, p_relax = _stack(
+        activated, reference, [t for t in tests if t.startswith("Relax_")], time, relaxation_curve
+    )
+    loading, relaxation = a_load - p_load, a_relax - p_relax
+    metrics = np.concatenate((_metrics(saw, a_load, loading), _metrics(relax, a_relax, relaxation)))
+    return Ok(
+        ActiveForce(
+            passive=passive,
+            strain=strain,
+            time=time,
+            loading_tests=saw,
+            loading=loading,
+            relaxation_tests=relax,
+            relaxation=relaxation,
+            metrics=metrics,
+        ),
+    )
+
+
+def _sources(database: SpecimenData, passive: PASSIVE_STATES) -> A1[np.float64]:
+    """Modification times of the files an `ActiveForce` is computed from."""
+    key = database.home / "key.json"
+    mtimes: list[float] = [key.stat().st_mtime if key.exists() else 0.0]
+    for state in ("activated", passive):
+        files = database[state]
+        if files:
+            mtimes.append(files[max(files)].file.stat().st_mtime)
+    return np.array(mtimes, dtype=np.float64)
+
+
+def _save(fout: Path, active: ActiveForce, sources: A1[np.float64]) -> None:
+    np.savez(
+        fout,
+        sources=sources,
+        passive=np.array(active.passive),
+        strain=active.strain,
+        time=active.time,
+        loading_tests=np.array(active.loading_tests, dtype=str),
+        loading=active.loading,
+        relaxation_tests=np.array(active.relaxation_tests, dtype=str),
+        relaxation=active.relaxation,
+        metrics=active.metrics,
+    )
+
+
+def _load(
+    file: Path, sources: A1[np.float64], points: int, passive: PASSIVE_STATES
+) -> ActiveForce | None:
+    if not file.exists():
+        return None
+    try:
+        with np.load(file, allow_pickle=False) as f:
+            fresh = (
+                np.array_equal(f["sources"], sources)
+                and str(f["passive"]) == passive
+                and len(f["strain"]) == points
+            )
+            if not fresh:
+                return None
+            return ActiveForce(
+                passive=passive,
+                strain=f["strain"],
+                time=f["time"],
+                loading_tests=f["loading_tests"].tolist(),
+                loading=f["loading"],
+                relaxation_tests=f["relaxation_tests"].tolist(),
+                relaxation=f["relaxation"],
+                metrics=f["metrics"],
+            )
+    except OSError, ValueError, KeyError:
+        return None
+
+
+def active_force(
+    database: SpecimenData, *, points: int = 200, passive: PASSIVE_STATES = "deactivated"
+) -> Ok[ActiveForce] | Err:
+    """Return the `ActiveForce` of a specimen, cached in `ACTIVE_CACHE` in its folder.
+
+    The cache is recomputed when the filtered files it came from change, or for another
+    `points` or `passive` state.
+    """
+    file = database.home / ACTIVE_CACHE
+    sources = _sources(database, passive)
+    if (cached := _load(file, sources, points, passive)) is not None:
+        return Ok(cached)
+    match compute_active_force(database, points=points, passive=passive):
+        case Ok(active):
+            _save(file, active, sources)
+            return Ok(active)
+        case Err(e):
+            return Err(e)
@@ -0,0 +1,144 @@
+"""Aggregate the curves of many specimens into running means and standard deviations."""
+
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from pytools.result import Err, Ok
+from taad_smc.io.api import SegmentedRecording
+
+from ._tools import get_last_valid
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from pytools.arrays import A1
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.api import SpecimenData
+
+__all__ = [
+    "COHORT_STATES",
+    "CohortGrids",
+    "RunningStats",
+    "aggregate_specimens",
+    "loading_curve",
+    "relaxation_curve",
+]
+
+COHORT_STATES: tuple[Literal["initial", "activated", "deactivated"], ...] = (
+    "initial",
+    "activated",
+    "deactivated",
+)
+
+
+@dc.dataclass(slots=True)
+class RunningStats:
+    """Welford running mean and variance of curves sampled on the same grid.
+
+    NaN samples, where a curve does not cover the grid, are left out of that grid point.
+    """
+
+    count: A1[np.intp]
+    mean: A1[np.float64]
+    m2: A1[np.float64]
+
+    @classmethod
+    def empty(cls, points: int) -> RunningStats:
+        return cls(
+            count=np.zeros(points, dtype=np.intp),
+            mean=np.zeros(points, dtype=np.float64),
+            m2=np.zeros(points, dtype=np.float64),
+        )
+
+    def update(self, y: A1[np.float64]) -> None:
+        seen = np.isfinite(y)
+        self.count += seen
+        delta = np.where(seen, y - self.mean, 0.0)
+        self.mean += np.divide(delta, self.count, out=np.zeros_like(delta), where=seen)
+        self.m2 += np.where(seen, delta * (y - self.mean), 0.0)
+
+    @property
+    def sd(self) -> A1[np.float64]:
+        """Sample standard deviation, NaN where fewer than two curves were seen."""
+        return np.sqrt(
+            np.divide(
+                self.m2, self.count - 1, out=np.full_like(self.m2, np.nan), where=self.count > 1
+            )
+        )
+
+
+@dc.dataclass(slots=True, frozen=True)
+class CohortGrids:
+    """Strains of the loading curves and hold times of the relaxation curves."""
+
+    strain: A1[np.float64]
+    time: A1[np.float64]
+
+
+def loading_curve(cycle: SegmentedRecording, strain: A1[np.float64]) -> A1[np.float64] | None:
+    """Return the force of the first STRETCH run of `cycle` at `strain`, NaN outside of it."""
+    match cycle.segments(mode="STRETCH"):
+        case [branch, *_] if len(branch) > 1:
+            pass
+        case _:
+            return None
+    # Noise makes the branch slightly non-monotonic, which np.interp does not accept.
+    disp = np.maximum.accumulate(branch.disp)
+    return np.interp(strain, disp, branch.force, left=np.nan, right=np.nan)
+
+
+def relaxation_curve(cycle: SegmentedRecording, time: A1[np.float64]) -> A1[np.float64] | None:
+    """Return the force of the first HOLD run of `cycle` at `time` into it, on a log scale."""
+    match cycle.segments(mode="HOLD"):
+        case [hold, *_] if len(hold) > 2:
+            pass
+        case _:
+            return None
+    t = hold.time[1:] - hold.time[0]
+    return np.interp(np.log(time), np.log(t), hold.force[1:], left=np.nan, right=np.nan)
+
+
+def aggregate_specimens(
+    databases: Iterable[SpecimenData], grids: CohortGrids, *, log: ILogger
+) -> tuple[Mapping[tuple[str, str], RunningStats], int]:
+    """Accumulate the last cycle of every ``Saw_*`` and ``Relax_*`` test per state and test.
+
+    `databases` is consumed one specimen at a time, so a generator keeps a single specimen
+    in memory. Loading curves are sampled on ``grids.strain`` and the relaxation holds on
+    ``grids.time``; the keys are the activation state and the test name. The number of
+    specimens that added at least one curve is returned with the statistics.
+    """
+    stats: dict[tuple[str, str], RunningStats] = {}
+    specimens = 0
+    for database in databases:
+        added = False
+        for state in COHORT_STATES:
+            match get_last_valid(database, state):
+                case Ok(None):
+                    continue
+                case Ok(df):
+                    recording = SegmentedRecording.from_df(df)
+                case Err(e):
+                    log.warn(f"Skipping {state} of {database.home}: {e}")
+                    continue
+            tests = [*recording.protocols_matching("Saw"), *recording.protocols_matching("Relax")]
+            for test in (t for t in tests if t.startswith(("Saw_", "Relax_"))):
+                match recording.last_cycle(test):
+                    case Ok(cycle):
+                        pass
+                    case Err(e):
+                        log.debug(f"Skipping {test} of {database.home}/{state}: {e}")
+                        continue
+                if test.startswith("Saw_"):
+                    curve = loading_curve(cycle, grids.strain)
+                    points = len(grids.strain)
+                else:
+                    curve = relaxation_curve(cycle, grids.time)
+                    points = len(grids.time)
+                if curve is None:
+                    continue
+                stats.setdefault((state, test), RunningStats.empty(points)).update(curve)
+                added = True
+        specimens += added
+    return stats, specimens
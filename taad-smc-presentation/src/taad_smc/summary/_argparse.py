@@ -9,6 +9,12 @@ __all__ = ["parse_arguments"]
 
 _parser = argparse.ArgumentParser("summary", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 _parser.add_argument("folders", type=str, nargs="+", help="Input data folders")
+_parser.add_argument(
+    "--cohort",
+    action="store_true",
+    help="Treat the folders as cohorts and plot the mean ± SD of every species and axis.",
+)
+_parser.add_argument("--points", type=int, help="Grid points of the cohort curves, with --cohort.")
 _parser.add_argument(
     "--log",
     type=str.upper,
@@ -20,8 +26,12 @@ _parser.add_argument(
 @dc.dataclass(slots=True)
 class ParsedArguments:
     folders: list[str]
+    cohort: bool
+    points: int
     log: LOG_LEVEL
 
 
 def parse_arguments(args: list[str] | None = None) -> ParsedArguments:
-    return _parser.parse_args(args=args, namespace=ParsedArguments([], "INFO"))
+    return _parser.parse_args(
+        args=args, namespace=ParsedArguments([], cohort=False, points=200, log="INFO")
+    )
@@ -0,0 +1,182 @@
+"""Summarize a cohort with the mean and standard deviation of every species and axis."""
+
+from typing import TYPE_CHECKING, Unpack
+
+import numpy as np
+import pandas as pd
+from pytools.plotting.trait import PlotKwargs
+from pytools.result import Err, Ok
+from taad_smc.catalog.api import open_catalog
+from taad_smc.io.api import import_specimen_info
+
+from ._active import active_force
+from ._aggregate import CohortGrids, aggregate_specimens
+from ._initialization import import_datafiles
+from ._plotting import band_on_axis, create_legend_on_axis, create_ppgrid, save_and_close_fig
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from pathlib import Path
+
+    from matplotlib.axes import Axes
+    from pytools.logging.trait import ILogger
+    from taad_smc.io.api import SpecimenData
+
+    from ._aggregate import RunningStats
+
+_RATES = ("Fast", "Mid", "Slow")
+_RATE_STYLES = {"Fast": "-", "Mid": "--", "Slow": ":"}
+_STRAIN_COLORS = {"30": "k", "20": "g", "10": "orange"}
+_ACTIVATION_COLORS = {"initial": "k", "activated": "r", "deactivated": "b"}
+
+
+def _panel(
+    ax: Axes,
+    x: np.ndarray[tuple[int], np.dtype[np.float64]],
+    stats: Mapping[tuple[str, str], RunningStats],
+    curves: Mapping[tuple[str, str], tuple[str, str]],
+    *,
+    logx: bool = False,
+    **kwargs: Unpack[PlotKwargs],
+) -> None:
+    """Plot the `curves` present in `stats`, each key mapped to its color and line style."""
+    present = [k for k in curves if k in stats]
+    band_on_axis(
+        x,
+        [stats[k] for k in present],
+        ax,
+        colors=[curves[k][0] for k in present],
+        linestyles=[curves[k][1] for k in present],
+        logx=logx,
+        **PlotKwargs(xlabel="Time [s]" if logx else "Strain [-]", ylabel="Force [mN]") | kwargs,
+    )
+
+
+def plot_group(
+    stats: Mapping[tuple[str, str], RunningStats], grids: CohortGrids, *, title: str, fout: Path
+) -> None:
+    """Draw the group means of `aggregate_specimens` on the panels of the specimen summary."""
+    fig, axes = create_ppgrid(title=title)
+    create_legend_on_axis(axes[0][0])
+    axes[1][0].axis("off")
+    axes[2][0].axis("off")
+    _panel(
+        axes[0][1],
+        grids.strain,
+        stats,
+        {("initial", f"Saw_Fast_{r}"): (c, "-") for r, c in _STRAIN_COLORS.items()},
+        title="Cycling - Strain Level",
+    )
+    _panel(
+        axes[0][2],
+        grids.strain,
+        stats,
+        {("initial", f"Saw_{s}_30"): ("k", _RATE_STYLES[s]) for s in _RATES},
+        title="Cycling - Rate Dependence",
+    )
+    _panel(
+        axes[0][3],
+        grids.time,
+        stats,
+        {("initial", f"Relax_{s}"): ("k", _RATE_STYLES[s]) for s in _RATES},
+        logx=True,
+        title="Relaxation",
+    )
+    for i, s in enumerate(_RATES):
+        _panel(
+            axes[1][i + 1],
+            grids.strain,
+            stats,
+            {(k, f"Saw_{s}_30"): (c, _RATE_STYLES[s]) for k, c in _ACTIVATION_COLORS.items()},
+            title=f"Cycling w/ activation - {s}",
+        )
+        _panel(
+            axes[2][i + 1],
+            grids.time,
+            stats,
+            {(k, f"Relax_{s}"): (c, _RATE_STYLES[s]) for k, c in _ACTIVATION_COLORS.items()},
+            logx=True,
+            title=f"Relaxation w/ activation - {s}",
+        )
+    save_and_close_fig(fig, fout, dpi=300)
+
+
+def _stream_specimens(
+    homes: Sequence[Path], active: list[pd.DataFrame], *, points: int, log: ILogger
+) -> Iterator[SpecimenData]:
+    """Yield every specimen, then add its active force metrics to `active`."""
+    for home in homes:
+        match import_datafiles(home):
+            case Ok(database):
+                yield database
+            case Err(e):
+                log.warn(f"Skipping {home}: {e}")
+                continue
+        # The filtered files are still loaded from the aggregation of this specimen.
+        match active_force(database, points=points):
+            case Ok(result):
+                df = pd.DataFrame(result.metrics)
+                df.insert(0, "specimen", home.name)
+                df.insert(1, "passive", result.passive)
+                active.append(df)
+            case Err(e):
+                log.debug(f"No active force for {home}: {e}")
+
+
+def _max_strain(homes: Sequence[Path]) -> float:
+    strain = 0.0
+    for home in homes:
+        match import_specimen_info(home / "key.json"):
+            case Ok(info):
+                strain = max(strain, info["strain"])
+            case Err():
+                continue
+    return strain or 1.0
+
+
+def summarize_cohort(cohort: Path, *, points: int, log: ILogger) -> Ok[Sequence[Path]] | Err:
+    """Plot the mean and standard deviation of every species and axis of `cohort`.
+
+    Specimens are read one at a time while their curves are accumulated, and one figure is
+    written to ``summary_<species>_<axis>.png`` in `cohort` per group. The active force
+    metrics of every specimen, see `active_force`, go to ``active_force.csv``.
+    """
+    match open_catalog(cohort, log=log):
+        case Ok(catalog):
+            pass
+        case Err(e):
+            return Err(e)
+    groups = dict.fromkeys(zip(catalog.table["species"], catalog.table["axis"], strict=True))
+    figures: list[Path] = []
+    active: list[pd.DataFrame] = []
+    for species, axis in groups:
+        homes = catalog.select(species=species, axis=axis).specimen_paths()
+        # The strain grid reaches the largest strain of the group, read from key.json alone;
+        # grid points a curve does not reach are left out of its statistics.
+        grids = CohortGrids(
+            strain=np.linspace(0.0, _max_strain(homes), points),
+            time=np.geomspace(1e-2, 1e3, points),
+        )
+        log.info(f"Aggregating {len(homes)} {species} {axis} specimens")
+        specimens = _stream_specimens(homes, active, points=points, log=log)
+        stats, n = aggregate_specimens(specimens, grids, log=log)
+        if not stats:
+            log.warn(f"No curves found for {species} {axis}, skipping ...")
+            continue
+        fout = cohort / f"summary_{species}_{axis}.png"
+        plot_group(
+            stats,
+            grids,
+            title=f"TAAD-SMC {species} {axis} - {cohort.name}. Mean ± SD (n = {n})",
+            fout=fout,
+        )
+        log.brief(f"Saved {species} {axis} summary to: {fout}")
+        figures.append(fout)
+    if not figures:
+        return Err(LookupError(f"No curves found in {cohort}"))
+    if active:
+        fout = cohort / "active_force.csv"
+        pd.concat(active, ignore_index=True).to_csv(fout, index=False)
+        log.brief(f"Saved active force metrics to: {fout}")
+        figures.append(fout)
+    return Ok(figures)
@@ -1,7 +1,13 @@
 from typing import TYPE_CHECKING
 
 from pytools.result import Err, Ok
-from taad_smc.io.api import CachableData, SpecimenData, check_for_files, find_data_subdirectories
+from taad_smc.io.api import (
+    CachableData,
+    SpecimenData,
+    check_for_files,
+    find_data_subdirectories,
+    frame_cache_dir,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -20,7 +26,7 @@ def import_datafiles(
             data = SpecimenData(
                 home,
                 {
-                    p: {k: CachableData(f) for k, f in files.items()}
+                    p: {k: CachableData(f, cache=frame_cache_dir(f)) for k, f in files.items()}
                     for p, files in datafiles.items()
                 },
             )
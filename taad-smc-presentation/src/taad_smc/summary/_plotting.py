@@ -14,6 +14,7 @@ from pytools.plotting.api import (
     update_figure_setting,
 )
 from pytools.plotting.trait import BarPlotKwargs, PlotKwargs
+from taad_smc.decimate.api import decimate_for_axis, decimate_for_logx_axis
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping, Sequence
@@ -21,7 +22,9 @@ if TYPE_CHECKING:
 
     from matplotlib.axes import Axes
     from matplotlib.figure import Figure
+    from pytools.arrays import A1
 
+    from ._aggregate import RunningStats
     from ._types import PlotData
 
 
@@ -59,7 +62,7 @@ def semilogx_on_axis[T: np.number](
     update_axis_setting(ax, **kwargs)
     style = style_kwargs(**kwargs)
     for d in data:
-        ax.semilogx(d.x, d.y, **style)
+        ax.semilogx(*decimate_for_logx_axis(ax, d.x, d.y), **style)
     curve_labels = kwargs.get("curve_labels")
     if curve_labels is not None:
         ax.legend(curve_labels, **legend_kwargs(**kwargs))
@@ -73,12 +76,34 @@ def plotxy_on_axis[T: np.number](
     update_axis_setting(ax, **kwargs)
     style = style_kwargs(**kwargs)
     for d in data:
-        ax.plot(d.x, d.y, **style)
+        ax.plot(*decimate_for_axis(ax, d.x, d.y), **style)
     curve_labels = kwargs.get("curve_labels")
     if curve_labels is not None:
         ax.legend(curve_labels, **legend_kwargs(**kwargs))
 
 
+def band_on_axis(
+    x: A1[np.float64],
+    data: Iterable[RunningStats],
+    ax: Axes,
+    *,
+    colors: Sequence[str],
+    linestyles: Sequence[str],
+    logx: bool = False,
+    **kwargs: Unpack[PlotKwargs],
+) -> None:
+    """Plot the mean of every `RunningStats` with a band of one standard deviation."""
+    update_axis_setting(ax, **kwargs)
+    for d, color, ls in zip(data, colors, linestyles, strict=True):
+        seen = d.count > 0
+        line = ax.semilogx if logx else ax.plot
+        line(x[seen], d.mean[seen], color=color, linestyle=ls, linewidth=1)
+        sd = d.sd[seen]
+        ax.fill_between(
+            x[seen], d.mean[seen] - sd, d.mean[seen] + sd, color=color, alpha=0.2, linewidth=0
+        )
+
+
 def grouped_bar_on_axis(
     data: Mapping[str, Mapping[str, float]],
     ax: Axes,
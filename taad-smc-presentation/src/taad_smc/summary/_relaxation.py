@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Literal, Unpack
 import numpy as np
 from pytools.plotting.trait import PlotKwargs
 from pytools.result import Err, Ok
+from taad_smc.decimate.api import resample_logspace
 
 from ._plotting import semilogx_on_axis
 from ._tools import get_last_valid
@@ -73,10 +74,9 @@ def convert_plot_data_time(
 ) -> PlotData[np.float64]:
     time = data[["time"]].to_numpy(dtype=np.float64).flatten()
     time = time - time.min()
-    return PlotData(
-        x=time,
-        y=data[["force"]].to_numpy(dtype=np.float64).flatten(),
-    )
+    force = data[["force"]].to_numpy(dtype=np.float64).flatten()
+    time, force = resample_logspace(time, force)
+    return PlotData(x=time, y=force)
 
 
 def _create_plot_data(
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 from pytools.result import Err, Ok
+from taad_smc.io.api import import_pyramid
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -25,20 +26,30 @@ def get_last_valid(database: SpecimenData, key: PROTOCOL_NAMES) -> Ok[pd.DataFra
 def _search_for_ylim_i(
     database: SpecimenData, key: PROTOCOL_NAMES
 ) -> Ok[tuple[float, float] | None] | Err:
-    match get_last_valid(database, key):
-        case Err(e):
-            return Err(e)
-        case Ok(data):
-            pass
-    if data is None:
-        return Ok(None)
-    proper = ~(
-        data["protocol"].str.contains("start", case=False)
-        | data["protocol"].str.contains("end", case=False)
-    )
-    data = data[proper]
-    min_force = data["force"].min()
-    max_force = data["force"].max()
+    match database[key]:
+        case None:
+            return Ok(None)
+        case datafiles:
+            file = datafiles[max(datafiles.keys())].file
+    # The pyramid written by the filter gives the limits without reading the recording.
+    match import_pyramid(file):
+        case Ok(pyramid):
+            min_force, max_force = pyramid.limits("force", exclude=("start", "end"))
+        case Err():
+            match get_last_valid(database, key):
+                case Err(e):
+                    return Err(e)
+                case Ok(data):
+                    pass
+            if data is None:
+                return Ok(None)
+            proper = ~(
+                data["protocol"].str.contains("start", case=False)
+                | data["protocol"].str.contains("end", case=False)
+            )
+            data = data[proper]
+            min_force = data["force"].min()
+            max_force = data["force"].max()
     padding = (max_force - min_force) * 0.03
     return Ok((min_force - padding, max_force + padding))
 